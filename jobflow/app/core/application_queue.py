@@ -6,8 +6,12 @@ updating job data from new discoveries.
 """
 
 import csv
+import functools
 import hashlib
+import io
+from operator import itemgetter
 from pathlib import Path
+from typing import TypedDict
 
 
 # Exact column order for queue CSV
@@ -27,8 +31,51 @@ QUEUE_COLUMNS = [
     "missing_keywords",
 ]
 
+_QUEUE_COLUMN_SET = frozenset(QUEUE_COLUMNS)
 
-def build_queue_rows(apply_pack: dict) -> list[dict]:
+
+class QueueRow(TypedDict):
+    """
+    Structure of a queue row (keys in QUEUE_COLUMNS order).
+
+    Rows stay plain dicts so they round-trip through csv and merge_queue
+    unchanged; rank and score are ints from build_queue_rows() but strings
+    once read back from CSV.
+    """
+    job_fingerprint: str
+    rank: int | str
+    score: float | str
+    decision: str
+    company: str
+    job_title: str
+    location: str
+    apply_url: str
+    source: str
+    status: str
+    notes: str
+    matched_keywords: str
+    missing_keywords: str
+
+# Status given to jobs no human has acted on yet
+_DEFAULT_STATUS = "queued"
+
+# Sort position for rows without a usable rank
+_UNRANKED = 999999
+
+# Projects a complete row dict onto QUEUE_COLUMNS order in one C call
+_queue_row_values = itemgetter(*QUEUE_COLUMNS)
+
+# Blank value for every column; partial rows are laid over it before projection
+_EMPTY_QUEUE_ROW = dict.fromkeys(QUEUE_COLUMNS, "")
+
+# Joins keyword lists into a single CSV cell
+_join_keywords = "; ".join
+
+# Parent directories write_queue_csv has already created this process
+_created_dirs: set[Path] = set()
+
+
+def build_queue_rows(apply_pack: dict) -> list[QueueRow]:
     """
     Build queue rows from apply pack applications.
 
@@ -49,40 +96,41 @@ def build_queue_rows(apply_pack: dict) -> list[dict]:
     queue_rows = []
 
     for app in applications:
+        get = app.get
+        apply_url = get("apply_url", "")
+        company = get("company", "")
+        job_title = get("job_title", "")
+
         # Get or generate fingerprint
-        fingerprint = app.get("job_fingerprint", "")
+        fingerprint = get("job_fingerprint", "")
         if not fingerprint:
             # Generate stable hash from key fields
-            fingerprint = _generate_fingerprint(
-                app.get("apply_url", ""),
-                app.get("company", ""),
-                app.get("job_title", ""),
-            )
+            fingerprint = _generate_fingerprint(apply_url, company, job_title)
 
-        row = {
+        row: QueueRow = {
             "job_fingerprint": fingerprint,
-            "rank": app.get("rank", ""),
-            "score": app.get("score", ""),
-            "decision": app.get("decision", ""),
-            "company": app.get("company", ""),
-            "job_title": app.get("job_title", ""),
-            "location": app.get("location", ""),
-            "apply_url": app.get("apply_url", ""),
-            "source": app.get("source", ""),
-            "status": "queued",  # Default status
+            "rank": get("rank", ""),
+            "score": get("score", ""),
+            "decision": get("decision", ""),
+            "company": company,
+            "job_title": job_title,
+            "location": get("location", ""),
+            "apply_url": apply_url,
+            "source": get("source", ""),
+            "status": _DEFAULT_STATUS,
             "notes": "",  # Default notes
-            "matched_keywords": "; ".join(app.get("matched_keywords", [])),
-            "missing_keywords": "; ".join(app.get("missing_keywords", [])),
+            "matched_keywords": _join_keywords(get("matched_keywords") or ()),
+            "missing_keywords": _join_keywords(get("missing_keywords") or ()),
         }
         queue_rows.append(row)
 
-    # Sort by rank for stable ordering
-    queue_rows.sort(key=lambda r: (r.get("rank") or 0))
+    # Sort by rank for stable ordering (rows without a rank first)
+    queue_rows.sort(key=lambda r: _rank_value(r["rank"]))
 
     return queue_rows
 
 
-def read_queue_csv(path: str) -> list[dict]:
+def read_queue_csv(path: str) -> list[QueueRow]:
     """
     Read existing queue CSV.
 
@@ -105,19 +153,40 @@ def read_queue_csv(path: str) -> list[dict]:
     rows = []
 
     with open(queue_path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+
+        # Resolve each queue column to its position once (None if absent);
+        # like DictReader, a repeated header name maps to its last position
+        positions = {name: i for i, name in enumerate(header)}
+        index = [positions.get(col) for col in QUEUE_COLUMNS]
+        width = len(header)
+        project = itemgetter(*index) if None not in index else None
 
         for row in reader:
+            if not row:
+                continue  # DictReader skips blank lines
+
+            if project is not None and len(row) >= width:
+                rows.append(dict(zip(QUEUE_COLUMNS, project(row))))
+                continue
+
             # Keep only columns we care about, use defaults for missing
-            normalized_row = {
-                col: row.get(col, "") for col in QUEUE_COLUMNS
-            }
-            rows.append(normalized_row)
+            # (header columns past the end of a short row read as None,
+            # matching DictReader's restval)
+            rows.append({
+                col: "" if i is None else (row[i] if i < len(row) else None)
+                for col, i in zip(QUEUE_COLUMNS, index)
+            })
 
     return rows
 
 
-def merge_queue(existing_rows: list[dict], new_rows: list[dict]) -> list[dict]:
+def merge_queue(
+    existing_rows: list[QueueRow], new_rows: list[QueueRow]
+) -> list[QueueRow]:
     """
     Merge existing queue with new job data.
 
@@ -153,37 +222,101 @@ def merge_queue(existing_rows: list[dict], new_rows: list[dict]) -> list[dict]:
 
     # Process new rows
     for new_row in new_rows:
-        fingerprint = new_row["job_fingerprint"]
-
-        if fingerprint in existing_map:
-            # Job exists - merge with preservation
-            existing = existing_map[fingerprint]
-
-            merged = {**new_row}  # Start with new data
-            # Preserve human-edited fields
-            merged["status"] = existing.get("status", "queued")
-            merged["notes"] = existing.get("notes", "")
-
-            merged_rows.append(merged)
-            # Mark as processed
-            existing_map[fingerprint] = None
+        # Popping marks the existing row as processed
+        existing = existing_map.pop(new_row["job_fingerprint"], None)
+
+        if existing is not None:
+            # Job exists - start with new data, preserve human-edited fields
+            merged_rows.append({
+                **new_row,
+                "status": existing.get("status", _DEFAULT_STATUS),
+                "notes": existing.get("notes", ""),
+            })
         else:
             # New job - use as is (already has defaults)
             merged_rows.append(new_row)
 
     # Add any existing jobs that weren't in new_rows (removed from results)
     # Keep them to preserve human work
-    for fingerprint, existing in existing_map.items():
-        if existing is not None:  # Not marked as processed
-            merged_rows.append(existing)
+    merged_rows.extend(existing_map.values())
 
     # Sort for deterministic output: rank ascending, then fingerprint
-    merged_rows.sort(key=lambda r: (r.get("rank") or 999999, r.get("job_fingerprint", "")))
+    merged_rows.sort(key=_queue_sort_key)
 
     return merged_rows
 
 
-def write_queue_csv(rows: list[dict], path: str) -> None:
+def merge_queue_files(paths: list[str], out_path: str) -> list[QueueRow]:
+    """
+    Merge several queue CSVs into one.
+
+    Args:
+        paths: Queue CSV paths, oldest first
+        out_path: Output CSV path
+
+    Returns:
+        Merged queue rows as written, sorted like merge_queue()
+
+    Merge Rules:
+        - Primary key: job_fingerprint (rows without one are dropped)
+        - status and notes: latest non-default value across paths; an older
+          edit is kept only where a newer copy still has the default
+          ("queued" status, empty notes)
+        - All other fields: taken from the last path containing the job
+
+    Notes:
+        - Missing paths read as empty queues
+        - Each file is folded into a single fingerprint map as it is read,
+          rather than re-merging the growing queue pairwise per file
+    """
+    merged: dict[str, QueueRow] = {}
+
+    for path in paths:
+        for row in read_queue_csv(path):
+            fingerprint = row["job_fingerprint"]
+            if not fingerprint:
+                continue
+
+            previous = merged.get(fingerprint)
+            if previous is not None:
+                # Newer human edits win; fall back to older ones over defaults
+                if not row["status"] or row["status"] == _DEFAULT_STATUS:
+                    row["status"] = previous["status"]
+                if not row["notes"]:
+                    row["notes"] = previous["notes"]
+
+            merged[fingerprint] = row
+
+    rows = sorted(merged.values(), key=_queue_sort_key)
+    for row in rows:
+        row["status"] = row["status"] or _DEFAULT_STATUS
+        row["notes"] = row["notes"] or ""
+
+    write_queue_csv(rows, out_path)
+    return rows
+
+
+def _queue_sort_key(row: dict) -> tuple[int, str]:
+    """
+    Sort key (rank, job_fingerprint) for merged queue rows.
+
+    Ranks are ints on rows from build_queue_rows() but strings on rows read
+    back from CSV, so both are compared as integers. Missing, zero or
+    non-numeric ranks sort last.
+    """
+    rank = _rank_value(row.get("rank")) or _UNRANKED
+    return (rank, row.get("job_fingerprint", ""))
+
+
+def _rank_value(rank) -> int:
+    """Coerce an int or numeric-string rank to int (0 if missing or invalid)."""
+    try:
+        return int(rank or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def write_queue_csv(rows: list[dict], path: str) -> bool:
     """
     Write queue rows to CSV.
 
@@ -191,20 +324,90 @@ def write_queue_csv(rows: list[dict], path: str) -> None:
         rows: Queue rows to write
         path: Output CSV path
 
+    Returns:
+        True if the file was written, False if it already held exactly
+        this content (e.g. a rerun where nothing changed)
+
     Notes:
-        - Creates parent directories if needed
+        - Creates parent directories if needed (once per directory per
+          process; recreated if removed in between)
         - Writes columns in QUEUE_COLUMNS order
-        - Uses newline="" for proper CSV formatting
+        - Writes csv's CRLF line endings verbatim on every platform
+        - Same output and errors as csv.DictWriter: missing columns are
+          written empty, unknown columns raise ValueError
+        - Rows are serialized in memory and written with a single call, so
+          an invalid row leaves any existing file untouched
+        - An unchanged queue is not rewritten, so its mtime stays stable
+          for sync tools watching the output directory
     """
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(QUEUE_COLUMNS)
+    writer.writerows(_iter_queue_values(rows))
+
+    data = buf.getvalue().encode("utf-8")
     output_path = Path(path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if _file_has_content(output_path, data):
+        return False
+
+    _ensure_parent_dir(output_path)
+    try:
+        output_path.write_bytes(data)
+    except FileNotFoundError:
+        # Directory was removed (or cwd changed) since it was cached
+        _created_dirs.discard(output_path.parent)
+        _ensure_parent_dir(output_path)
+        output_path.write_bytes(data)
+    return True
+
+
+def _file_has_content(path: Path, data: bytes) -> bool:
+    """Check whether path already holds exactly data (size compared first)."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def clear_dir_cache() -> None:
+    """Forget which queue directories exist (e.g. between tests)."""
+    _created_dirs.clear()
+
 
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=QUEUE_COLUMNS)
-        writer.writeheader()
-        writer.writerows(rows)
+def _ensure_parent_dir(path: Path) -> None:
+    """Create path's parent directory unless this process already did."""
+    parent = path.parent
+    if parent not in _created_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(parent)
+
+
+def _iter_queue_values(rows: list[dict]):
+    """
+    Yield each row's values in QUEUE_COLUMNS order.
+
+    Rows with exactly the queue columns (everything build_queue_rows,
+    read_queue_csv and merge_queue produce) are projected directly; partial
+    rows are first laid over blank defaults, so every row goes through the
+    same itemgetter.
+    """
+    for row in rows:
+        if row.keys() == _QUEUE_COLUMN_SET:
+            yield _queue_row_values(row)
+            continue
+
+        extra = row.keys() - _QUEUE_COLUMN_SET
+        if extra:
+            raise ValueError(
+                "dict contains fields not in fieldnames: "
+                + ", ".join(repr(key) for key in extra)
+            )
+        yield _queue_row_values({**_EMPTY_QUEUE_ROW, **row})
 
 
+@functools.lru_cache(maxsize=8192)
 def _generate_fingerprint(apply_url: str, company: str, job_title: str) -> str:
     """
     Generate stable fingerprint from key job fields.
@@ -221,12 +424,14 @@ def _generate_fingerprint(apply_url: str, company: str, job_title: str) -> str:
         - Used as fallback when job_fingerprint not provided
         - Deterministic: same inputs always produce same hash
         - Short format for readability
+        - Memoized, since the same postings recur across reruns and
+          candidates
     """
     # Combine fields with delimiter
     content = f"{apply_url}|{company}|{job_title}"
 
-    # Generate SHA256 hash
-    hash_obj = hashlib.sha256(content.encode("utf-8"))
+    # Generate SHA256 hash (an identifier, not a security boundary)
+    hash_obj = hashlib.sha256(content.encode("utf-8"), usedforsecurity=False)
 
     # Return first 16 chars for brevity
     return hash_obj.hexdigest()[:16]
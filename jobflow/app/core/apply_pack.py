@@ -5,7 +5,9 @@ Transforms job discovery results into structured application packets
 ready for candidate review and submission.
 """
 
-from jobflow.app.core.url_policy import evaluate_apply_url
+import heapq
+
+from jobflow.app.core.url_policy import evaluate_apply_url, normalize_company_domains
 
 
 def build_apply_pack(
@@ -52,37 +54,41 @@ def build_apply_pack(
     # Build applications list from matches or jobs
     applications = []
 
-    # Track URL policy counts
-    url_allowed = 0
-    url_manual_review = 0
-    url_blocked = 0
+    # Normalize company domains once for all URLs
+    company_domains = normalize_company_domains(company_domains)
+
+    # Track URL policy counts and the review flag while building, so the
+    # applications are not traversed again afterwards
+    url_review_summary = {"allowed": 0, "manual_review": 0, "blocked": 0}
+    needs_manual_review = False
 
     if "matches" in discovery_result and discovery_result["matches"]:
         # Use matches (scored and ranked)
         matches = discovery_result["matches"]
 
-        # Sort by score descending, then by job_title for stable tie-breaking
-        sorted_matches = sorted(
+        # Top N by score descending, then by job_title for stable tie-breaking
+        # (nsmallest is O(n log top_n) and equal to sorted(...)[:top_n])
+        top_matches = heapq.nsmallest(
+            top_n,
             matches,
             key=lambda m: (-m.get("overall_score", 0), m.get("job_title", "")),
         )
 
-        # Take top N
-        top_matches = sorted_matches[:top_n]
-
         for rank, match in enumerate(top_matches, start=1):
             apply_url = match.get("job_url", "")
 
             # Evaluate URL policy
-            url_eval = evaluate_apply_url(apply_url, company_domains)
+            url_eval = evaluate_apply_url(apply_url, company_domains, normalized=True)
 
             # Track counts
-            if url_eval["url_policy"] == "allowed":
-                url_allowed += 1
-            elif url_eval["url_policy"] == "manual_review":
-                url_manual_review += 1
-            elif url_eval["url_policy"] == "blocked":
-                url_blocked += 1
+            url_review_summary[url_eval["url_policy"]] += 1
+
+            # Weak decision OR unknown URL domain needs manual review
+            if (
+                match.get("decision", "") != "strong_fit"
+                or url_eval["url_policy"] == "manual_review"
+            ):
+                needs_manual_review = True
 
             app = {
                 "rank": rank,
@@ -110,25 +116,20 @@ def build_apply_pack(
         # Fall back to jobs (no scoring)
         jobs = discovery_result["jobs"]
 
-        # Sort by title for stable ordering
-        sorted_jobs = sorted(jobs, key=lambda j: j.get("title", ""))
-
-        # Take top N
-        top_jobs = sorted_jobs[:top_n]
+        # Top N by title for stable ordering
+        top_jobs = heapq.nsmallest(top_n, jobs, key=lambda j: j.get("title", ""))
 
         for rank, job in enumerate(top_jobs, start=1):
             apply_url = job.get("url", "")
 
             # Evaluate URL policy
-            url_eval = evaluate_apply_url(apply_url, company_domains)
+            url_eval = evaluate_apply_url(apply_url, company_domains, normalized=True)
 
             # Track counts
-            if url_eval["url_policy"] == "allowed":
-                url_allowed += 1
-            elif url_eval["url_policy"] == "manual_review":
-                url_manual_review += 1
-            elif url_eval["url_policy"] == "blocked":
-                url_blocked += 1
+            url_review_summary[url_eval["url_policy"]] += 1
+
+            # Unscored jobs have no strong_fit decision, so always need review
+            needs_manual_review = True
 
             app = {
                 "rank": rank,
@@ -160,13 +161,6 @@ def build_apply_pack(
     raw_data = discovery_result.get("raw", {})
     has_resume = bool(raw_data.get("resume_path") or raw_data.get("resume_text_excerpt"))
 
-    # Check if any top applications need manual review
-    # (either weak decision OR unknown URL domain)
-    needs_manual_review = any(
-        app.get("decision") != "strong_fit" or app.get("url_policy") == "manual_review"
-        for app in applications
-    )
-
     checklist = {
         "has_email": has_email,
         "has_phone": has_phone,
@@ -176,13 +170,6 @@ def build_apply_pack(
         "needs_manual_review": needs_manual_review,
     }
 
-    # Build URL review summary
-    url_review_summary = {
-        "allowed": url_allowed,
-        "manual_review": url_manual_review,
-        "blocked": url_blocked,
-    }
-
     # Build final pack
     pack = {
         "candidate": candidate_safe,
@@ -5,28 +5,58 @@ Writes submission-ready application packs to disk in multiple formats.
 """
 
 import csv
-import json
+import io
 from pathlib import Path
 
-
-def write_apply_pack_json(pack: dict, path: str) -> None:
+from jobflow.app.util.jsonio import write_json_file
+
+
+# CSV columns, in order (values come from _iter_csv_values)
+_CSV_COLUMNS = (
+    "rank",
+    "score",
+    "decision",
+    "company",
+    "job_title",
+    "location",
+    "apply_url",
+    "source",
+    "url_policy",
+    "url_reason",
+    "reasons",
+    "matched_keywords",
+    "missing_keywords",
+)
+
+# Joins list fields into a single CSV cell
+_join_list = "; ".join
+
+
+def write_apply_pack_json(
+    pack: dict, path: str, compress: bool = False, indent: bool = True
+) -> int:
     """
     Write apply pack to JSON file.
 
     Args:
         pack: Apply pack dictionary from build_apply_pack()
         path: Output file path (will be created/overwritten)
+        compress: Write gzip-compressed JSON (default False)
+        indent: Pretty-print JSON (default True; False writes compact JSON)
+
+    Returns:
+        Number of bytes written
 
     Notes:
         - Creates parent directories if needed
-        - Pretty-printed JSON with 2-space indent
+        - Pretty-printed JSON with 2-space indent unless indent=False
         - Sorted keys for stable output
+        - Serialized with orjson when installed and written in one call
     """
     output_path = Path(path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(pack, f, indent=2, sort_keys=True, ensure_ascii=False)
+    return write_json_file(pack, output_path, compress=compress, indent=indent)
 
 
 def write_apply_pack_csv(pack: dict, path: str) -> None:
@@ -45,48 +75,35 @@ def write_apply_pack_csv(pack: dict, path: str) -> None:
         - Creates parent directories if needed
         - List fields (reasons, keywords) are joined with semicolons
         - Empty applications list creates CSV with headers only
+        - Rows are serialized in memory and written with a single call
     """
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(_CSV_COLUMNS)
+    writer.writerows(_iter_csv_values(pack.get("applications", [])))
+
     output_path = Path(path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    applications = pack.get("applications", [])
-
-    # Define CSV columns
-    fieldnames = [
-        "rank",
-        "score",
-        "decision",
-        "company",
-        "job_title",
-        "location",
-        "apply_url",
-        "source",
-        "url_policy",
-        "url_reason",
-        "reasons",
-        "matched_keywords",
-        "missing_keywords",
-    ]
-
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for app in applications:
+    output_path.write_text(buf.getvalue(), encoding="utf-8", newline="")
+
+
+def _iter_csv_values(applications: list[dict]):
+    """Yield each application's CSV values in _CSV_COLUMNS order."""
+    for app in applications:
+        get = app.get
+        yield (
+            get("rank", ""),
+            get("score", ""),
+            get("decision", ""),
+            get("company", ""),
+            get("job_title", ""),
+            get("location", ""),
+            get("apply_url", ""),
+            get("source", ""),
+            get("url_policy", ""),
+            get("url_reason", ""),
             # Convert list fields to semicolon-separated strings
-            row = {
-                "rank": app.get("rank", ""),
-                "score": app.get("score", ""),
-                "decision": app.get("decision", ""),
-                "company": app.get("company", ""),
-                "job_title": app.get("job_title", ""),
-                "location": app.get("location", ""),
-                "apply_url": app.get("apply_url", ""),
-                "source": app.get("source", ""),
-                "url_policy": app.get("url_policy", ""),
-                "url_reason": app.get("url_reason", ""),
-                "reasons": "; ".join(app.get("reasons", [])),
-                "matched_keywords": "; ".join(app.get("matched_keywords", [])),
-                "missing_keywords": "; ".join(app.get("missing_keywords", [])),
-            }
-            writer.writerow(row)
+            _join_list(get("reasons") or ()),
+            _join_list(get("matched_keywords") or ()),
+            _join_list(get("missing_keywords") or ()),
+        )
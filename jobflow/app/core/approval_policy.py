@@ -167,6 +167,50 @@ def get_policy_failure_reason(plan: dict) -> str:
     if not isinstance(plan, dict):
         return "Plan is not a valid dictionary"
 
+    reasons = _collect_policy_failures(plan)
+
+    if not reasons:
+        return "Plan passed all policies (unexpected - should not be called)"
+
+    return " | ".join(reasons)
+
+
+def evaluate_policy_with_reason(plan: dict) -> tuple[bool, str]:
+    """
+    Evaluate policies and explain the outcome in a single pass.
+
+    Equivalent to calling evaluate_policy() followed by
+    get_policy_failure_reason() on failure, but walks the plan only once.
+
+    Args:
+        plan: The execution plan to evaluate
+
+    Returns:
+        Tuple of (approved: bool, reason: str)
+            - (True, "Auto-approved by policy") if ALL policies pass
+            - (False, failure reason) otherwise
+    """
+    if not isinstance(plan, dict):
+        return False, "Plan is not a valid dictionary"
+
+    reasons = _collect_policy_failures(plan)
+
+    if not reasons:
+        return True, "Auto-approved by policy"
+
+    return False, " | ".join(reasons)
+
+
+def _collect_policy_failures(plan: dict) -> list[str]:
+    """
+    Check every policy and collect a message for each one that fails.
+
+    Args:
+        plan: The execution plan to evaluate (must be a dict)
+
+    Returns:
+        List of failure messages (empty if all policies pass)
+    """
     reasons = []
 
     # Check each policy
@@ -184,22 +228,25 @@ def get_policy_failure_reason(plan: dict) -> str:
             f"Auto-approval requires zero risks. Risks: {risks}"
         )
 
+    # Scan steps once, recording which forbidden keywords were found
     steps = plan.get("steps", [])
-    if not _are_steps_safe(steps):
-        # Find which keywords were found
-        found_keywords = []
+    steps_safe = isinstance(steps, list)
+    found_keywords = set()
+    if steps_safe:
         for step in steps:
-            if isinstance(step, str):
-                step_lower = step.lower()
-                for keyword in FORBIDDEN_KEYWORDS:
-                    if keyword in step_lower:
-                        found_keywords.append(keyword)
+            if not isinstance(step, str):
+                # Non-string steps are suspicious
+                steps_safe = False
+                continue
+            step_lower = step.lower()
+            for keyword in FORBIDDEN_KEYWORDS:
+                if keyword in step_lower:
+                    found_keywords.add(keyword)
+
+    if not steps_safe or found_keywords:
         reasons.append(
-            f"Plan steps contain forbidden keywords: {sorted(set(found_keywords))}. "
+            f"Plan steps contain forbidden keywords: {sorted(found_keywords)}. "
             f"Steps must not contain: {sorted(FORBIDDEN_KEYWORDS)}"
         )
 
-    if not reasons:
-        return "Plan passed all policies (unexpected - should not be called)"
-
-    return " | ".join(reasons)
+    return reasons
@@ -5,12 +5,23 @@ Processes multiple candidate folders and generates aggregated results.
 """
 
 import csv
-import json
+import functools
+import os
 import re
 import traceback
 from pathlib import Path
 from typing import Any
 
+from jobflow.app.util.jsonio import to_dict_default, write_json_file
+
+
+# File suffixes that mark a directory as a candidate folder
+CANDIDATE_FILE_EXTENSIONS = (".xlsx", ".txt", ".md", ".docx")
+
+# safe_slug() patterns
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9_-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[_-]+")
+
 
 def discover_candidate_folders(candidates_dir: str) -> list[str]:
     """
@@ -27,24 +38,35 @@ def discover_candidate_folders(candidates_dir: str) -> list[str]:
     """
     candidates_path = Path(candidates_dir)
 
-    if not candidates_path.exists() or not candidates_path.is_dir():
+    if not candidates_path.is_dir():
         return []
 
-    candidate_folders = []
+    return sorted(_iter_candidate_folders(str(candidates_path.absolute())))
 
-    for item in candidates_path.iterdir():
-        if not item.is_dir():
-            continue
 
-        # Check if it looks like a candidate folder
-        # Must have either .xlsx OR resume files (.txt, .md, .docx)
-        has_xlsx = any(item.glob("*.xlsx"))
-        has_resume = any(item.glob("*.txt")) or any(item.glob("*.md")) or any(item.glob("*.docx"))
+def _iter_candidate_folders(candidates_dir: str):
+    """
+    Yield absolute paths of subdirectories that contain candidate files.
 
-        if has_xlsx or has_resume:
-            candidate_folders.append(str(item.absolute()))
+    Uses os.scandir so directory checks come from the cached DirEntry type
+    and each subdirectory is listed once (instead of one glob per extension).
+    """
+    with os.scandir(candidates_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
 
-    return sorted(candidate_folders)
+            # Must have either .xlsx OR resume files (.txt, .md, .docx)
+            try:
+                with os.scandir(entry.path) as files:
+                    has_candidate_file = any(
+                        f.name.endswith(CANDIDATE_FILE_EXTENSIONS) for f in files
+                    )
+            except OSError:
+                continue  # Unreadable folder (same as an empty glob)
+
+            if has_candidate_file:
+                yield entry.path
 
 
 def run_batch(
@@ -54,7 +76,8 @@ def run_batch(
     match_jobs: bool = True,
     export_apply_packs: bool = True,
     top_n: int = 25,
-    company_domains: set[str] | None = None
+    company_domains: set[str] | None = None,
+    gzip_output: bool = False,
 ) -> dict:
     """
     Run batch candidate processing.
@@ -73,6 +96,8 @@ def run_batch(
         export_apply_packs: Whether to generate apply pack exports (default True)
         top_n: Number of top jobs to include in apply packs (default 25)
         company_domains: Optional set of known company domains for URL allowlisting
+        gzip_output: Write per-candidate results and apply pack JSON as
+            gzip (.json.gz, compression level 1) (default False)
 
     Returns:
         Dict with:
@@ -83,6 +108,11 @@ def run_batch(
         - errors_path: path to errors.json
         - results_dir: path to results directory
         - apply_packs_dir: path to apply packs directory (if enabled)
+        - json_bytes_written: bytes written for per-candidate JSON files
+
+    Notes:
+        - results.json and errors.json are ASCII (non-ASCII characters are
+          \\u-escaped); apply pack JSON is written as raw UTF-8
     """
     from pipelines.job_discovery import run_job_discovery
 
@@ -111,11 +141,15 @@ def run_batch(
             "summary_path": str(out_path / "summary.csv"),
             "errors_path": str(out_path / "errors.json"),
             "results_dir": str(results_dir),
+            "json_bytes_written": 0,
         }
         if apply_packs_dir:
             result["apply_packs_dir"] = str(apply_packs_dir)
         return result
 
+    json_suffix = ".json.gz" if gzip_output else ".json"
+    json_bytes_written = 0
+
     # Process each candidate
     summary_rows = []
     errors = []
@@ -127,10 +161,13 @@ def run_batch(
 
         try:
             # Run job discovery for this candidate
+            # Without apply packs the jobs only go to JSON, so keep them as
+            # JobPosting instances and let the writer serialize them
             result = run_job_discovery(
                 sources=job_sources,
                 candidate_folder=folder,
-                match_jobs=match_jobs
+                match_jobs=match_jobs,
+                raw_jobs=apply_packs_dir is None,
             )
 
             # Extract candidate ID
@@ -141,9 +178,14 @@ def run_batch(
             candidate_results_dir = results_dir / safe_id
             candidate_results_dir.mkdir(exist_ok=True)
 
-            results_file = candidate_results_dir / "results.json"
-            with open(results_file, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, sort_keys=True)
+            results_file = candidate_results_dir / f"results{json_suffix}"
+            json_bytes_written += write_json_file(
+                result,
+                results_file,
+                compress=gzip_output,
+                default=to_dict_default,
+                ensure_ascii=True,
+            )
 
             # Generate apply pack if enabled
             if apply_packs_dir:
@@ -166,9 +208,10 @@ def run_batch(
                 candidate_apply_dir.mkdir(exist_ok=True)
 
                 # Write JSON and CSV
-                write_apply_pack_json(
+                json_bytes_written += write_apply_pack_json(
                     apply_pack,
-                    str(candidate_apply_dir / "applications_ready.json")
+                    str(candidate_apply_dir / f"applications_ready{json_suffix}"),
+                    compress=gzip_output,
                 )
                 write_apply_pack_csv(
                     apply_pack,
@@ -282,6 +325,7 @@ def run_batch(
         "summary_path": summary_path,
         "errors_path": errors_path,
         "results_dir": str(results_dir),
+        "json_bytes_written": json_bytes_written,
     }
 
     if apply_packs_dir:
@@ -290,6 +334,7 @@ def run_batch(
     return result
 
 
+@functools.lru_cache(maxsize=4096)
 def safe_slug(text: str) -> str:
     """
     Create safe filesystem slug from text.
@@ -300,6 +345,9 @@ def safe_slug(text: str) -> str:
     - Keep only alphanumeric, underscore, dash
     - Max length 80 characters
 
+    Results are memoized, since the same folder and candidate names recur
+    across batch runs and Drive syncs.
+
     Args:
         text: Input text
 
@@ -316,10 +364,10 @@ def safe_slug(text: str) -> str:
     slug = slug.replace(" ", "_")
 
     # Keep only alphanumeric, underscore, dash
-    slug = re.sub(r"[^a-z0-9_-]", "", slug)
+    slug = _SLUG_INVALID_RE.sub("", slug)
 
     # Remove consecutive underscores/dashes
-    slug = re.sub(r"[_-]+", "_", slug)
+    slug = _SLUG_SEPARATOR_RE.sub("_", slug)
 
     # Strip leading/trailing underscores/dashes
     slug = slug.strip("_-")
@@ -407,8 +455,7 @@ def _write_errors_json(path: str, errors: list[dict]):
         path: Output JSON file path
         errors: List of error dicts
     """
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(errors, f, indent=2, sort_keys=True)
+    write_json_file(errors, path, ensure_ascii=True)
 
 
 def _truncate_traceback(tb: str, max_lines: int = 20) -> str:
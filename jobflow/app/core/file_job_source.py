@@ -11,6 +11,8 @@ protocol with no network dependencies.
 import json
 from pathlib import Path
 
+from jobflow.app.util.jsonio import read_json_file
+
 
 class FileJobSource:
     """
@@ -42,6 +44,11 @@ class FileJobSource:
         self._source_name = source_name
         self._path = Path(path)
 
+        # Parsed jobs for the file version they came from; batch runs fetch
+        # the same file once per candidate
+        self._cache_key: tuple[int, int] | None = None
+        self._cached_jobs: list[dict] | None = None
+
     @property
     def source_name(self) -> str:
         """
@@ -63,6 +70,10 @@ class FileJobSource:
         Note: Query parameter is ignored for file sources. All jobs from
         the file are returned. Filtering should be done at aggregation level.
 
+        The parsed file is reused while its mtime and size are unchanged, so
+        the returned job dicts are shared between calls and must be treated
+        as read-only (the aggregator copies before adding fields).
+
         Args:
             query: Ignored for file sources
 
@@ -74,15 +85,20 @@ class FileJobSource:
             ValueError: If file contains invalid JSON or wrong structure
         """
         # Check file exists
-        if not self._path.exists():
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Job data file not found: {self._path}"
             )
 
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if cache_key == self._cache_key:
+            return list(self._cached_jobs)
+
         # Read and parse JSON
         try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(self._path)
         except json.JSONDecodeError as e:
             raise ValueError(
                 f"Invalid JSON in job data file {self._path}: {str(e)}"
@@ -109,4 +125,6 @@ class FileJobSource:
                 f"Expected job data to be a list, got {type(jobs).__name__}"
             )
 
-        return jobs
+        self._cache_key = cache_key
+        self._cached_jobs = jobs
+        return list(jobs)
@@ -5,37 +5,76 @@ Deterministic candidate-to-job matching with explainable scoring.
 """
 
 import re
-from typing import Any
+from typing import Any, Iterable
 
 from jobflow.app.core.job_model import JobPosting
 from jobflow.app.core.match_result import MatchResult
 
 
-def match_job(candidate_profile: dict, job: JobPosting) -> MatchResult:
+def match_job(
+    candidate_profile: dict, job: JobPosting, reject_early: bool = False
+) -> MatchResult | None:
     """
     Match a candidate to a job with dimension-based scoring.
 
     Args:
         candidate_profile: Dict with candidate info (skills, titles, locations, etc.)
         job: JobPosting instance
+        reject_early: Return None for rejects instead of a full MatchResult,
+            skipping the keyword lists, reasons and fingerprint
 
     Returns:
-        MatchResult with scores, decision, and reasons
+        MatchResult with scores, decision, and reasons (None for a reject
+        when reject_early is True)
     """
-    # Extract candidate ID
     candidate_id = _extract_candidate_id(candidate_profile)
+    candidate_keywords = _normalize_keywords(
+        _extract_candidate_keywords(candidate_profile)
+    )
+    return _match_prepared(
+        candidate_profile, candidate_id, candidate_keywords, job, reject_early
+    )
 
-    # Extract keywords
-    candidate_keywords = _extract_candidate_keywords(candidate_profile)
-    job_keywords = _extract_job_keywords(job)
 
-    # Normalize all keywords
-    candidate_keywords = _normalize_keywords(candidate_keywords)
-    job_keywords = _normalize_keywords(job_keywords)
+def match_jobs(
+    candidate_profile: dict, jobs: Iterable[JobPosting], reject_early: bool = False
+) -> list[MatchResult | None]:
+    """
+    Match a candidate to many jobs.
 
-    # Compute keyword overlap
-    matched = sorted(candidate_keywords & job_keywords)
-    missing = sorted(job_keywords - candidate_keywords)
+    Equivalent to calling match_job() for each job, but the candidate's
+    identifier and normalized keywords are derived once instead of per job.
+
+    Args:
+        candidate_profile: Dict with candidate info (skills, titles, locations, etc.)
+        jobs: JobPosting instances to score
+        reject_early: Yield None for rejects (see match_job)
+
+    Returns:
+        List of MatchResult (or None), one per job, in input order
+    """
+    candidate_id = _extract_candidate_id(candidate_profile)
+    candidate_keywords = _normalize_keywords(
+        _extract_candidate_keywords(candidate_profile)
+    )
+    return [
+        _match_prepared(
+            candidate_profile, candidate_id, candidate_keywords, job, reject_early
+        )
+        for job in jobs
+    ]
+
+
+def _match_prepared(
+    candidate_profile: dict,
+    candidate_id: str,
+    candidate_keywords: set[str],
+    job: JobPosting,
+    reject_early: bool = False,
+) -> MatchResult | None:
+    """Score one job against a candidate whose ID and keywords are precomputed."""
+    # Extract and normalize job keywords
+    job_keywords = _normalize_keywords(_extract_job_keywords(job))
 
     # Compute dimension scores
     skills_score = _compute_skills_score(candidate_keywords, job_keywords)
@@ -60,6 +99,12 @@ def match_job(candidate_profile: dict, job: JobPosting) -> MatchResult:
         decision = "weak_fit"
     else:
         decision = "reject"
+        if reject_early:
+            return None
+
+    # Compute keyword overlap
+    matched = sorted(candidate_keywords & job_keywords)
+    missing = sorted(job_keywords - candidate_keywords)
 
     # Build dimension scores dict
     dimension_scores = {
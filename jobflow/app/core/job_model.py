@@ -12,6 +12,15 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
+# Translation table deleting every ASCII char except digits and "."
+_SALARY_TRANS = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i) not in "0123456789.")
+)
+
+# Fallback cleanup for non-ASCII input (currency symbols, unicode digits)
+_SALARY_NON_NUMERIC_RE = re.compile(r"[^\d.]")
+
+
 @dataclass
 class JobPosting:
     """
@@ -51,58 +60,58 @@ class JobPosting:
             Normalized JobPosting instance
         """
         # Normalize title
-        title = cls._get_first_value(
+        title = _get_first_value(
             raw, ["title", "job_title", "position"], default=""
         )
-        title = cls._normalize_string(title)
+        title = _normalize_string(title)
 
         # Normalize company
-        company = cls._get_first_value(
+        company = _get_first_value(
             raw, ["company", "employer", "company_name"], default=""
         )
-        company = cls._normalize_string(company)
+        company = _normalize_string(company)
 
         # Normalize location
-        location = cls._get_first_value(
+        location = _get_first_value(
             raw, ["location", "loc", "job_location"], default=""
         )
-        location = cls._normalize_string(location)
+        location = _normalize_string(location)
 
         # Normalize description
-        description = cls._get_first_value(
+        description = _get_first_value(
             raw, ["description", "job_description", "summary"], default=""
         )
-        description = cls._normalize_string(description)
+        description = _normalize_string(description)
 
         # Normalize requirements
-        requirements_raw = cls._get_first_value(
+        requirements_raw = _get_first_value(
             raw, ["requirements", "skills", "qualifications"], default=[]
         )
-        requirements = cls._normalize_requirements(requirements_raw)
+        requirements = _normalize_requirements(requirements_raw)
 
         # Normalize URL
-        url = cls._get_first_value(
+        url = _get_first_value(
             raw, ["url", "job_url", "apply_url", "link"], default=None
         )
-        url = cls._normalize_string(url) if url else None
+        url = _normalize_string(url) if url else None
 
         # Normalize source
-        source = cls._get_first_value(raw, ["source", "provider"], default=None)
-        source = cls._normalize_string(source) if source else None
+        source = _get_first_value(raw, ["source", "provider"], default=None)
+        source = _normalize_string(source) if source else None
 
         # Normalize posted_date
-        posted_date = cls._get_first_value(
+        posted_date = _get_first_value(
             raw, ["posted_date", "date_posted"], default=None
         )
-        posted_date = cls._normalize_string(posted_date) if posted_date else None
+        posted_date = _normalize_string(posted_date) if posted_date else None
 
         # Normalize salary and currency
-        salary_min, salary_max, currency = cls._normalize_salary(raw)
+        salary_min, salary_max, currency = _normalize_salary(raw)
 
         # Normalize employment_type
         employment_type = raw.get("employment_type")
         employment_type = (
-            cls._normalize_string(employment_type) if employment_type else None
+            _normalize_string(employment_type) if employment_type else None
         )
 
         # Normalize remote
@@ -112,7 +121,7 @@ class JobPosting:
 
         # Normalize tags
         tags_raw = raw.get("tags", [])
-        tags = cls._normalize_tags(tags_raw)
+        tags = _normalize_tags(tags_raw)
 
         return cls(
             title=title,
@@ -132,146 +141,23 @@ class JobPosting:
             raw=raw,  # Store original for auditability
         )
 
-    @staticmethod
-    def _get_first_value(
-        data: dict, keys: list[str], default: Any = None
-    ) -> Any:
-        """Get first matching value from dict using list of possible keys."""
-        for key in keys:
-            if key in data:
-                return data[key]
-        return default
-
-    @staticmethod
-    def _normalize_string(value: Any) -> str:
-        """Normalize value to stripped string."""
-        if value is None:
-            return ""
-        return str(value).strip()
-
-    @staticmethod
-    def _normalize_requirements(value: Any) -> list[str]:
-        """
-        Normalize requirements to list of non-empty strings.
-
-        - If string: split by newlines or semicolons
-        - If list: coerce to strings
-        - Strip whitespace and remove empty items
-        """
-        if isinstance(value, str):
-            # Split by newlines or semicolons
-            items = re.split(r"[;\n]+", value)
-        elif isinstance(value, list):
-            items = value
-        else:
-            return []
-
-        # Strip and filter empty items
-        normalized = []
-        for item in items:
-            stripped = str(item).strip()
-            if stripped:
-                normalized.append(stripped)
-
-        return normalized
-
-    @staticmethod
-    def _normalize_tags(value: Any) -> list[str]:
-        """
-        Normalize tags to lowercase, deduplicated list.
-
-        - If string: split by commas
-        - Lowercase + trimmed
-        - Deduplicate while preserving first occurrence order
-        """
-        if isinstance(value, str):
-            items = value.split(",")
-        elif isinstance(value, list):
-            items = value
-        else:
-            return []
-
-        # Lowercase, strip, and deduplicate
-        seen = set()
-        normalized = []
-        for item in items:
-            tag = str(item).strip().lower()
-            if tag and tag not in seen:
-                seen.add(tag)
-                normalized.append(tag)
-
-        return normalized
-
-    @staticmethod
-    def _normalize_salary(raw: dict) -> tuple[float | None, float | None, str | None]:
-        """
-        Normalize salary information.
-
-        Handles:
-        - Direct salary_min/salary_max keys
-        - Nested salary_range dict
-        - String formats like "$80,000" or "€75,000"
-        """
-        salary_min = None
-        salary_max = None
-        currency = None
-
-        # Check for nested salary_range
-        if "salary_range" in raw and isinstance(raw["salary_range"], dict):
-            salary_range = raw["salary_range"]
-            salary_min = JobPosting._parse_salary_value(salary_range.get("min"))
-            salary_max = JobPosting._parse_salary_value(salary_range.get("max"))
-            currency = salary_range.get("currency")
-        else:
-            # Check for direct keys
-            salary_min = JobPosting._parse_salary_value(raw.get("salary_min"))
-            salary_max = JobPosting._parse_salary_value(raw.get("salary_max"))
-            currency = raw.get("currency")
-
-        # Normalize currency
-        if currency:
-            currency = str(currency).strip()
-
-        return salary_min, salary_max, currency
-
-    @staticmethod
-    def _parse_salary_value(value: Any) -> float | None:
-        """
-        Parse salary value from various formats.
-
-        Handles:
-        - int/float: direct conversion
-        - string: "$80,000", "€75,000", "80000"
-        """
-        if value is None:
-            return None
-
-        if isinstance(value, (int, float)):
-            return float(value)
-
-        if isinstance(value, str):
-            # Remove currency symbols and commas
-            cleaned = re.sub(r"[^\d.]", "", value)
-            if cleaned:
-                try:
-                    return float(cleaned)
-                except ValueError:
-                    return None
-
-        return None
-
-    def to_dict(self) -> dict:
+    def to_dict(self, copy: bool = True) -> dict:
         """
         Convert to JSON-serializable dict.
 
         Includes 'raw' key only when raw is not None.
+
+        Args:
+            copy: If True (default), list fields are defensively copied.
+                  Pass False for read-only callers (e.g. straight to JSON)
+                  to skip the per-field allocations.
         """
-        result = {
+        return {
             "title": self.title,
             "company": self.company,
             "location": self.location,
             "description": self.description,
-            "requirements": self.requirements.copy(),  # Defensive copy
+            "requirements": self.requirements.copy() if copy else self.requirements,
             "url": self.url,
             "source": self.source,
             "posted_date": self.posted_date,
@@ -280,14 +166,10 @@ class JobPosting:
             "currency": self.currency,
             "employment_type": self.employment_type,
             "remote": self.remote,
-            "tags": self.tags.copy(),  # Defensive copy
+            "tags": self.tags.copy() if copy else self.tags,
+            **({"raw": self.raw} if self.raw is not None else {}),
         }
 
-        if self.raw is not None:
-            result["raw"] = self.raw
-
-        return result
-
     def fingerprint(self) -> str:
         """
         Generate deterministic SHA-256 fingerprint.
@@ -309,6 +191,12 @@ class JobPosting:
         - tags (internal classification)
         - raw (original data)
 
+        Stability:
+            The fingerprint is persisted as the merge key of application
+            queue CSVs (human-edited status/notes are matched by it across
+            reruns), so the hash algorithm and canonical form must not change
+            without a migration of existing queues.
+
         Returns:
             64-character hex string (SHA-256 hash)
         """
@@ -331,5 +219,139 @@ class JobPosting:
             canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=True
         )
 
-        # Hash with SHA-256
-        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+        # Hash with SHA-256 (ensure_ascii=True guarantees pure ASCII output,
+        # so the cheaper ASCII codec yields the same bytes as UTF-8)
+        return hashlib.sha256(canonical_json.encode("ascii")).hexdigest()
+
+
+# Normalization helpers (module-level to avoid per-call class attribute lookups)
+
+
+def _get_first_value(
+    data: dict, keys: list[str], default: Any = None
+) -> Any:
+    """Get first matching value from dict using list of possible keys."""
+    for key in keys:
+        if key in data:
+            return data[key]
+    return default
+
+
+def _normalize_string(value: Any) -> str:
+    """Normalize value to stripped string."""
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _normalize_requirements(value: Any, dedup: bool = False) -> list[str]:
+    """
+    Normalize requirements to list of non-empty strings.
+
+    - If string: split by newlines or semicolons
+    - If list: coerce to strings
+    - Strip whitespace and remove empty items
+    - If dedup: drop repeats while preserving first occurrence order
+    """
+    if isinstance(value, str):
+        # Split by newlines or semicolons
+        items = re.split(r"[;\n]+", value)
+    elif isinstance(value, list):
+        items = value
+    else:
+        return []
+
+    # Strip and filter empty items
+    normalized = [s for item in items if (s := str(item).strip())]
+
+    if dedup:
+        return list(dict.fromkeys(normalized))
+
+    return normalized
+
+
+def _normalize_tags(value: Any) -> list[str]:
+    """
+    Normalize tags to lowercase, deduplicated list.
+
+    - If string: split by commas
+    - Lowercase + trimmed
+    - Deduplicate while preserving first occurrence order
+    """
+    if isinstance(value, str):
+        items = value.split(",")
+    elif isinstance(value, list):
+        items = value
+    else:
+        return []
+
+    # Lowercase, strip, and deduplicate
+    seen = set()
+    normalized = []
+    for item in items:
+        tag = str(item).strip().lower()
+        if tag and tag not in seen:
+            seen.add(tag)
+            normalized.append(tag)
+
+    return normalized
+
+
+def _normalize_salary(raw: dict) -> tuple[float | None, float | None, str | None]:
+    """
+    Normalize salary information.
+
+    Handles:
+    - Direct salary_min/salary_max keys
+    - Nested salary_range dict
+    - String formats like "$80,000" or "€75,000"
+    """
+    salary_min = None
+    salary_max = None
+    currency = None
+
+    # Check for nested salary_range
+    if "salary_range" in raw and isinstance(raw["salary_range"], dict):
+        salary_range = raw["salary_range"]
+        salary_min = _parse_salary_value(salary_range.get("min"))
+        salary_max = _parse_salary_value(salary_range.get("max"))
+        currency = salary_range.get("currency")
+    else:
+        # Check for direct keys
+        salary_min = _parse_salary_value(raw.get("salary_min"))
+        salary_max = _parse_salary_value(raw.get("salary_max"))
+        currency = raw.get("currency")
+
+    # Normalize currency
+    if currency:
+        currency = str(currency).strip()
+
+    return salary_min, salary_max, currency
+
+
+def _parse_salary_value(value: Any) -> float | None:
+    """
+    Parse salary value from various formats.
+
+    Handles:
+    - int/float: direct conversion
+    - string: "$80,000", "€75,000", "80000"
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    if isinstance(value, str):
+        # Remove currency symbols and commas (ASCII fast path first)
+        cleaned = value.translate(_SALARY_TRANS)
+        if not cleaned.isascii():
+            cleaned = _SALARY_NON_NUMERIC_RE.sub("", cleaned)
+        if cleaned:
+            try:
+                return float(cleaned)
+            except ValueError:
+                return None
+
+    return None
@@ -9,6 +9,18 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
+# Score range [lo, hi) required for each decision, and how errors describe it
+_DECISION_BOUNDS: dict[str, tuple[int, int, str]] = {
+    "strong_fit": (80, 101, ">= 80"),
+    "possible_fit": (65, 80, "65-79"),
+    "weak_fit": (45, 65, "45-64"),
+    "reject": (0, 45, "< 45"),
+}
+
+# Allowed decision labels (the keys of _DECISION_BOUNDS)
+_VALID_DECISIONS: frozenset[str] = frozenset(_DECISION_BOUNDS)
+
+
 @dataclass(frozen=True)
 class MatchResult:
     """
@@ -37,10 +49,10 @@ class MatchResult:
             )
 
         # Validate decision
-        valid_decisions = {"strong_fit", "possible_fit", "weak_fit", "reject"}
-        if self.decision not in valid_decisions:
+        if self.decision not in _VALID_DECISIONS:
             raise ValueError(
-                f"decision must be one of {valid_decisions}, got {self.decision}"
+                f"decision must be one of {sorted(_VALID_DECISIONS)}, "
+                f"got {self.decision}"
             )
 
         # Validate dimension scores bounds
@@ -51,27 +63,21 @@ class MatchResult:
                 )
 
         # Validate decision thresholds match score
-        if self.decision == "strong_fit" and self.overall_score < 80:
-            raise ValueError(
-                f"decision 'strong_fit' requires score >= 80, got {self.overall_score}"
-            )
-        if self.decision == "possible_fit" and not (65 <= self.overall_score < 80):
+        lo, hi, requirement = _DECISION_BOUNDS[self.decision]
+        if not (lo <= self.overall_score < hi):
             raise ValueError(
-                f"decision 'possible_fit' requires score 65-79, got {self.overall_score}"
-            )
-        if self.decision == "weak_fit" and not (45 <= self.overall_score < 65):
-            raise ValueError(
-                f"decision 'weak_fit' requires score 45-64, got {self.overall_score}"
-            )
-        if self.decision == "reject" and self.overall_score >= 45:
-            raise ValueError(
-                f"decision 'reject' requires score < 45, got {self.overall_score}"
+                f"decision '{self.decision}' requires score {requirement}, "
+                f"got {self.overall_score}"
             )
 
-    def to_dict(self) -> dict:
+    def to_dict(self, copy: bool = True) -> dict:
         """
         Convert to JSON-serializable dict.
 
+        Args:
+            copy: If True (default), container fields are defensively copied.
+                  Pass False for read-only callers to share them instead.
+
         Returns:
             Dict with all match result fields
         """
@@ -80,9 +86,15 @@ class MatchResult:
             "job_fingerprint": self.job_fingerprint,
             "overall_score": self.overall_score,
             "decision": self.decision,
-            "dimension_scores": self.dimension_scores.copy(),
-            "reasons": self.reasons.copy(),
-            "matched_keywords": self.matched_keywords.copy(),
-            "missing_keywords": self.missing_keywords.copy(),
-            "meta": self.meta.copy() if self.meta else {},
+            "dimension_scores": (
+                self.dimension_scores.copy() if copy else self.dimension_scores
+            ),
+            "reasons": self.reasons.copy() if copy else self.reasons,
+            "matched_keywords": (
+                self.matched_keywords.copy() if copy else self.matched_keywords
+            ),
+            "missing_keywords": (
+                self.missing_keywords.copy() if copy else self.missing_keywords
+            ),
+            "meta": (self.meta.copy() if copy else self.meta) if self.meta else {},
         }
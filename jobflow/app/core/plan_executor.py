@@ -14,7 +14,7 @@ Every execution requires cryptographic proof of approval via approval artifact.
 from jobflow.app.core.approval_artifact import verify_approval
 from jobflow.app.core.directive_router import resolve_pipeline
 from jobflow.app.core.orchestrator import run_pipeline
-from jobflow.app.services.planner import build_plan
+from jobflow.app.services.planner import build_plan_cached
 
 
 class PlanRejectedError(PermissionError):
@@ -31,7 +31,8 @@ def execute_from_directive(
     Execute a directive with cryptographic approval enforcement.
 
     This function orchestrates the complete flow:
-    1. Build plan using LLM planner (reads directive, calls OpenAI)
+    1. Build plan using LLM planner (reads directive, calls OpenAI; cached
+       per directive content)
     2. Verify approval artifact matches the plan (cryptographic check)
     3. If invalid → raise PlanRejectedError with exact reason
     4. If valid → resolve pipeline and execute via orchestrator
@@ -71,8 +72,10 @@ def execute_from_directive(
         payload = {}
 
     # Step 1: Build plan using LLM
-    # This calls OpenAI to analyze the directive and generate a structured plan
-    plan = build_plan(directive_name)
+    # This calls OpenAI to analyze the directive and generate a structured plan.
+    # Plans are memoized per directive content, so repeated executions of
+    # an unchanged directive skip the LLM round-trip.
+    plan = build_plan_cached(directive_name)
 
     # Step 2: Verify approval artifact matches plan
     # CRITICAL: This cryptographically verifies the approval is valid for THIS plan
@@ -10,7 +10,7 @@ This is NOT business logic - it's a safety mechanism.
 
 from typing import Optional
 
-from jobflow.app.core.approval_policy import evaluate_policy, get_policy_failure_reason
+from jobflow.app.core.approval_policy import evaluate_policy_with_reason
 
 
 def review_plan_with_reason(plan: dict, auto_approve: bool = False) -> tuple[bool, str]:
@@ -44,14 +44,8 @@ def review_plan_with_reason(plan: dict, auto_approve: bool = False) -> tuple[boo
         return False, "Rejected by default (auto_approve is False)"
 
     # Auto-approve requested: evaluate against safety policies
-    approved = evaluate_policy(plan)
-
-    if approved:
-        return True, "Auto-approved by policy"
-    else:
-        # Get detailed reason for policy failure
-        failure_reason = get_policy_failure_reason(plan)
-        return False, failure_reason
+    # (decision and detailed failure reason come from a single policy pass)
+    return evaluate_policy_with_reason(plan)
 
 
 def review_plan(plan: dict, auto_approve: bool = False) -> bool:
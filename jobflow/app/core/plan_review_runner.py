@@ -16,7 +16,7 @@ This is NOT the execution pathway. Use plan_executor for actual execution.
 """
 
 from jobflow.app.core.plan_review import review_plan_with_reason
-from jobflow.app.services.planner import build_plan
+from jobflow.app.services.planner import build_plan_cached
 
 
 def review_directive(directive_name: str, auto_approve: bool = False) -> dict:
@@ -28,7 +28,7 @@ def review_directive(directive_name: str, auto_approve: bool = False) -> dict:
     actually running any workflows.
 
     Flow:
-        1. Build plan using LLM planner
+        1. Build plan using LLM planner (cached per directive content)
         2. Review plan through approval gate
         3. Return results (approved, reason, plan)
         4. DO NOT execute anything
@@ -63,8 +63,10 @@ def review_directive(directive_name: str, auto_approve: bool = False) -> dict:
             print(f"Plan would be rejected: {result['reason']}")
     """
     # Step 1: Build plan using LLM
-    # This calls OpenAI to analyze the directive and generate a structured plan
-    plan = build_plan(directive_name)
+    # This calls OpenAI to analyze the directive and generate a structured plan.
+    # Plans are memoized per directive content, so re-reviewing an unchanged
+    # directive (e.g. with a different auto_approve) skips the LLM round-trip.
+    plan = build_plan_cached(directive_name)
 
     # Step 2: Review plan through approval gate
     # This evaluates the plan against policies and returns approval decision
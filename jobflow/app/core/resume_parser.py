@@ -4,12 +4,28 @@ Resume parser with stdlib-only text extraction.
 Extracts text and skills from resume files (.txt, .md, .docx).
 """
 
+import functools
+import hashlib
+import os
 import re
 import zipfile
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
+from xml.parsers import expat
 
 
+# Optional directory for a persistent, content-addressed cache of extracted
+# .docx text (one "<sha256>.txt" file per distinct resume)
+RESUME_CACHE_DIR_ENV = "JOBFLOW_RESUME_CACHE_DIR"
+
+
+# WordprocessingML element names as reported by a namespace-aware expat
+# parser ("<namespace URI> <local name>")
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W_P = f"{_W_NS} p"
+_W_T = f"{_W_NS} t"
+
 # Built-in skill keywords for deterministic extraction
 SKILL_KEYWORDS = {
     "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go", "rust",
@@ -31,6 +47,65 @@ SKILL_KEYWORDS = {
 }
 
 
+def _build_trie_pattern(words) -> str:
+    """
+    Build a regex fragment matching any of the given words via a prefix trie.
+
+    A flat "a|b|c" alternation makes the regex engine retry every keyword at
+    each position; nesting alternatives by shared prefix lets it discard most
+    keywords after the first character.
+
+    Args:
+        words: Iterable of literal strings
+
+    Returns:
+        Regex source (no capturing groups) matching exactly those words
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # End-of-word marker
+
+    def emit(node: dict) -> str:
+        branches = [
+            re.escape(ch) + emit(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ""
+        is_word_end = "" in node
+        if len(branches) == 1 and not is_word_end:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if is_word_end else group
+
+    return emit(trie)
+
+
+# Single-word skills must match on word boundaries; the lookahead makes every
+# boundary position a candidate so overlapping keywords are all reported.
+_SINGLE_WORD_SKILLS = sorted(skill for skill in SKILL_KEYWORDS if " " not in skill)
+_SINGLE_WORD_SKILL_RE = re.compile(
+    r"\b(?=(" + _build_trie_pattern(_SINGLE_WORD_SKILLS) + r")\b)"
+)
+
+# Multi-word skills are plain substring matches (no boundary checks)
+_MULTI_WORD_SKILLS = sorted(skill for skill in SKILL_KEYWORDS if " " in skill)
+
+# Capitalized tech terms (CamelCase or standalone), e.g. "PowerBI", "Node.js".
+# Every technical acronym (2-5 uppercase letters) starts a capitalized term,
+# so the lookahead captures it in the same scan as the "acronym" group.
+_CAPITALIZED_TERM_RE = re.compile(
+    r"\b(?=(?P<acronym>[A-Z]{2,5}\b)?)[A-Z][a-z]*(?:[A-Z][a-z]*)*(?:[.#][a-z]+)?\b"
+)
+
+# Common words skipped when collecting capitalized terms
+_STOPWORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at"})
+
+
 def extract_text_from_resume(path: str) -> str:
     """
     Extract text from resume file.
@@ -65,9 +140,12 @@ def extract_text_from_resume(path: str) -> str:
     if suffix in {".txt", ".md"}:
         return _read_text_file(path)
 
-    # Handle .docx
+    # Handle .docx (cached: unchanged files are not re-parsed)
     if suffix == ".docx":
-        return _extract_text_from_docx(path)
+        stat = path_obj.stat()
+        return _extract_docx_text_cached(
+            str(path_obj.resolve()), stat.st_mtime_ns, stat.st_size
+        )
 
     # Unsupported format
     raise ValueError(
@@ -82,12 +160,70 @@ def _read_text_file(path: str) -> str:
         return f.read()
 
 
+@functools.lru_cache(maxsize=256)
+def _extract_docx_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Extract .docx text once per (path, mtime, size) file version.
+
+    When RESUME_CACHE_DIR_ENV is set, results are also persisted by content
+    hash so identical resumes are never re-parsed, even across processes or
+    under different file names.
+
+    Args:
+        path: Absolute path to .docx file
+        mtime_ns: File modification time (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Extracted text
+    """
+    cache_dir = os.getenv(RESUME_CACHE_DIR_ENV)
+    if not cache_dir:
+        return _extract_text_from_docx(path)
+
+    content_hash = _hash_file(path)
+    cache_file = Path(cache_dir) / f"{content_hash}.txt"
+
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass  # Cache miss
+
+    text = _extract_text_from_docx(path)
+
+    # Best-effort write; a failed write only costs a future re-parse
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(text, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+    return text
+
+
+def _hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 hex digest of a file without loading it whole."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def clear_resume_text_cache() -> None:
+    """Discard in-process cached .docx text (persistent cache is untouched)."""
+    _extract_docx_text_cached.cache_clear()
+
+
 def _extract_text_from_docx(path: str) -> str:
     """
     Extract text from .docx file using stdlib only.
 
     .docx is a ZIP archive containing XML files. This extracts text
-    from word/document.xml.
+    from word/document.xml, streaming it through expat so no element tree
+    is ever built.
 
     Args:
         path: Path to .docx file
@@ -97,39 +233,86 @@ def _extract_text_from_docx(path: str) -> str:
     """
     try:
         with zipfile.ZipFile(path, "r") as docx_zip:
-            # Read the main document XML
+            # Open the main document XML as a stream
             try:
-                xml_content = docx_zip.read("word/document.xml")
+                stream = docx_zip.open("word/document.xml")
             except KeyError:
                 # Some docx files might have different structure
                 return ""
 
-            # Parse XML
-            root = ET.fromstring(xml_content)
-
-            # Define namespace
-            namespaces = {
-                "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-            }
-
-            # Extract text from all text nodes
-            paragraphs = []
-            for paragraph in root.findall(".//w:p", namespaces):
-                texts = []
-                for text_node in paragraph.findall(".//w:t", namespaces):
-                    if text_node.text:
-                        texts.append(text_node.text)
-                if texts:
-                    paragraphs.append("".join(texts))
-
-            return "\n".join(paragraphs)
+            with stream:
+                return "\n".join(_read_docx_paragraphs(stream))
 
     except zipfile.BadZipFile:
         raise ValueError(f"Invalid .docx file: {path}")
-    except ET.ParseError:
+    except expat.ExpatError:
         raise ValueError(f"Cannot parse .docx XML: {path}")
 
 
+def _read_docx_paragraphs(stream) -> list[str]:
+    """
+    Read non-empty paragraph texts from a word/document.xml stream.
+
+    Drives expat callbacks directly: only <w:p> and <w:t> are tracked and
+    text is collected straight from character data, without creating
+    element objects.
+
+    Paragraphs nested inside other paragraphs (e.g. text boxes) are
+    reported in document order together with their outer paragraph,
+    exactly as a full-tree ``.//w:p`` search would: the outer paragraph
+    includes the nested text, and each nested paragraph follows it.
+
+    Args:
+        stream: Binary file-like object with document XML
+
+    Returns:
+        Paragraph text strings
+
+    Raises:
+        expat.ExpatError: If the XML is malformed
+    """
+    paragraphs = []
+    # Text parts of every paragraph in the current outermost paragraph,
+    # in start-tag order, and of the paragraphs still open
+    pending = []
+    open_paragraphs = []
+    in_text = False
+
+    def start_element(name, _attrs):
+        nonlocal in_text
+        if name == _W_T:
+            in_text = True
+        elif name == _W_P:
+            parts = []
+            pending.append(parts)
+            open_paragraphs.append(parts)
+
+    def end_element(name):
+        nonlocal in_text
+        if name == _W_T:
+            in_text = False
+        elif name == _W_P:
+            open_paragraphs.pop()
+            if not open_paragraphs:
+                paragraphs.extend("".join(parts) for parts in pending if parts)
+                pending.clear()
+
+    def character_data(data):
+        if in_text:
+            # Text belongs to every enclosing paragraph
+            for parts in open_paragraphs:
+                parts.append(data)
+
+    parser = expat.ParserCreate(namespace_separator=" ")
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    parser.ParseFile(stream)
+
+    return paragraphs
+
+
 def extract_skills_from_text(text: str) -> list[str]:
     """
     Extract skills from text using deterministic keyword matching.
@@ -148,43 +331,60 @@ def extract_skills_from_text(text: str) -> list[str]:
         return []
 
     text_lower = text.lower()
-    found_skills = []
-    seen = set()
-
-    # 1. Match known skill keywords (case-insensitive, whole words)
-    for skill in SKILL_KEYWORDS:
-        # Use word boundaries for single-word skills
-        if " " not in skill:
-            pattern = rf"\b{re.escape(skill)}\b"
-        else:
-            # Multi-word skills need more careful matching
-            pattern = re.escape(skill)
-
-        if re.search(pattern, text_lower):
-            if skill not in seen:
-                found_skills.append(skill)
-                seen.add(skill)
-
-    # 2. Extract acronyms (2-5 uppercase letters)
-    acronyms = re.findall(r"\b[A-Z]{2,5}\b", text)
-    for acronym in acronyms:
-        acronym_lower = acronym.lower()
-        if acronym_lower not in seen:
-            found_skills.append(acronym_lower)
-            seen.add(acronym_lower)
-
-    # 3. Extract capitalized tech terms (CamelCase or standalone)
-    # Match words like "PowerBI", "Node.js", "C#", etc.
-    tech_terms = re.findall(r"\b[A-Z][a-z]*(?:[A-Z][a-z]*)*(?:[.#][a-z]+)?\b", text)
-    for term in tech_terms:
-        # Skip common words
-        if term.lower() in {"the", "a", "an", "and", "or", "but", "in", "on", "at"}:
-            continue
-        # Only include if 2+ chars
-        if len(term) >= 2:
-            term_lower = term.lower()
-            if term_lower not in seen:
-                found_skills.append(term_lower)
-                seen.add(term_lower)
-
-    return found_skills
+
+    # 1. Match known skill keywords (case-insensitive) in a single scan,
+    # ordered by first occurrence in the text. SKILL_KEYWORDS are stored
+    # lowercase, so matches need no further normalization.
+    keyword_hits = [
+        (match.start(), match.group(1))
+        for match in _SINGLE_WORD_SKILL_RE.finditer(text_lower)
+    ]
+    for skill in _MULTI_WORD_SKILLS:
+        position = text_lower.find(skill)
+        if position >= 0:
+            keyword_hits.append((position, skill))
+    keyword_hits.sort()
+
+    # 2./3. Collect acronyms (2-5 uppercase letters) and capitalized tech
+    # terms (CamelCase or standalone, e.g. "PowerBI", "Node.js") in one scan
+    acronyms = []
+    tech_terms = []
+    for match in _CAPITALIZED_TERM_RE.finditer(text):
+        acronym = match.group("acronym")
+        if acronym:
+            acronyms.append(acronym.lower())
+        term = match.group().lower()
+        # Skip common words; only include if 2+ chars
+        if len(term) >= 2 and term not in _STOPWORDS:
+            tech_terms.append(term)
+
+    found_skills = chain(
+        (skill for _position, skill in keyword_hits), acronyms, tech_terms
+    )
+
+    # Deduplicate in order: dict.fromkeys keeps each skill's first position
+    return list(dict.fromkeys(found_skills))
+
+
+def extract_skills_batch(
+    texts: list[str], workers: int | None = None
+) -> list[list[str]]:
+    """
+    Extract skills from many texts, reusing the module-level patterns.
+
+    Args:
+        texts: Resume or description texts
+        workers: Number of worker processes (default None = run in-process).
+            Matching is CPU-bound and holds the GIL, so parallelism needs
+            processes; it only pays off for large batches.
+
+    Returns:
+        List of extract_skills_from_text() results, in input order
+    """
+    if not workers or workers <= 1 or len(texts) <= 1:
+        return [extract_skills_from_text(text) for text in texts]
+
+    # Hand each worker a few texts at a time to amortize IPC overhead
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_skills_from_text, texts, chunksize=chunksize))
@@ -5,9 +5,68 @@ Transforms normalized candidate profiles into structured job search queries.
 Maps candidate preferences and skills to job search criteria.
 """
 
+from dataclasses import dataclass
 from typing import Any
 
 
+@dataclass(frozen=True, slots=True)
+class CandidateView:
+    """
+    Search criteria extracted once from a candidate profile dict.
+
+    Walking the candidate dict (field fallbacks, splitting, deduplication)
+    happens once in from_dict(); callers building many queries for the same
+    candidate can hold on to the view and call as_query() repeatedly.
+
+    Attributes:
+        titles: Primary + alternate titles (deduplicated)
+        locations: Desired locations (deduplicated)
+        remote_ok: Remote work preference
+        keywords: Skills/tools from skills_years (deduplicated)
+        employment_type: Optional employment type preference
+    """
+
+    titles: tuple[str, ...]
+    locations: tuple[str, ...]
+    remote_ok: bool
+    keywords: tuple[str, ...]
+    employment_type: str | None
+
+    @classmethod
+    def from_dict(cls, candidate: dict) -> "CandidateView":
+        """
+        Extract search criteria from a normalized candidate profile dict.
+
+        Args:
+            candidate: Normalized candidate profile dict
+
+        Returns:
+            CandidateView instance
+        """
+        return cls(
+            titles=tuple(_extract_titles(candidate)),
+            locations=tuple(_extract_locations(candidate)),
+            remote_ok=_extract_remote_preference(candidate),
+            keywords=tuple(_extract_keywords(candidate)),
+            employment_type=_extract_employment_type(candidate),
+        )
+
+    def as_query(self) -> dict:
+        """
+        Build a job search query dict (fresh lists on every call).
+
+        Returns:
+            Structured job search query dict (see build_job_query)
+        """
+        return {
+            "titles": list(self.titles),
+            "locations": list(self.locations),
+            "remote_ok": self.remote_ok,
+            "keywords": list(self.keywords),
+            "employment_type": self.employment_type,
+        }
+
+
 def build_job_query(candidate: dict) -> dict:
     """
     Build job search query from normalized candidate profile.
@@ -48,29 +107,12 @@ def build_job_query(candidate: dict) -> dict:
         >>> query = build_job_query(candidate)
         >>> query["titles"]
         ['Software Engineer', 'Backend Engineer', 'Python Developer']
-    """
-    # Extract titles (primary + alternates)
-    titles = _extract_titles(candidate)
 
-    # Extract locations
-    locations = _extract_locations(candidate)
-
-    # Extract remote preference
-    remote_ok = _extract_remote_preference(candidate)
-
-    # Extract keywords from skills
-    keywords = _extract_keywords(candidate)
-
-    # Extract employment type preference
-    employment_type = _extract_employment_type(candidate)
-
-    return {
-        "titles": titles,
-        "locations": locations,
-        "remote_ok": remote_ok,
-        "keywords": keywords,
-        "employment_type": employment_type,
-    }
+    Notes:
+        - To build repeated queries for the same candidate, construct a
+          CandidateView once and call as_query() on it
+    """
+    return CandidateView.from_dict(candidate).as_query()
 
 
 def _extract_titles(candidate: dict) -> list[str]:
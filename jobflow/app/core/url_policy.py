@@ -7,12 +7,15 @@ Validates job application URLs using an allowlist approach:
 - Invalid/malformed URLs are blocked
 """
 
+import re
 from urllib.parse import urlparse
 
 
 # Known ATS (Applicant Tracking System) domains
-# These are automatically allowed as trusted application platforms
-KNOWN_ATS_DOMAINS = {
+# These (and their subdomains, e.g. "acme.myworkdayjobs.com") are
+# automatically allowed as trusted application platforms.
+# Entries are stored already normalized (see normalize_domain()).
+KNOWN_ATS_DOMAINS = frozenset({
     "boards.greenhouse.io",
     "greenhouse.io",
     "lever.co",
@@ -22,9 +25,87 @@ KNOWN_ATS_DOMAINS = {
     "icims.com",
     "smartrecruiters.com",
     "taleo.net",
+})
+
+
+def _build_suffix_trie(domains) -> dict:
+    """
+    Build a trie of domain labels in reverse order ("io" -> "greenhouse").
+
+    A None key marks the end of a registered domain.
+    """
+    trie = {}
+    for domain in domains:
+        node = trie
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[None] = True
+    return trie
+
+
+# Reverse-label trie over KNOWN_ATS_DOMAINS for subdomain matching
+_ATS_SUFFIX_TRIE = _build_suffix_trie(KNOWN_ATS_DOMAINS)
+
+
+def is_known_ats_domain(domain: str) -> bool:
+    """
+    Check whether a normalized domain is a known ATS domain or a subdomain.
+
+    Walks the domain's labels right-to-left through the ATS suffix trie,
+    so the cost is proportional to the number of labels, not the number
+    of known domains.
+
+    Args:
+        domain: Normalized domain (see normalize_domain())
+
+    Returns:
+        True if domain equals or ends with ".<known ATS domain>"
+
+    Examples:
+        "greenhouse.io" -> True
+        "acme.myworkdayjobs.com" -> True
+        "evilgreenhouse.io" -> False
+    """
+    node = _ATS_SUFFIX_TRIE
+    for label in reversed(domain.split(".")):
+        node = node.get(label)
+        if node is None:
+            return False
+        if None in node:
+            return True
+    return False
+
+
+# Fast path for the common case: "https://" followed by a printable-ASCII
+# netloc that ends at "/", "?", "#" or the end of the URL. Group 1 is then
+# exactly what urlparse() returns as netloc (userinfo and port included).
+# Anything else (other schemes, brackets, whitespace or control characters
+# urlparse would strip) goes through urlparse.
+# The case-insensitive flag is scoped to the scheme: applied to the whole
+# pattern, Unicode case folding would let "s" and "k" match the excluded
+# non-ASCII range (U+017F, U+212A).
+_HTTPS_NETLOC_RE = re.compile(
+    r"(?i:https)://([^/?#\[\]\x00-\x20\x7f-\U0010ffff]+)(?=[/?#]|\Z)"
+)
+
+
+# Prebuilt results for blocked URLs, keyed by url_reason (copied on return)
+_BLOCKED_RESULTS = {
+    reason: {
+        "url_valid": False,
+        "url_domain": "",
+        "url_policy": "blocked",
+        "url_reason": reason,
+    }
+    for reason in ("missing_url", "non_https", "malformed")
 }
 
 
+def _blocked(reason: str) -> dict:
+    """Return a fresh blocked-URL result for the given reason."""
+    return _BLOCKED_RESULTS[reason].copy()
+
+
 def normalize_domain(domain: str) -> str:
     """
     Normalize domain name for comparison.
@@ -49,9 +130,28 @@ def normalize_domain(domain: str) -> str:
     return normalized
 
 
+def normalize_company_domains(
+    company_domains: set[str] | frozenset[str] | None,
+) -> frozenset[str]:
+    """
+    Normalize a collection of company domains once for repeated lookups.
+
+    Args:
+        company_domains: Raw company domains (or None)
+
+    Returns:
+        Frozenset of normalized domains
+    """
+    if not company_domains:
+        return frozenset()
+    return frozenset(normalize_domain(d) for d in company_domains)
+
+
 def evaluate_apply_url(
     url: str,
-    company_domains: set[str] | None = None
+    company_domains: set[str] | frozenset[str] | None = None,
+    *,
+    normalized: bool = False,
 ) -> dict:
     """
     Evaluate apply URL against policy.
@@ -60,13 +160,15 @@ def evaluate_apply_url(
         - Empty URL: blocked (missing_url)
         - Non-HTTPS: blocked (non_https)
         - Malformed: blocked (malformed)
-        - Known ATS domain: allowed
+        - Known ATS domain or subdomain: allowed
         - Company domain (if provided): allowed
         - Unknown domain: manual_review (unknown_domain)
 
     Args:
         url: Application URL to evaluate
         company_domains: Optional set of known company domains to allow
+        normalized: True if company_domains was already passed through
+            normalize_company_domains() (skips re-normalizing per call)
 
     Returns:
         Dict with:
@@ -79,76 +181,71 @@ def evaluate_apply_url(
         - Deterministic: no network calls, no DNS lookups
         - Case-insensitive domain matching
         - www. prefix is normalized away
+        - Company domains match exactly (one set lookup, independent of set
+          size); unlike known ATS domains, their subdomains are not implied
     """
-    if company_domains is None:
-        company_domains = set()
-
-    # Normalize company domains
-    normalized_company_domains = {normalize_domain(d) for d in company_domains}
-
     # Check for empty URL
     if not url or not url.strip():
-        return {
-            "url_valid": False,
-            "url_domain": "",
-            "url_policy": "blocked",
-            "url_reason": "missing_url",
-        }
-
-    # Parse URL
-    try:
-        parsed = urlparse(url)
-    except Exception:
-        return {
-            "url_valid": False,
-            "url_domain": "",
-            "url_policy": "blocked",
-            "url_reason": "malformed",
-        }
-
-    # Check scheme
-    if parsed.scheme != "https":
-        return {
-            "url_valid": False,
-            "url_domain": "",
-            "url_policy": "blocked",
-            "url_reason": "non_https",
-        }
-
-    # Extract and normalize domain
-    domain = parsed.netloc
-    if not domain:
-        return {
-            "url_valid": False,
-            "url_domain": "",
-            "url_policy": "blocked",
-            "url_reason": "malformed",
-        }
+        return _blocked("missing_url")
+
+    match = _HTTPS_NETLOC_RE.match(url)
+    if match is not None:
+        domain = match.group(1)
+    else:
+        # Parse URL
+        try:
+            parsed = urlparse(url)
+        except Exception:
+            return _blocked("malformed")
+
+        # Check scheme
+        if parsed.scheme != "https":
+            return _blocked("non_https")
+
+        # Extract domain
+        domain = parsed.netloc
+        if not domain:
+            return _blocked("malformed")
 
     normalized_domain = normalize_domain(domain)
 
-    # Check against known ATS domains
-    if normalized_domain in KNOWN_ATS_DOMAINS:
-        return {
-            "url_valid": True,
-            "url_domain": normalized_domain,
-            "url_policy": "allowed",
-            "url_reason": "known_ats",
-        }
-
-    # Check against company domains
-    if normalized_domain in normalized_company_domains:
-        return {
-            "url_valid": True,
-            "url_domain": normalized_domain,
-            "url_policy": "allowed",
-            "url_reason": "company_domain",
-        }
-
-    # Unknown domain - flag for manual review
+    # Known ATS domains (and subdomains) first, then company domains;
+    # anything else is flagged for manual review
+    if is_known_ats_domain(normalized_domain):
+        policy, reason = "allowed", "known_ats"
+    elif company_domains and normalized_domain in (
+        company_domains if normalized else normalize_company_domains(company_domains)
+    ):
+        policy, reason = "allowed", "company_domain"
+    else:
+        policy, reason = "manual_review", "unknown_domain"
+
     return {
         "url_valid": True,
         "url_domain": normalized_domain,
-        "url_policy": "manual_review",
-        "url_reason": "unknown_domain",
+        "url_policy": policy,
+        "url_reason": reason,
     }
+
+
+def evaluate_apply_urls(
+    urls: list[str],
+    company_domains: set[str] | frozenset[str] | None = None,
+) -> list[dict]:
+    """
+    Evaluate many apply URLs against policy.
+
+    Company domains are normalized once for the whole batch.
+
+    Args:
+        urls: Application URLs to evaluate
+        company_domains: Optional set of known company domains to allow
+
+    Returns:
+        List of evaluate_apply_url() results, in input order
+    """
+    normalized_company_domains = normalize_company_domains(company_domains)
+    return [
+        evaluate_apply_url(url, normalized_company_domains, normalized=True)
+        for url in urls
+    ]
@@ -1,16 +1,72 @@
 """
-XLSX key-value pair reader using stdlib only.
+XLSX key-value pair reader using stdlib only (lxml is used when available).
 
 Reads key-value pairs from XLSX files (column A = key, column B = value).
 """
 
 import re
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
+from itertools import chain
 from pathlib import Path
 
+try:
+    # Optional accelerator: libxml2-backed parsing with C-level tag filtering
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
 
-def read_xlsx_key_value_pairs(path: str, sheet_index: int = 0) -> dict[str, str]:
+# Parse errors raised by whichever XML backend is active
+_XML_PARSE_ERRORS: tuple = (ET.ParseError,)
+if _lxml_etree is not None:
+    _XML_PARSE_ERRORS += (_lxml_etree.XMLSyntaxError,)
+
+
+# SpreadsheetML namespace and namespace-qualified tags
+_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_ROW = f"{{{_NS}}}row"
+_DIMENSION = f"{{{_NS}}}dimension"
+_C = f"{{{_NS}}}c"
+_V = f"{{{_NS}}}v"
+_IS = f"{{{_NS}}}is"
+_SI = f"{{{_NS}}}si"
+_T = f"{{{_NS}}}t"
+
+# Trailing row number of a cell reference (e.g. "12" in "AB12")
+_ROW_NUMBER_RE = re.compile(r"(\d+)$")
+
+
+def _iterparse(stream, events: tuple, tag: str | tuple[str, ...]):
+    """
+    Iterate (event, element) pairs for one or more namespace-qualified tags.
+
+    Uses lxml when installed (non-matching nodes are skipped in C, external
+    entities are never resolved), otherwise stdlib ElementTree.
+    """
+    if _lxml_etree is not None:
+        return _lxml_etree.iterparse(
+            stream, events=events, tag=tag, resolve_entities=False
+        )
+    tags = (tag,) if isinstance(tag, str) else tag
+    return (
+        (event, elem)
+        for event, elem in ET.iterparse(stream, events=events)
+        if elem.tag in tags
+    )
+
+
+def _release(elem) -> None:
+    """Free a processed element (and, under lxml, its processed siblings)."""
+    elem.clear()
+    if _lxml_etree is not None:
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def read_xlsx_key_value_pairs(
+    path: str, sheet_index: int = 0, max_rows: int | None = None
+) -> dict[str, str]:
     """
     Read key-value pairs from XLSX file.
 
@@ -21,6 +77,8 @@ def read_xlsx_key_value_pairs(path: str, sheet_index: int = 0) -> dict[str, str]
     Args:
         path: Path to .xlsx file
         sheet_index: Sheet index to read (default 0 = first sheet)
+        max_rows: Stop reading after this row number (default None = no
+            limit beyond the sheet's <dimension> range)
 
     Returns:
         Dict mapping keys to values (all as strings)
@@ -36,121 +94,207 @@ def read_xlsx_key_value_pairs(path: str, sheet_index: int = 0) -> dict[str, str]
 
     try:
         with zipfile.ZipFile(path, "r") as xlsx_zip:
-            # Read shared strings (string pool)
-            shared_strings = _read_shared_strings(xlsx_zip)
-
-            # Read the sheet
+            # Open the sheet as a stream
             sheet_name = f"xl/worksheets/sheet{sheet_index + 1}.xml"
             try:
-                sheet_xml = xlsx_zip.read(sheet_name)
+                sheet_stream = xlsx_zip.open(sheet_name)
             except KeyError:
                 raise ValueError(f"Sheet {sheet_index} not found in XLSX")
 
-            # Parse sheet XML and extract key-value pairs
-            return _extract_key_value_pairs(sheet_xml, shared_strings)
+            # Parse the sheet first; shared strings are only referenced
+            # by index at this point
+            with sheet_stream:
+                keys, values = _read_key_value_cells(sheet_stream, max_rows)
+
+            # Read only the shared strings the A/B cells actually reference
+            needed = {cell for cell in chain(keys, values) if isinstance(cell, int)}
+            shared_strings = _read_shared_strings(xlsx_zip, needed)
+
+            return _resolve_key_value_pairs(keys, values, shared_strings)
 
     except zipfile.BadZipFile:
         raise ValueError(f"Invalid XLSX file: {path}")
 
 
-def _read_shared_strings(xlsx_zip: zipfile.ZipFile) -> list[str]:
+def _read_shared_strings(
+    xlsx_zip: zipfile.ZipFile, needed: set[int]
+) -> dict[int, str]:
     """
-    Read shared strings table from XLSX.
+    Read the referenced entries of the shared strings table from XLSX.
 
-    Shared strings are stored in xl/sharedStrings.xml.
+    Shared strings are stored in xl/sharedStrings.xml. The table is
+    streamed with iterparse; only indices in ``needed`` are kept and
+    parsing stops after the highest needed index.
 
     Args:
         xlsx_zip: Open XLSX ZipFile
+        needed: Shared string indices referenced by the sheet
 
     Returns:
-        List of strings indexed by their position
+        Dict mapping shared string index to its text
     """
+    if not needed:
+        # Sheet only has inline/numeric values
+        return {}
+
     try:
-        shared_strings_xml = xlsx_zip.read("xl/sharedStrings.xml")
+        stream = xlsx_zip.open("xl/sharedStrings.xml")
     except KeyError:
         # No shared strings (all values are inline or numeric)
-        return []
+        return {}
 
+    last_needed = max(needed)
+    strings = {}
     try:
-        root = ET.fromstring(shared_strings_xml)
-    except ET.ParseError:
-        return []
-
-    # Namespace
-    ns = {"": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
-
-    strings = []
-    for si in root.findall("si", ns):
-        # Text can be in <t> or <r><t> (rich text)
-        text_parts = []
-        for t in si.findall(".//t", ns):
-            if t.text:
-                text_parts.append(t.text)
-        strings.append("".join(text_parts))
+        with stream:
+            for index, (_event, elem) in enumerate(
+                _iterparse(stream, ("end",), _SI)
+            ):
+                if index in needed:
+                    # Text can be in <t> or <r><t> (rich text); entries
+                    # repeat across cells, so share one str per value
+                    strings[index] = sys.intern(
+                        "".join(t.text for t in elem.iter(_T) if t.text)
+                    )
+                _release(elem)
+                if index >= last_needed:
+                    break
+    except _XML_PARSE_ERRORS:
+        return {}
 
     return strings
 
 
-def _extract_key_value_pairs(
-    sheet_xml: bytes, shared_strings: list[str]
-) -> dict[str, str]:
+def _read_key_value_cells(
+    sheet_stream, max_rows: int | None = None
+) -> tuple[list[str | int], list[str | int]]:
     """
-    Extract key-value pairs from sheet XML.
+    Read raw column A/B cell values from sheet XML.
 
-    Expects column A = keys, column B = values.
+    Rows are streamed with iterparse and released as soon as they have been
+    read. Keys and values are collected into two parallel lists (one entry
+    per row that has both an A and a B cell). Shared string cells are
+    returned as their int index so the string table can be loaded
+    afterwards, restricted to what is referenced.
+
+    Parsing stops at the first row past ``max_rows`` or past the last row
+    of the sheet's <dimension> range, so trailing formatted-but-empty rows
+    are never parsed.
 
     Args:
-        sheet_xml: Sheet XML content
-        shared_strings: Shared strings lookup table
+        sheet_stream: Binary file-like object with sheet XML content
+        max_rows: Optional last row number to read
 
     Returns:
-        Dict of key -> value pairs
+        (keys, values) raw cell values in row order
     """
+    keys = []
+    values = []
+    last_row = max_rows
+    row_number = 0
+
     try:
-        root = ET.fromstring(sheet_xml)
-    except ET.ParseError:
-        return {}
+        for _event, elem in _iterparse(sheet_stream, ("end",), (_DIMENSION, _ROW)):
+            if elem.tag == _DIMENSION:
+                # <dimension> precedes <sheetData>
+                dimension_row = _get_dimension_last_row(elem.get("ref", ""))
+                if dimension_row is not None and (
+                    last_row is None or dimension_row < last_row
+                ):
+                    last_row = dimension_row
+                continue
+
+            row = elem
+            # Row numbers are 1-based; "r" is optional and defaults to the next row
+            row_ref = row.get("r")
+            row_number = int(row_ref) if row_ref and row_ref.isdigit() else row_number + 1
+            if last_row is not None and row_number > last_row:
+                break
+
+            # Get cells A and B (direct children; no per-row findall)
+            cell_a = None
+            cell_b = None
+            for cell in row:
+                if cell.tag != _C:
+                    continue
+
+                col = _get_column_from_ref(cell.get("r", ""))
+                if col == "A":
+                    cell_a = cell
+                elif col == "B":
+                    cell_b = cell
+
+                if cell_a is not None and cell_b is not None:
+                    keys.append(_get_cell_value(cell_a))
+                    values.append(_get_cell_value(cell_b))
+                    break
+
+            # Release the processed row
+            _release(row)
+    except _XML_PARSE_ERRORS:
+        return [], []
+
+    return keys, values
+
+
+def _get_dimension_last_row(ref: str) -> int | None:
+    """
+    Get the last row number from a <dimension ref="A1:B20"> range.
 
-    # Namespace
-    ns = {"": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+    A single-cell ref (e.g. "A1") is ignored: some writers emit it
+    regardless of the data actually present.
 
-    # Find all rows with data
-    rows = root.findall(".//row", ns)
+    Args:
+        ref: Dimension range reference
 
-    key_value_pairs = {}
+    Returns:
+        Last row number, or None if the ref is missing or unusable
+    """
+    if ":" not in ref:
+        return None
 
-    for row in rows:
-        cells = row.findall("c", ns)
-        if len(cells) < 2:
-            continue  # Need at least 2 cells
+    match = _ROW_NUMBER_RE.search(ref)
+    return int(match.group(1)) if match else None
 
-        # Get cells A and B
-        cell_a = None
-        cell_b = None
 
-        for cell in cells:
-            cell_ref = cell.get("r", "")
-            col = _get_column_from_ref(cell_ref)
+def _resolve_key_value_pairs(
+    keys: list[str | int],
+    values: list[str | int],
+    shared_strings: dict[int, str],
+) -> dict[str, str]:
+    """
+    Resolve parallel raw key/value lists into the final key-value dict.
 
-            if col == "A":
-                cell_a = cell
-            elif col == "B":
-                cell_b = cell
+    Rows with a blank key are skipped; keys are stripped.
 
-        if cell_a is None or cell_b is None:
-            continue
+    Args:
+        keys: Raw column A values from _read_key_value_cells()
+        values: Raw column B values from _read_key_value_cells()
+        shared_strings: Shared string index -> text lookup
 
-        # Extract key from column A
-        key = _get_cell_value(cell_a, shared_strings, ns)
-        if not key or not key.strip():
-            continue
+    Returns:
+        Dict of key -> value pairs
+    """
+    if shared_strings:
+        keys = [_resolve_cell_value(raw, shared_strings) for raw in keys]
+        values = [_resolve_cell_value(raw, shared_strings) for raw in values]
+    else:
+        # No string table: only unresolvable indices can remain
+        keys = [raw if isinstance(raw, str) else "" for raw in keys]
+        values = [raw if isinstance(raw, str) else "" for raw in values]
 
-        # Extract value from column B
-        value = _get_cell_value(cell_b, shared_strings, ns)
+    return {
+        sys.intern(stripped): value
+        for key, value in zip(keys, values)
+        if (stripped := key.strip())
+    }
 
-        key_value_pairs[key.strip()] = value
 
-    return key_value_pairs
+def _resolve_cell_value(raw: str | int, shared_strings: dict[int, str]) -> str:
+    """Return a raw cell value as text, looking up shared string indices."""
+    if isinstance(raw, int):
+        return shared_strings.get(raw, "")
+    return raw
 
 
 def _get_column_from_ref(cell_ref: str) -> str:
@@ -168,61 +312,66 @@ def _get_column_from_ref(cell_ref: str) -> str:
     Returns:
         Column letter(s)
     """
+    # Fast path: single-letter column (the A/B case this reader cares about)
+    if len(cell_ref) > 1 and "A" <= cell_ref[0] <= "Z" and cell_ref[1].isdigit():
+        return cell_ref[0]
+
     # Extract letters from the beginning
-    match = re.match(r"^([A-Z]+)", cell_ref)
-    if match:
-        return match.group(1)
-    return ""
+    end = 0
+    while end < len(cell_ref) and "A" <= cell_ref[end] <= "Z":
+        end += 1
+    return cell_ref[:end]
+
+
+def _shared_string_index(value: str) -> int:
+    """Parse a shared string index (-1 if unparseable, which resolves to "")."""
+    try:
+        return int(value)
+    except ValueError:
+        return -1
+
+
+def _boolean_text(value: str) -> str:
+    """Render a boolean cell value."""
+    return "True" if value == "1" else "False"
+
+
+# Cell type ("t" attribute) -> <v> text converter; numbers, plain text and
+# unknown types pass the text through unchanged
+_CELL_VALUE_HANDLERS = {
+    "s": _shared_string_index,
+    "b": _boolean_text,
+}
 
 
-def _get_cell_value(cell, shared_strings: list[str], ns: dict) -> str:
+def _get_cell_value(cell) -> str | int:
     """
-    Get value from cell element.
+    Get raw value from cell element.
 
     Handles:
-    - Shared strings (type="s")
+    - Shared strings (type="s") -> int index into the shared strings table
     - Inline strings (type="inlineStr")
     - Numbers (no type or type="n")
     - Booleans (type="b")
 
     Args:
         cell: Cell XML element
-        shared_strings: Shared strings lookup
-        ns: XML namespace dict
 
     Returns:
-        Cell value as string
+        Cell value as string, or shared string index as int
+        (-1 for an unparseable index, which resolves to "")
     """
-    cell_type = cell.get("t", "")
-
     # Find value element
-    value_elem = cell.find("v", ns)
+    value_elem = cell.find(_V)
     if value_elem is None or value_elem.text is None:
         # Try inline string
-        inline_str = cell.find("is", ns)
+        inline_str = cell.find(_IS)
         if inline_str is not None:
-            text_parts = []
-            for t in inline_str.findall(".//t", ns):
-                if t.text:
-                    text_parts.append(t.text)
-            return "".join(text_parts)
+            return "".join(t.text for t in inline_str.iter(_T) if t.text)
         return ""
 
-    value = value_elem.text
-
-    # Shared string reference
-    if cell_type == "s":
-        try:
-            index = int(value)
-            if 0 <= index < len(shared_strings):
-                return shared_strings[index]
-        except (ValueError, IndexError):
-            pass
-        return ""
-
-    # Boolean
-    if cell_type == "b":
-        return "True" if value == "1" else "False"
-
-    # Number or plain text
-    return value
+    handler = _CELL_VALUE_HANDLERS.get(cell.get("t", ""))
+    if handler is None:
+        # Number or plain text
+        return value_elem.text
+    return handler(value_elem.text)
@@ -6,6 +6,11 @@ Provides minimal wrapper for listing and downloading files from Google Drive.
 
 import io
 import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -19,6 +24,36 @@ class DriveClient:
     # Read-only Drive scope
     SCOPES = ["https://www.googleapis.com/auth/drive.readonly"]
 
+    # Download chunk size (the MediaIoBaseDownload default is 100 KB, which
+    # costs one HTTP round-trip per 100 KB of a multi-MB resume)
+    DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+    # Maximum page size accepted by the Drive files.list endpoint
+    LIST_PAGE_SIZE = 1000
+
+    # Parent folders combined into one files.list query by list_children_batch
+    LIST_BATCH_SIZE = 50
+
+    # File metadata returned for folder children (size/md5 let syncs skip
+    # files that are already staged; Google-native files have neither)
+    CHILD_FIELDS = "id, name, mimeType, size, modifiedTime, md5Checksum"
+
+    # Default number of parallel download workers
+    DOWNLOAD_WORKERS = 8
+
+    # Default number of list_children_batch queries run in parallel
+    LIST_WORKERS = 4
+
+    # Download retry policy: up to RETRY_ATTEMPTS tries with random
+    # exponential backoff (uniform in [0, min(RETRY_MAX_DELAY, base * 2^n)])
+    RETRY_ATTEMPTS = 5
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 8.0
+
+    # Transient HTTP statuses (403 is retried only for rate-limit reasons)
+    RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RATE_LIMIT_REASONS = (b"rateLimitExceeded", b"userRateLimitExceeded")
+
     def __init__(self):
         """
         Initialize Drive client with Service Account credentials.
@@ -30,6 +65,7 @@ class DriveClient:
         try:
             from google.oauth2 import service_account
             from googleapiclient.discovery import build
+            from googleapiclient.errors import HttpError
             from googleapiclient.http import MediaIoBaseDownload
         except ImportError as e:
             raise ImportError(
@@ -58,6 +94,28 @@ class DriveClient:
         # Build Drive service
         self.service = build("drive", "v3", credentials=self.credentials)
         self._media_download_class = MediaIoBaseDownload
+        self._http_error_class = HttpError
+
+        # One message per retried download (thread-safe appends); callers
+        # such as drive_sync drain it into their warnings
+        self.retry_warnings = deque()
+
+        # Service objects are not thread-safe (shared httplib2 connection),
+        # so worker threads each build their own
+        self._build = build
+        self._main_thread = threading.get_ident()
+        self._thread_local = threading.local()
+
+    def _get_service(self):
+        """Return the Drive service for the calling thread."""
+        if threading.get_ident() == self._main_thread:
+            return self.service
+
+        service = getattr(self._thread_local, "service", None)
+        if service is None:
+            service = self._build("drive", "v3", credentials=self.credentials)
+            self._thread_local.service = service
+        return service
 
     def list_children(self, folder_id: str) -> list[dict]:
         """
@@ -67,7 +125,8 @@ class DriveClient:
             folder_id: Google Drive folder ID
 
         Returns:
-            List of dicts with keys: id, name, mimeType
+            List of dicts with keys: id, name, mimeType, plus size,
+            modifiedTime and md5Checksum for binary files
 
         Notes:
             - Only lists immediate children (not recursive)
@@ -76,29 +135,97 @@ class DriveClient:
         """
         query = f"'{folder_id}' in parents and trashed = false"
 
-        results = []
+        results = list(self._list_files(query, self.CHILD_FIELDS))
+
+        # Sort by name for deterministic ordering
+        results.sort(key=lambda x: x["name"])
+
+        return results
+
+    def list_children_batch(
+        self, folder_ids: list[str], workers: int | None = None
+    ) -> dict[str, list[dict]]:
+        """
+        List immediate children of several folders with combined queries.
+
+        Up to LIST_BATCH_SIZE folders are listed per query using
+        ``('<id1>' in parents or '<id2>' in parents ...)``, and results are
+        grouped back by parent. This replaces one request per folder with
+        one request per batch (plus pagination). When there are several
+        batches they are listed concurrently.
+
+        Args:
+            folder_ids: Google Drive folder IDs
+            workers: Number of batches listed in parallel (default LIST_WORKERS)
+
+        Returns:
+            Dict mapping each folder ID to its children, in the same format
+            and order as list_children()
+        """
+        if workers is None:
+            workers = self.LIST_WORKERS
+
+        results = {folder_id: [] for folder_id in folder_ids}
+        unique_ids = list(results)
+        batches = [
+            unique_ids[start:start + self.LIST_BATCH_SIZE]
+            for start in range(0, len(unique_ids), self.LIST_BATCH_SIZE)
+        ]
+
+        # Pages within a batch are sequential (page tokens), batches are not
+        if len(batches) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
+                batch_files = list(executor.map(self._list_parents_batch, batches))
+        else:
+            batch_files = [self._list_parents_batch(batch) for batch in batches]
+
+        for file_items in batch_files:
+            for file_item in file_items:
+                parents = file_item.pop("parents", [])
+                for parent_id in parents:
+                    if parent_id in results:
+                        results[parent_id].append(file_item)
+
+        # Sort by name for deterministic ordering
+        for children in results.values():
+            children.sort(key=lambda x: x["name"])
+
+        return results
+
+    def _list_parents_batch(self, folder_ids: list[str]) -> list[dict]:
+        """Fetch every page of children for one batch of parent folders."""
+        parents_query = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+        query = f"({parents_query}) and trashed = false"
+        return list(self._list_files(query, f"{self.CHILD_FIELDS}, parents"))
+
+    def _list_files(self, query: str, file_fields: str):
+        """
+        Yield files matching a Drive query, following pagination.
+
+        Args:
+            query: Drive files.list query string
+            file_fields: Comma-separated file fields to request
+
+        Yields:
+            File metadata dicts
+        """
         page_token = None
 
         while True:
-            response = self.service.files().list(
+            response = self._get_service().files().list(
                 q=query,
                 spaces="drive",
-                fields="nextPageToken, files(id, name, mimeType)",
+                fields=f"nextPageToken, files({file_fields})",
+                pageSize=self.LIST_PAGE_SIZE,
                 pageToken=page_token,
             ).execute()
 
-            files = response.get("files", [])
-            results.extend(files)
+            yield from response.get("files", [])
 
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
 
-        # Sort by name for deterministic ordering
-        results.sort(key=lambda x: x["name"])
-
-        return results
-
     def download_file(self, file_id: str, dest_path: str) -> None:
         """
         Download a file from Google Drive.
@@ -107,21 +234,101 @@ class DriveClient:
             file_id: Google Drive file ID
             dest_path: Local destination file path
 
+        Raises:
+            HttpError: If the download still fails after RETRY_ATTEMPTS
+                tries, or fails with a non-transient status
+
         Notes:
             - Creates parent directories if needed
             - Overwrites existing file
-            - Uses chunked download for large files
+            - Uses chunked download (DOWNLOAD_CHUNK_SIZE per request)
+            - Quota (429, rate-limit 403) and 5xx errors are retried with
+              random exponential backoff; each retry is recorded in
+              retry_warnings
         """
         # Create parent directories
         dest_path_obj = Path(dest_path)
         dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
 
+        for attempt in range(1, self.RETRY_ATTEMPTS + 1):
+            try:
+                self._download_once(file_id, dest_path)
+                return
+            except self._http_error_class as e:
+                status = self._retryable_status(e)
+                if status is None or attempt == self.RETRY_ATTEMPTS:
+                    raise
+
+            self.retry_warnings.append(
+                f"Retrying download of {file_id} after HTTP {status} "
+                f"(attempt {attempt}/{self.RETRY_ATTEMPTS})"
+            )
+            ceiling = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+            time.sleep(random.uniform(0, ceiling))
+
+    def _download_once(self, file_id: str, dest_path: str) -> None:
+        """Download file_id to dest_path in DOWNLOAD_CHUNK_SIZE chunks."""
         # Request file download
-        request = self.service.files().get_media(fileId=file_id)
+        request = self._get_service().files().get_media(fileId=file_id)
 
         # Download to file
         with open(dest_path, "wb") as f:
-            downloader = self._media_download_class(f, request)
+            downloader = self._media_download_class(
+                f, request, chunksize=self.DOWNLOAD_CHUNK_SIZE
+            )
             done = False
             while not done:
                 status, done = downloader.next_chunk()
+
+    def _retryable_status(self, error) -> int | None:
+        """Return the HTTP status of a transient Drive error, else None."""
+        try:
+            status = int(error.resp.status)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        if status in self.RETRYABLE_STATUSES:
+            return status
+
+        if status == 403:
+            content = getattr(error, "content", b"") or b""
+            if any(reason in content for reason in self.RATE_LIMIT_REASONS):
+                return status
+
+        return None
+
+    def download_files(
+        self, pairs: list[tuple[str, str]], workers: int | None = None
+    ) -> None:
+        """
+        Download several files from Google Drive in parallel.
+
+        Args:
+            pairs: List of (file_id, dest_path) tuples
+            workers: Number of download threads (default DOWNLOAD_WORKERS)
+
+        Raises:
+            Exception: The first download error, after all downloads finish
+
+        Notes:
+            - Downloads are I/O bound, so threads overlap network round-trips
+            - Each worker thread uses its own Drive service object
+            - Falls back to sequential download for a single file
+        """
+        if workers is None:
+            workers = self.DOWNLOAD_WORKERS
+
+        if len(pairs) <= 1 or workers <= 1:
+            for file_id, dest_path in pairs:
+                self.download_file(file_id, dest_path)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(pairs))) as executor:
+            futures = [
+                executor.submit(self.download_file, file_id, dest_path)
+                for file_id, dest_path in pairs
+            ]
+
+        # Surface the first failure in submission order
+        for future in futures:
+            future.result()
@@ -4,19 +4,46 @@ Google Drive candidate folder synchronization.
 Stages candidate folders from Google Drive to local filesystem for processing.
 """
 
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 from jobflow.app.core.batch_runner import safe_slug
 
 
 # Supported file extensions
-RESUME_EXTENSIONS = {".txt", ".md", ".docx"}
-APPLICATION_EXTENSIONS = {".xlsx"}
-DEPRECATED_EXTENSIONS = {".doc"}  # Warn but skip
+RESUME_EXTENSIONS = frozenset({".txt", ".md", ".docx"})
+APPLICATION_EXTENSIONS = frozenset({".xlsx"})
+DEPRECATED_EXTENSIONS = frozenset({".doc"})  # Warn but skip
+
+# Extension -> downloaded file type (single lookup per file)
+EXTENSION_FILE_TYPES = {
+    **{ext: "resume" for ext in RESUME_EXTENSIONS},
+    **{ext: "application" for ext in APPLICATION_EXTENSIONS},
+}
+
+# Read size when hashing already-staged files
+_MD5_CHUNK_SIZE = 1024 * 1024
+
+# Content-addressed store under the staging dir: files with the same Drive
+# md5Checksum are downloaded once to <staging>/.cas/<md5> and hard-linked
+# into each candidate folder (so those staged copies share one inode)
+CAS_DIR_NAME = ".cas"
+_MD5_RE = re.compile(r"[0-9a-f]{32}")
 
 # Drive folder mime type
 DRIVE_FOLDER_MIME = "application/vnd.google-apps.folder"
 
+# Number of concurrent downloads (kept small to stay under Drive's per-user quota)
+DRIVE_WORKERS_ENV = "JOBFLOW_DRIVE_WORKERS"
+DEFAULT_DRIVE_WORKERS = 8
+
 
 def sync_candidate_folders(
     drive_client,
@@ -49,7 +76,79 @@ def sync_candidate_folders(
         - Skips .doc files with warning
         - Creates staging_dir/<safe_slug(folder_name)>/ for each candidate
         - Preserves original filenames
+        - Files already staged with matching size (and MD5, when Drive
+          reports one) are not re-downloaded; they count as skipped and
+          are listed with "cached": True
+        - Downloads run concurrently (DRIVE_WORKERS_ENV threads, default 8)
+        - Staged files with the same Drive md5Checksum are hard links to
+          one file in staging_dir/.cas/ (copies where links are unsupported);
+          treat staged files as read-only, since editing one in place edits
+          every candidate's copy
+        - Use iter_candidates() to process candidates one at a time without
+          holding every candidate's details in memory
+    """
+    warnings = []
+    candidates_details = list(iter_candidates(
+        drive_client,
+        root_folder_id,
+        staging_dir,
+        dry_run=dry_run,
+        max_candidates=max_candidates,
+        warnings=warnings,
+    ))
+
+    return {
+        "processed": len(candidates_details),
+        "downloaded": sum(c["files_downloaded"] for c in candidates_details),
+        "skipped": sum(c["files_skipped"] for c in candidates_details),
+        "warnings": warnings,
+        "candidates": candidates_details,
+    }
+
+
+def iter_candidates(
+    drive_client,
+    root_folder_id: str,
+    staging_dir: str,
+    dry_run: bool = False,
+    max_candidates: int | None = None,
+    warnings: list[str] | None = None,
+):
+    """
+    Sync candidate folders, yielding each candidate's details once staged.
+
+    Same behavior as sync_candidate_folders(), but candidates are produced
+    incrementally (in folder order) as soon as their files are downloaded,
+    so callers can stream results instead of materializing them all.
+
+    Args:
+        drive_client: DriveClient instance
+        root_folder_id: Google Drive ID of root folder containing candidate folders
+        staging_dir: Local directory to stage candidates
+        dry_run: If True, list files but don't download (default False)
+        max_candidates: Optional limit on number of candidates to process
+        warnings: Optional list that skipped-file warnings are appended to
+
+    Yields:
+        Per-candidate details dicts (see sync_candidate_folders())
+
+    Notes:
+        - Downloads of up to DRIVE_WORKERS_ENV candidates overlap; a
+          candidate is yielded once all of its downloads have finished
+        - The first download error is raised when its candidate is reached
+        - Files sharing a Drive md5Checksum are downloaded once into
+          staging_dir/.cas/ and hard-linked (or copied) into each candidate;
+          linked copies share one file, so staged files must be treated as
+          read-only
+        - A stale blob is refreshed by downloading to a temporary file and
+          renaming it over the old one, so files linked from the old blob
+          are never rewritten (not even by a failed download)
+        - Download retries reported by the client (retry_warnings) are
+          added to warnings
     """
+    if warnings is None:
+        warnings = []
+
     staging_path = Path(staging_dir)
 
     # Create staging dir if not dry run
@@ -58,103 +157,303 @@ def sync_candidate_folders(
 
     # List candidate folders (immediate children of root)
     children = drive_client.list_children(root_folder_id)
-    candidate_folders = [
+    folder_iter = (
         child for child in children
         if child["mimeType"] == DRIVE_FOLDER_MIME
-    ]
+    )
 
-    if not candidate_folders:
-        return {
-            "processed": 0,
-            "downloaded": 0,
-            "skipped": 0,
-            "warnings": [],
-            "candidates": [],
-        }
-
-    # Limit candidates if specified
+    # Limit candidates if specified (stop filtering once enough are found)
     if max_candidates:
-        candidate_folders = candidate_folders[:max_candidates]
+        folder_iter = islice(folder_iter, max_candidates)
+    candidate_folders = list(folder_iter)
 
-    # Process each candidate folder
-    processed = 0
-    total_downloaded = 0
-    total_skipped = 0
-    warnings = []
-    candidates_details = []
-
-    for folder in candidate_folders:
-        folder_name = folder["name"]
-        folder_id = folder["id"]
-
-        # Create safe slug for local directory
-        slug = safe_slug(folder_name)
-        candidate_staging = staging_path / slug
-
-        # Create candidate directory if not dry run
-        if not dry_run:
-            candidate_staging.mkdir(parents=True, exist_ok=True)
-
-        # List files in candidate folder
-        files = drive_client.list_children(folder_id)
-
-        # Filter to downloadable files
-        downloaded_files = []
-        skipped_files = []
-
-        for file_item in files:
-            # Skip subfolders
-            if file_item["mimeType"] == DRIVE_FOLDER_MIME:
-                continue
-
-            file_name = file_item["name"]
-            file_id = file_item["id"]
-            file_ext = Path(file_name).suffix.lower()
-
-            # Check if supported
-            if file_ext in RESUME_EXTENSIONS or file_ext in APPLICATION_EXTENSIONS:
-                # Download file
-                dest_path = candidate_staging / file_name
-
-                if not dry_run:
-                    drive_client.download_file(file_id, str(dest_path))
-
-                downloaded_files.append({
-                    "name": file_name,
-                    "path": str(dest_path) if not dry_run else str(dest_path),
-                    "type": "resume" if file_ext in RESUME_EXTENSIONS else "application",
-                })
-                total_downloaded += 1
-
-            elif file_ext in DEPRECATED_EXTENSIONS:
-                # Warn about deprecated format
-                warning_msg = f"Skipped deprecated format: {folder_name}/{file_name} ({file_ext} not supported, use .docx)"
-                warnings.append(warning_msg)
-                skipped_files.append(file_name)
-                total_skipped += 1
-
-            else:
-                # Skip unsupported file type silently
-                skipped_files.append(file_name)
-                total_skipped += 1
-
-        # Add candidate details
-        candidates_details.append({
-            "name": folder_name,
-            "slug": slug,
-            "folder_path": str(candidate_staging),
-            "drive_folder_id": folder_id,
-            "files_downloaded": len(downloaded_files),
-            "files_skipped": len(skipped_files),
-            "files": downloaded_files,
-        })
-
-        processed += 1
+    if not candidate_folders:
+        return
 
-    return {
-        "processed": processed,
-        "downloaded": total_downloaded,
-        "skipped": total_skipped,
-        "warnings": warnings,
-        "candidates": candidates_details,
+    # List all candidate folders' files up front (batched when supported)
+    children_by_folder = _list_folder_children(
+        drive_client, [folder["id"] for folder in candidate_folders]
+    )
+
+    workers = max(1, _get_drive_workers())
+    pending = deque()  # (details, download futures, CAS links) in folder order
+    blob_futures = {}  # md5Checksum -> download future for its CAS file
+    cas_dir = staging_path / CAS_DIR_NAME
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for folder in candidate_folders:
+            details, downloads = _stage_candidate(
+                folder,
+                children_by_folder[folder["id"]],
+                staging_path,
+                dry_run,
+                warnings,
+            )
+            futures = []
+            links = []
+            for file_item, dest_path in downloads:
+                md5 = file_item.get("md5Checksum")
+                if not md5 or not _MD5_RE.fullmatch(md5):
+                    futures.append(executor.submit(
+                        drive_client.download_file, file_item["id"], dest_path
+                    ))
+                    continue
+
+                # Identical content: one download per distinct blob
+                cas_path = str(cas_dir / md5)
+                future = blob_futures.get(md5)
+                if future is None:
+                    future = executor.submit(
+                        _download_blob, drive_client, file_item, cas_path
+                    )
+                    blob_futures[md5] = future
+                futures.append(future)
+                links.append((cas_path, dest_path))
+
+            pending.append((details, futures, links))
+
+            # Yield finished candidates in order, bounding candidates in flight
+            while pending and (
+                len(pending) > workers
+                or all(future.done() for future in pending[0][1])
+            ):
+                details = _finish_candidate(*pending.popleft())
+                _drain_retry_warnings(drive_client, warnings)
+                yield details
+
+        while pending:
+            details = _finish_candidate(*pending.popleft())
+            _drain_retry_warnings(drive_client, warnings)
+            yield details
+
+
+def _stage_candidate(
+    folder: dict,
+    files: list[dict],
+    staging_path: Path,
+    dry_run: bool,
+    warnings: list[str],
+) -> tuple[dict, list[tuple[str, str]]]:
+    """
+    Classify one candidate folder's files and prepare its staging directory.
+
+    Args:
+        folder: Drive folder dict (id, name)
+        files: Children of the folder
+        staging_path: Local staging root
+        dry_run: If True, create no directories and schedule no downloads
+        warnings: List that skipped-file warnings are appended to
+
+    Returns:
+        (candidate details dict, (file_item, dest_path) downloads to run)
+    """
+    folder_name = folder["name"]
+    folder_id = folder["id"]
+
+    # Create safe slug for local directory
+    slug = safe_slug(folder_name)
+    candidate_staging = staging_path / slug
+
+    # Create candidate directory if not dry run (staging_path already exists,
+    # so a single mkdir syscall suffices; re-runs hit FileExistsError)
+    if not dry_run:
+        try:
+            os.mkdir(candidate_staging)
+        except FileExistsError:
+            pass
+
+    # Per-file fields are kept as parallel lists while classifying; the
+    # output dicts are built once at the end
+    candidate_dir = str(candidate_staging)
+    names = []
+    paths = []
+    types = []
+    cached = []
+    skipped = 0
+    downloads = []
+
+    for file_item in files:
+        # Skip subfolders
+        if file_item["mimeType"] == DRIVE_FOLDER_MIME:
+            continue
+
+        file_name = file_item["name"]
+        file_ext = os.path.splitext(file_name)[1].lower()
+        file_type = EXTENSION_FILE_TYPES.get(file_ext)
+
+        # Check if supported
+        if file_type is not None:
+            dest_path = os.path.join(candidate_dir, file_name)
+
+            # Already staged with matching size/checksum: skip the download
+            is_cached = not dry_run and _is_already_staged(dest_path, file_item)
+            if is_cached:
+                skipped += 1
+            elif not dry_run:
+                downloads.append((file_item, dest_path))
+
+            names.append(file_name)
+            paths.append(dest_path)
+            types.append(file_type)
+            cached.append(is_cached)
+
+        elif file_ext in DEPRECATED_EXTENSIONS:
+            # Warn about deprecated format
+            warning_msg = f"Skipped deprecated format: {folder_name}/{file_name} ({file_ext} not supported, use .docx)"
+            warnings.append(warning_msg)
+            skipped += 1
+
+        else:
+            # Skip unsupported file type silently
+            skipped += 1
+
+    staged_files = [
+        {"name": name, "path": path, "type": file_type, "cached": True}
+        if is_cached else
+        {"name": name, "path": path, "type": file_type}
+        for name, path, file_type, is_cached in zip(names, paths, types, cached)
+    ]
+
+    details = {
+        "name": folder_name,
+        "slug": slug,
+        "folder_path": candidate_dir,
+        "drive_folder_id": folder_id,
+        "files_downloaded": len(names) - sum(cached),
+        "files_skipped": skipped,
+        "files": staged_files,
     }
+    return details, downloads
+
+
+def _is_already_staged(dest_path: str, file_item: dict) -> bool:
+    """
+    Check whether dest_path already holds this Drive file.
+
+    The local size must match Drive's "size"; when Drive also reports an
+    "md5Checksum" the local file's MD5 must match too. Files without size
+    metadata (e.g. Google-native documents) are never treated as staged.
+
+    Args:
+        dest_path: Local destination path
+        file_item: Drive file metadata from list_children()
+
+    Returns:
+        True if the download can be skipped
+    """
+    size = file_item.get("size")
+    if size is None:
+        return False
+
+    try:
+        if os.stat(dest_path).st_size != int(size):
+            return False
+    except (OSError, ValueError):
+        return False
+
+    expected_md5 = file_item.get("md5Checksum")
+    if not expected_md5:
+        return True
+
+    digest = hashlib.md5(usedforsecurity=False)
+    try:
+        with open(dest_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_MD5_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError:
+        return False
+    return digest.hexdigest() == expected_md5
+
+
+def _finish_candidate(details: dict, futures: list, links: list) -> dict:
+    """
+    Wait for a candidate's downloads and link its deduplicated files.
+
+    Args:
+        details: Candidate details dict
+        futures: Download futures (failures are re-raised)
+        links: (cas_path, dest_path) pairs to place once downloads finish
+
+    Returns:
+        details
+    """
+    for future in futures:
+        future.result()
+    for cas_path, dest_path in links:
+        _link_or_copy(cas_path, dest_path)
+    return details
+
+
+def _drain_retry_warnings(drive_client, warnings: list[str]) -> None:
+    """Move download retry messages from the client (if it records any) into warnings."""
+    retry_warnings = getattr(drive_client, "retry_warnings", None)
+    while retry_warnings:
+        warnings.append(retry_warnings.popleft())
+
+
+def _download_blob(drive_client, file_item: dict, cas_path: str) -> None:
+    """
+    Download a file into the content-addressed store unless already there.
+
+    The blob may be hard-linked into candidate folders from an earlier sync,
+    so it is never written in place: the download goes to a temporary file
+    in the same directory that then replaces cas_path with a new inode.
+    """
+    if _is_already_staged(cas_path, file_item):
+        return
+    cas_dir = os.path.dirname(cas_path)
+    os.makedirs(cas_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=cas_dir, prefix=f"{os.path.basename(cas_path)}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        drive_client.download_file(file_item["id"], tmp_path)
+        os.replace(tmp_path, cas_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _link_or_copy(src: str, dest: str) -> None:
+    """Hard-link src to dest (replacing dest), copying if links are unsupported."""
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    tmp_dest = f"{dest}.{os.getpid()}.tmp"
+    try:
+        os.link(src, tmp_dest)
+    except OSError:
+        shutil.copyfile(src, tmp_dest)
+    os.replace(tmp_dest, dest)
+
+
+def _list_folder_children(drive_client, folder_ids: list[str]) -> dict[str, list[dict]]:
+    """
+    List the children of several folders.
+
+    Uses drive_client.list_children_batch() when the client provides it
+    (one Drive request per batch of folders), otherwise falls back to one
+    list_children() call per folder.
+
+    Args:
+        drive_client: DriveClient instance
+        folder_ids: Folder IDs to list
+
+    Returns:
+        Dict mapping folder ID to its children
+    """
+    list_children_batch = getattr(drive_client, "list_children_batch", None)
+    if list_children_batch is not None:
+        return list_children_batch(folder_ids)
+
+    return {folder_id: drive_client.list_children(folder_id) for folder_id in folder_ids}
+
+
+def _get_drive_workers() -> int:
+    """Read the download concurrency from DRIVE_WORKERS_ENV (default 8)."""
+    try:
+        return int(os.getenv(DRIVE_WORKERS_ENV, DEFAULT_DRIVE_WORKERS))
+    except ValueError:
+        return DEFAULT_DRIVE_WORKERS
@@ -1,25 +1,66 @@
 """
 LLM Planner Service - Advisory planning using OpenAI.
 
-This service is READ-ONLY and advisory only. It:
+This service is advisory only. It:
 - Reads directive documents
 - Calls OpenAI to generate structured plans
 - Returns suggestions as structured data
+- Caches plans as JSON under <project root>/.cache/planner (see
+  PLANNER_CACHE_DIR_ENV / PLANNER_NOCACHE_ENV); this is the only file it writes
 
 It does NOT:
 - Execute code
-- Modify files
+- Modify any other files
 - Access databases
 - Import from orchestrator, pipelines, execution, tasks, or models
 """
 
+import copy
+import hashlib
+import importlib.util
 import json
 import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import TypedDict
 
+import httpx
 from openai import OpenAI
 
+from jobflow.app.util.jsonio import dumps, loads
+
+
+# Maximum number of distinct directive versions kept by build_plan_cached()
+PLAN_CACHE_SIZE = 64
+
+# In-process plan cache: sha256(directive content) -> plan
+_plan_cache: dict[str, dict] = {}
+
+# Model and prompt revision; both are part of the on-disk plan cache key
+PLANNER_MODEL = "gpt-4o"
+PLANNER_PROMPT_VERSION = "v1"
+
+# On-disk plan cache location (override) and opt-out switch
+PLANNER_CACHE_DIR_ENV = "JOBFLOW_PLANNER_CACHE_DIR"
+PLANNER_NOCACHE_ENV = "JOBFLOW_PLANNER_NOCACHE"
+# (resolved against the project root, not the current directory, so CLIs
+# run from elsewhere still use the git-ignored <project root>/.cache/)
+DEFAULT_PLANNER_CACHE_DIR = Path(__file__).resolve().parents[3] / ".cache" / "planner"
+
+# HTTP settings for the shared OpenAI connection pool
+OPENAI_TIMEOUT_SECONDS = 60.0
+OPENAI_MAX_KEEPALIVE = 8
+
+# HTTP/2 needs the optional h2 package (pip install 'httpx[http2]')
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Reused OpenAI clients: api_key -> client (keeps TLS connections warm)
+_clients: dict[str, OpenAI] = {}
+
+# Guards _plan_cache and _clients: approve.py --parallel plans from threads
+_cache_lock = threading.Lock()
+
 
 class PlanOutput(TypedDict):
     """Structure of the plan output."""
@@ -29,12 +70,18 @@ class PlanOutput(TypedDict):
     assumptions: list[str]
 
 
+# Keys every LLM plan response must contain
+_PLAN_KEYS = frozenset(PlanOutput.__annotations__)
+
+
 def build_plan(directive_name: str) -> dict:
     """
     Build an execution plan from a directive using LLM analysis.
 
     This function is advisory only. It reads a directive document,
     sends it to OpenAI for analysis, and returns a structured plan.
+    Plans for unchanged directive text are served from the on-disk cache
+    (see PLANNER_CACHE_DIR_ENV / PLANNER_NOCACHE_ENV).
 
     Args:
         directive_name: Name of the directive (without .md extension)
@@ -47,12 +94,89 @@ def build_plan(directive_name: str) -> dict:
         ValueError: If OPENAI_API_KEY is not set
         RuntimeError: If the LLM response is invalid or cannot be parsed
     """
-    # Validate API key
+    api_key = _require_api_key()
+    directive_content = _load_directive(directive_name)
+    return _plan_from_directive_disk_cached(directive_content, api_key)
+
+
+def build_plan_cached(directive_name: str) -> dict:
+    """
+    Build a plan, reusing the LLM result for unchanged directive content.
+
+    Plans are cached in-process by the SHA-256 of the directive file, so an
+    identical directive skips the OpenAI call entirely while any edit to the
+    file produces a fresh plan.
+
+    Args:
+        directive_name: Name of the directive (without .md extension)
+
+    Returns:
+        A private copy of the plan (callers may mutate it freely)
+
+    Raises:
+        Same as build_plan()
+    """
+    api_key = _require_api_key()
+    directive_content = _load_directive(directive_name)
+    content_hash = hashlib.sha256(directive_content.encode("utf-8")).hexdigest()
+
+    with _cache_lock:
+        plan = _plan_cache.get(content_hash)
+    if plan is None:
+        # The LLM call runs unlocked; concurrent misses may both fetch a plan
+        plan = _plan_from_directive_disk_cached(directive_content, api_key)
+        with _cache_lock:
+            if content_hash not in _plan_cache and len(_plan_cache) >= PLAN_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _plan_cache[next(iter(_plan_cache))]
+            _plan_cache[content_hash] = plan
+
+    return copy.deepcopy(plan)
+
+
+def clear_plan_cache() -> None:
+    """Discard all cached plans (e.g. between tests or after key rotation)."""
+    with _cache_lock:
+        _plan_cache.clear()
+
+
+def clear_client_cache() -> None:
+    """Drop cached OpenAI clients so the next call builds a fresh one."""
+    with _cache_lock:
+        _clients.clear()
+
+
+def _get_client(api_key: str) -> OpenAI:
+    """
+    Return a shared OpenAI client for api_key, creating it on first use.
+
+    The client owns a pooled httpx.Client (HTTP/2 when h2 is installed), so
+    repeated plans skip the TCP and TLS handshake. Creation happens under
+    _cache_lock so concurrent first calls build (and keep) a single client.
+    """
+    with _cache_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            http_client = httpx.Client(
+                http2=_HTTP2_AVAILABLE,
+                timeout=OPENAI_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_keepalive_connections=OPENAI_MAX_KEEPALIVE),
+            )
+            client = OpenAI(api_key=api_key, http_client=http_client)
+            _clients[api_key] = client
+    return client
+
+
+def _require_api_key() -> str:
+    """Return OPENAI_API_KEY or raise ValueError if it is not set."""
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable is not set")
+    return api_key
+
 
-    # Load directive content
+def _load_directive(directive_name: str) -> str:
+    """Read a directive document, raising FileNotFoundError if missing."""
     directive_path = Path("directives") / f"{directive_name}.md"
     if not directive_path.exists():
         raise FileNotFoundError(
@@ -60,8 +184,58 @@ def build_plan(directive_name: str) -> dict:
             f"Please create the directive file before building a plan."
         )
 
-    directive_content = directive_path.read_text(encoding="utf-8")
+    return directive_path.read_text(encoding="utf-8")
+
+
+def _plan_from_directive_disk_cached(directive_content: str, api_key: str) -> dict:
+    """
+    Return a plan for directive_content, consulting the on-disk cache first.
+
+    Plans are stored as JSON under PLANNER_CACHE_DIR_ENV (default:
+    DEFAULT_PLANNER_CACHE_DIR, i.e. <project root>/.cache/planner) keyed
+    by a hash of the directive text, model and prompt version. Set
+    PLANNER_NOCACHE_ENV=1 to always call the LLM.
+    """
+    if os.getenv(PLANNER_NOCACHE_ENV) == "1":
+        return _plan_from_directive(directive_content, api_key)
+
+    cache_dir = Path(os.getenv(PLANNER_CACHE_DIR_ENV) or DEFAULT_PLANNER_CACHE_DIR)
+    key_material = f"{directive_content}|{PLANNER_MODEL}|{PLANNER_PROMPT_VERSION}"
+    key = hashlib.blake2b(key_material.encode("utf-8"), digest_size=16).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+
+    try:
+        plan = loads(cache_file.read_bytes())
+        if isinstance(plan, dict) and _PLAN_KEYS.issubset(plan):
+            return plan
+    except (OSError, ValueError):
+        pass  # Cache miss or unreadable entry
+
+    plan = _plan_from_directive(directive_content, api_key)
+
+    # Best-effort atomic write; a failed write only costs a future LLM call
+    tmp_file = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Unique per call: approve.py --parallel plans in several threads
+        with tempfile.NamedTemporaryFile(
+            dir=cache_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_file = tmp.name
+            tmp.write(dumps(plan))
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError):
+        if tmp_file is not None:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+
+    return plan
+
 
+def _plan_from_directive(directive_content: str, api_key: str) -> dict:
+    """Ask the LLM for a structured plan for the given directive text."""
     # Build prompt
     system_prompt = """You are a workflow planning assistant. Analyze the given directive and return a structured plan.
 
@@ -82,28 +256,30 @@ Do not include any markdown formatting, explanations, or text outside the JSON."
 Return the plan as JSON with pipeline_name, steps, risks, and assumptions."""
 
     # Call OpenAI
-    client = OpenAI(api_key=api_key)
+    client = _get_client(api_key)
 
     try:
         response = client.chat.completions.create(
-            model="gpt-4o",
+            model=PLANNER_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt}
-            ]
+            ],
+            response_format={"type": "json_object"},
         )
 
         # Extract response text
         response_text = response.choices[0].message.content
 
-        # Parse JSON
-        plan_data = json.loads(response_text)
+        # Parse JSON (orjson when available)
+        plan_data = loads(response_text)
 
-        # Validate structure
-        required_keys = {"pipeline_name", "steps", "risks", "assumptions"}
-        if not required_keys.issubset(plan_data.keys()):
-            missing = required_keys - set(plan_data.keys())
-            raise RuntimeError(f"LLM response missing required keys: {missing}")
+        # Validate structure in a single pass over the required keys
+        if not isinstance(plan_data, dict):
+            raise RuntimeError("LLM response is not a JSON object")
+        missing = _PLAN_KEYS.difference(plan_data)
+        if missing:
+            raise RuntimeError(f"LLM response missing required keys: {set(missing)}")
 
         return plan_data
 
@@ -2,7 +2,7 @@
 Tasks and async infrastructure package.
 
 This package provides the async/task boundary for background job processing.
-Currently inert - no active connections or workers.
+No workers run here; Redis connects only when configured.
 """
 
 from .redis_client import get_redis_client
@@ -2,23 +2,33 @@
 Redis client connection management.
 
 This module provides Redis connection pooling and client access.
-Currently a placeholder - no actual connection is established.
+A connection is only made when connect() is called or REDIS_URL is set.
 """
 
-from typing import Optional
+import os
+from typing import Any, Optional
+
+
+# Environment variable read by get_redis_client() on first access
+REDIS_URL_ENV = "REDIS_URL"
+
+# Seconds between pooled-connection health checks
+REDIS_HEALTH_CHECK_INTERVAL = 30
 
 
 class RedisClient:
     """
     Redis client wrapper.
 
-    Placeholder for Redis connection management.
-    No actual connection is made until configured.
+    Holds a single redis.Redis client whose ConnectionPool is shared by all
+    callers. With the hiredis package installed (pip install "redis[hiredis]")
+    redis-py selects its C RESP parser automatically.
     """
 
     def __init__(self):
-        """Initialize Redis client placeholder."""
-        self._client: Optional[any] = None
+        """Initialize an unconnected Redis client wrapper."""
+        self._client: Optional[Any] = None
+        self._pool: Optional[Any] = None
         self._connected: bool = False
 
     def connect(self, url: str) -> None:
@@ -28,19 +38,53 @@ class RedisClient:
         Args:
             url: Redis connection URL (e.g., redis://localhost:6379/0)
 
+        Raises:
+            ImportError: If the redis package is not installed
+
         Note:
-            Not implemented yet. Placeholder for future connection logic.
+            Connections are opened lazily by the pool on first command.
+            Calling connect() again replaces the previous pool.
         """
-        raise NotImplementedError("Redis connection not yet configured")
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "redis not installed. "
+                'Install with: pip install "redis[hiredis]"'
+            ) from e
+
+        self.disconnect()
+
+        self._client = redis.Redis.from_url(
+            url,
+            decode_responses=False,
+            socket_keepalive=True,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+            retry_on_timeout=True,
+        )
+        self._pool = self._client.connection_pool
+        self._connected = True
 
     def disconnect(self) -> None:
+        """Disconnect from Redis and release pooled connections."""
+        if self._pool is not None:
+            self._pool.disconnect()
+
+        self._client = None
+        self._pool = None
+        self._connected = False
+
+    @property
+    def client(self) -> Any:
         """
-        Disconnect from Redis.
+        Return the underlying redis.Redis client.
 
-        Note:
-            Not implemented yet. Placeholder for cleanup logic.
+        Raises:
+            RuntimeError: If connect() has not been called
         """
-        pass
+        if self._client is None:
+            raise RuntimeError("Redis client is not connected")
+        return self._client
 
     @property
     def is_connected(self) -> bool:
@@ -48,7 +92,7 @@ class RedisClient:
         return self._connected
 
 
-# Global Redis client instance (not initialized)
+# Global Redis client instance (created on first access)
 _redis_client: Optional[RedisClient] = None
 
 
@@ -57,12 +101,17 @@ def get_redis_client() -> RedisClient:
     Get the global Redis client instance.
 
     Returns:
-        RedisClient instance (not connected)
+        RedisClient instance, connected if REDIS_URL was set when it was
+        first requested
 
-    Note:
-        This is a placeholder. No actual Redis connection exists yet.
+    Raises:
+        ImportError: If REDIS_URL is set but redis is not installed
     """
     global _redis_client
     if _redis_client is None:
-        _redis_client = RedisClient()
+        client = RedisClient()
+        url = os.getenv(REDIS_URL_ENV)
+        if url:
+            client.connect(url)
+        _redis_client = client
     return _redis_client
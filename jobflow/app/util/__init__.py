@@ -0,0 +1,23 @@
+"""
+Utility package.
+
+Small, dependency-light helpers shared by scripts and services.
+"""
+
+from .jsonio import (
+    dumps,
+    loads,
+    read_json_file,
+    to_dict_default,
+    write_json,
+    write_json_file,
+)
+
+__all__ = [
+    "dumps",
+    "loads",
+    "read_json_file",
+    "to_dict_default",
+    "write_json",
+    "write_json_file",
+]
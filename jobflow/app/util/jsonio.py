@@ -0,0 +1,292 @@
+"""
+JSON helpers for CLI scripts and services.
+
+Serializes and parses with orjson when it is installed (C extension, works
+on bytes directly) and falls back to the stdlib json module otherwise.
+Output is always UTF-8 bytes so callers can write it without an extra
+encode step.
+"""
+
+import gzip
+import json
+import math
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# Files at least this large are parsed from a read-only mmap (orjson only),
+# so the parser reads the page cache instead of a private bytes copy
+MMAP_MIN_BYTES = 1 << 20
+
+# orjson's compact layout (the stdlib default puts a space after , and :)
+_COMPACT_SEPARATORS = (",", ":")
+
+# Stdlib encoders for the fallback path, keyed by (sort, indent, ensure_ascii)
+# and built once; json.dumps constructs a new encoder per call for
+# non-default options. allow_nan=False so non-finite floats can be written
+# as null, like orjson, instead of the non-standard NaN/Infinity tokens.
+_STDLIB_ENCODERS = {
+    (sort, indent, ensure_ascii): json.JSONEncoder(
+        sort_keys=sort,
+        indent=2 if indent else None,
+        separators=None if indent else _COMPACT_SEPARATORS,
+        ensure_ascii=ensure_ascii,
+        allow_nan=False,
+    )
+    for sort in (True, False)
+    for indent in (True, False)
+    for ensure_ascii in (True, False)
+}
+
+# Start of the stdlib's ValueError message for NaN/Infinity with allow_nan=False
+_NON_FINITE_ERROR = "Out of range float values"
+
+
+def to_dict_default(obj: Any) -> Any:
+    """
+    JSON default hook for model objects that provide to_dict().
+
+    Lets callers hand model instances (e.g. JobPosting) to dumps() directly
+    instead of building a serialized copy first.
+
+    Raises:
+        TypeError: If obj has no to_dict() method
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict(copy=False)
+
+
+def dumps(
+    obj: Any,
+    *,
+    sort: bool = True,
+    indent: bool = True,
+    default: Callable[[Any], Any] | None = None,
+    newline: bool = False,
+    ensure_ascii: bool = False,
+) -> bytes:
+    """
+    Serialize obj to JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        sort: Sort object keys (default: True)
+        indent: Pretty-print with 2-space indentation (default: True)
+        default: Called for objects the encoder cannot serialize; must
+            return a serializable value or raise TypeError
+        newline: Append a trailing newline (orjson adds it while encoding,
+            so large documents are not copied again to append it)
+        ensure_ascii: Escape non-ASCII characters as \\uXXXX (default:
+            False, i.e. raw UTF-8)
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Notes:
+        Objects orjson rejects (e.g. integers wider than 64 bits) are retried
+        with the stdlib encoder, so both backends accept the same inputs.
+        Both backends write NaN and Infinity as null and use the same
+        compact layout when indent is False.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        if default is not None:
+            # Route dataclasses through default too, as the stdlib does
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            data = orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass
+        else:
+            # orjson has no ASCII mode; only non-ASCII output needs the stdlib
+            if not ensure_ascii or data.isascii():
+                return data
+
+    try:
+        text = _stdlib_encode(obj, sort, indent, ensure_ascii, default)
+    except ValueError as e:
+        if not str(e).startswith(_NON_FINITE_ERROR):
+            raise
+        # Match orjson: non-finite floats become null
+        obj = _replace_non_finite(obj)
+        if default is not None:
+            default = _non_finite_default(default)
+        text = _stdlib_encode(obj, sort, indent, ensure_ascii, default)
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def _stdlib_encode(
+    obj: Any,
+    sort: bool,
+    indent: bool,
+    ensure_ascii: bool,
+    default: Callable[[Any], Any] | None,
+) -> str:
+    """Encode obj with the stdlib json module (NaN/Infinity raise ValueError)."""
+    if default is None:
+        return _STDLIB_ENCODERS[sort, indent, ensure_ascii].encode(obj)
+    return json.dumps(
+        obj,
+        sort_keys=sort,
+        indent=2 if indent else None,
+        separators=None if indent else _COMPACT_SEPARATORS,
+        ensure_ascii=ensure_ascii,
+        allow_nan=False,
+        default=default,
+    )
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Return obj with NaN/Infinity floats (in dicts, lists, tuples) set to None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def _non_finite_default(default: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap a default hook so the values it returns get _replace_non_finite()."""
+    return lambda obj: _replace_non_finite(default(obj))
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's decode
+            error subclasses it, so one except clause covers both backends)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json_file(path: str | Path) -> Any:
+    """
+    Parse a JSON file, handing its raw UTF-8 bytes to the parser.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        FileNotFoundError: If path does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+
+    Notes:
+        With orjson installed, files of MMAP_MIN_BYTES or more are mapped
+        read-only and parsed in place; anything mmap refuses (empty files,
+        pipes) falls back to a plain read.
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+            else:
+                with mapped:
+                    view = memoryview(mapped)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+        return loads(f.read())
+
+
+def write_json_file(
+    obj: Any,
+    path: str | Path,
+    *,
+    compress: bool = False,
+    default: Callable[[Any], Any] | None = None,
+    indent: bool = True,
+    ensure_ascii: bool = False,
+) -> int:
+    """
+    Write obj to path as key-sorted JSON followed by a newline.
+
+    Args:
+        obj: JSON-serializable object
+        path: Output file path (overwritten if it exists)
+        compress: Write gzip (level 1: fast, roughly halves JSON size)
+        default: Fallback serializer passed to dumps()
+        indent: Pretty-print with 2-space indent (False for compact output)
+        ensure_ascii: Escape non-ASCII characters as \\uXXXX (default: False,
+            i.e. raw UTF-8)
+
+    Returns:
+        Number of bytes written to disk
+    """
+    data = dumps(
+        obj, indent=indent, default=default, newline=True, ensure_ascii=ensure_ascii
+    )
+
+    if compress:
+        with open(path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1, mtime=0) as f:
+                f.write(data)
+            return raw.tell()
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def write_json(obj: Any, file: TextIO | None = None, *, indent: bool = True) -> None:
+    """
+    Write obj as key-sorted JSON followed by a newline.
+
+    Output is ASCII (non-ASCII characters are \\u-escaped, as with
+    json.dumps' default), so writing the bytes to file.buffer when the
+    stream has one (real stdout or stderr) is valid whatever the stream's
+    configured encoding; text-only streams (e.g. StringIO in tests) get
+    the decoded text.
+
+    Args:
+        obj: JSON-serializable object
+        file: Text stream to write to (default: sys.stdout)
+        indent: Pretty-print (default: True); False writes a single line
+    """
+    if file is None:
+        file = sys.stdout
+
+    data = dumps(obj, indent=indent, newline=True, ensure_ascii=True)
+    buffer = getattr(file, "buffer", None)
+    if buffer is None:
+        file.write(data.decode("utf-8"))
+        return
+
+    # Flush pending text first so output order is preserved
+    file.flush()
+    buffer.write(data)
+    buffer.flush()
@@ -8,27 +8,27 @@ Usage:
     python -m jobflow.scripts.approve job_discovery --approved-by "policy"
     python -m jobflow.scripts.approve job_discovery --approved-by "admin" --auto-approve
     python -m jobflow.scripts.approve job_discovery --approved-by "user@example.com" --scope session --out approval.json
+    python -m jobflow.scripts.approve job_discovery other_directive --approved-by "policy" --auto-approve --parallel 2
 """
 
 import argparse
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from jobflow.app.core.approval_artifact import create_approval
-from jobflow.app.core.plan_review_runner import review_directive
+from jobflow.app.util.jsonio import dumps, write_json
 
 
 def main() -> int:
     """
     Main entry point for approval issuance CLI.
 
-    Reviews a directive and issues an approval artifact if approved.
-    NEVER executes anything.
+    Reviews one or more directives and issues an approval artifact for each
+    approved one. NEVER executes anything.
 
     Returns:
-        0 if approval issued
-        2 if plan rejected
-        1 if error
+        0 if approval issued (for every directive)
+        2 if a plan was rejected
+        1 if an error occurred
     """
     parser = argparse.ArgumentParser(
         description="Issue approval artifacts for directives (dry-run only)",
@@ -43,6 +43,9 @@ Examples:
   # Save approval to file
   python -m jobflow.scripts.approve job_discovery --approved-by "policy" --auto-approve --out approval.json
 
+  # Review several directives in one process, 4 at a time
+  python -m jobflow.scripts.approve job_discovery batch_pipeline --approved-by "policy" --auto-approve --parallel 4
+
 Note: This command NEVER executes plans. Use it for:
   - Generating approval artifacts for later execution
   - Auditing plan review decisions
@@ -52,7 +55,8 @@ Note: This command NEVER executes plans. Use it for:
 
     parser.add_argument(
         "directive_name",
-        help="Name of the directive to review (e.g., job_discovery)"
+        nargs="+",
+        help="Name(s) of the directive(s) to review (e.g., job_discovery)"
     )
 
     parser.add_argument(
@@ -78,29 +82,95 @@ Note: This command NEVER executes plans. Use it for:
     parser.add_argument(
         "--out",
         metavar="PATH",
-        help="Write approval to file instead of stdout"
+        help="Write approval to file instead of stdout (NDJSON for several directives)"
+    )
+
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Review up to N directives concurrently (default: 1)"
     )
 
     args = parser.parse_args()
 
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+
+    # Single directive: original output contract
+    if len(args.directive_name) == 1:
+        exit_code, output = _approve_directive(args.directive_name[0], args)
+
+        if exit_code == 1:
+            write_json(output, sys.stderr)
+        elif exit_code == 0 and args.out:
+            # Write UTF-8 bytes directly to file
+            with open(args.out, "wb") as f:
+                f.write(dumps(output))
+
+            # Print confirmation to stdout
+            print(f"Approval artifact written to {args.out}")
+        else:
+            write_json(output)
+
+        return exit_code
+
+    # Several directives: review them in this interpreter (optionally in parallel)
+    workers = min(args.parallel, len(args.directive_name))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(
+                lambda name: _approve_directive(name, args), args.directive_name
+            ))
+    else:
+        outcomes = [_approve_directive(name, args) for name in args.directive_name]
+
+    results = [output for _, output in outcomes]
+
+    if args.out:
+        # One JSON object per directive (NDJSON)
+        with open(args.out, "wb") as f:
+            for output in results:
+                f.write(dumps(output, indent=False, newline=True))
+        print(f"Approval results written to {args.out}")
+    else:
+        write_json({"results": results})
+
+    # Errors take precedence over rejections
+    exit_codes = {code for code, _ in outcomes}
+    return 1 if 1 in exit_codes else max(exit_codes)
+
+
+def _approve_directive(directive_name: str, args: argparse.Namespace) -> tuple[int, dict]:
+    """
+    Review one directive and issue an approval artifact if approved.
+
+    Args:
+        directive_name: Name of the directive to review
+        args: Parsed CLI arguments (auto_approve, approved_by, scope)
+
+    Returns:
+        Tuple of (exit_code, output) where exit_code is 0 if approved,
+        2 if rejected, 1 on error
+    """
+    # Imported here so --help and usage errors skip the OpenAI/planner imports
+    from jobflow.app.core.approval_artifact import create_approval
+    from jobflow.app.core.plan_review_runner import review_directive
+
     try:
         # Step 1: Review the directive
-        review_result = review_directive(args.directive_name, auto_approve=args.auto_approve)
+        review_result = review_directive(directive_name, auto_approve=args.auto_approve)
 
         # Step 2: Check if approved
         if not review_result["approved"]:
             # Plan rejected - return rejection details
-            output = {
+            return 2, {
                 "directive_name": review_result["directive_name"],
                 "approved": False,
                 "reason": review_result["reason"]
             }
 
-            output_json = json.dumps(output, indent=2, sort_keys=True)
-            print(output_json)
-
-            return 2  # Exit code 2 for rejection
-
         # Step 3: Plan approved - create approval artifact
         approval = create_approval(
             review_result["plan"],
@@ -109,7 +179,7 @@ Note: This command NEVER executes plans. Use it for:
         )
 
         # Step 4: Prepare output
-        output = {
+        return 0, {
             "directive_name": review_result["directive_name"],
             "approved": True,
             "reason": review_result["reason"],
@@ -117,51 +187,14 @@ Note: This command NEVER executes plans. Use it for:
             "approval": approval
         }
 
-        output_json = json.dumps(output, indent=2, sort_keys=True)
-
-        # Step 5: Write to file or stdout
-        if args.out:
-            # Write to file
-            with open(args.out, "w", encoding="utf-8") as f:
-                f.write(output_json)
-
-            # Print confirmation to stdout
-            print(f"Approval artifact written to {args.out}")
-        else:
-            # Print to stdout
-            print(output_json)
-
-        return 0  # Success
-
-    except FileNotFoundError as e:
-        # Directive file not found
-        error = {
-            "directive_name": args.directive_name,
-            "error": "FileNotFoundError",
-            "message": str(e)
-        }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
-        return 1
-
-    except ValueError as e:
-        # Missing environment variables or other value errors
-        error = {
-            "directive_name": args.directive_name,
-            "error": "ValueError",
-            "message": str(e)
-        }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
-        return 1
-
     except Exception as e:
-        # Unexpected errors
-        error = {
-            "directive_name": args.directive_name,
+        # Missing directive (FileNotFoundError), missing env vars (ValueError)
+        # or unexpected errors
+        return 1, {
+            "directive_name": directive_name,
             "error": type(e).__name__,
             "message": str(e)
         }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
-        return 1
 
 
 if __name__ == "__main__":
@@ -5,10 +5,11 @@ Processes multiple candidate folders and generates aggregated results.
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
+from jobflow.app.util.jsonio import write_json
+
 
 def main(argv=None):
     """
@@ -37,6 +38,13 @@ Examples:
     --jobs ./jobs.json \\
     --out ./results \\
     --no-match
+
+  # Compress per-candidate JSON outputs
+  python -m jobflow.scripts.batch_run \\
+    --candidates-dir ./candidates \\
+    --jobs ./jobs.json \\
+    --out ./results \\
+    --gzip
 """,
     )
 
@@ -84,6 +92,12 @@ Examples:
         help="Known company domain to allowlist for URL validation (can be specified multiple times)",
     )
 
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write per-candidate results and apply pack JSON as .json.gz (compression level 1)",
+    )
+
     args = parser.parse_args(argv)
 
     try:
@@ -94,7 +108,7 @@ Examples:
                 "status": "error",
                 "error": f"Candidates directory not found: {args.candidates_dir}",
             }
-            print(json.dumps(result, indent=2, sort_keys=True))
+            write_json(result)
             return 1
 
         jobs_file = Path(args.jobs)
@@ -103,7 +117,7 @@ Examples:
                 "status": "error",
                 "error": f"Jobs file not found: {args.jobs}",
             }
-            print(json.dumps(result, indent=2, sort_keys=True))
+            write_json(result)
             return 1
 
         # Import after validation
@@ -118,7 +132,7 @@ Examples:
                 "error": f"No candidate folders found in: {args.candidates_dir}",
                 "candidates_dir": str(candidates_dir.absolute()),
             }
-            print(json.dumps(result, indent=2, sort_keys=True))
+            write_json(result)
             return 2
 
         # Create job source
@@ -137,6 +151,7 @@ Examples:
             export_apply_packs=export_apply_packs,
             top_n=args.top_n,
             company_domains=company_domains,
+            gzip_output=args.gzip,
         )
 
         # Build output
@@ -154,13 +169,14 @@ Examples:
             "summary_path": batch_result["summary_path"],
             "errors_path": batch_result["errors_path"],
             "results_dir": batch_result["results_dir"],
+            "json_bytes_written": batch_result["json_bytes_written"],
         }
 
         # Include apply packs dir if enabled
         if "apply_packs_dir" in batch_result:
             result["apply_packs_dir"] = batch_result["apply_packs_dir"]
 
-        print(json.dumps(result, indent=2, sort_keys=True))
+        write_json(result)
         return 0
 
     except Exception as e:
@@ -169,7 +185,7 @@ Examples:
             "error": str(e),
             "error_type": type(e).__name__,
         }
-        print(json.dumps(result, indent=2, sort_keys=True))
+        write_json(result)
         return 1
 
 
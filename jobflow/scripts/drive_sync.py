@@ -5,9 +5,10 @@ Stages candidate folders from Google Drive to local filesystem.
 """
 
 import argparse
-import json
 import sys
 
+from jobflow.app.util.jsonio import dumps, write_json
+
 
 def main(argv=None):
     """
@@ -41,6 +42,12 @@ Examples:
     --staging ./staged_candidates \\
     --max-candidates 10
 
+  # Stream per-candidate details to a JSONL file (one line per candidate)
+  python -m jobflow.scripts.drive_sync \\
+    --root-folder-id 1234567890abcdefgh \\
+    --staging ./staged_candidates \\
+    --jsonl ./staged_candidates.jsonl
+
 Prerequisites:
   - Set GOOGLE_APPLICATION_CREDENTIALS to service account JSON path
   - Service account must have Drive read-only access
@@ -72,12 +79,18 @@ Prerequisites:
         help="Maximum number of candidates to process (default: all)",
     )
 
+    parser.add_argument(
+        "--jsonl",
+        help="Write per-candidate details to this JSONL file as they are staged "
+             "(omitted from stdout output)",
+    )
+
     args = parser.parse_args(argv)
 
     try:
         # Import after validation
         from jobflow.app.services.drive_client import DriveClient
-        from jobflow.app.services.drive_sync import sync_candidate_folders
+        from jobflow.app.services.drive_sync import iter_candidates, sync_candidate_folders
 
         # Initialize Drive client
         try:
@@ -88,7 +101,7 @@ Prerequisites:
                 "error": str(e),
                 "error_type": "CredentialsError",
             }
-            print(json.dumps(result, indent=2, sort_keys=True))
+            write_json(result)
             return 1
         except ImportError as e:
             result = {
@@ -96,17 +109,20 @@ Prerequisites:
                 "error": str(e),
                 "error_type": "DependencyError",
             }
-            print(json.dumps(result, indent=2, sort_keys=True))
+            write_json(result)
             return 1
 
         # Sync candidate folders
-        sync_result = sync_candidate_folders(
-            drive_client=drive_client,
-            root_folder_id=args.root_folder_id,
-            staging_dir=args.staging,
-            dry_run=args.dry_run,
-            max_candidates=args.max_candidates,
-        )
+        if args.jsonl:
+            sync_result = _sync_to_jsonl(iter_candidates, drive_client, args)
+        else:
+            sync_result = sync_candidate_folders(
+                drive_client=drive_client,
+                root_folder_id=args.root_folder_id,
+                staging_dir=args.staging,
+                dry_run=args.dry_run,
+                max_candidates=args.max_candidates,
+            )
 
         # Check if any candidates found
         if sync_result["processed"] == 0:
@@ -116,7 +132,7 @@ Prerequisites:
                 "root_folder_id": args.root_folder_id,
                 "staging_dir": args.staging,
             }
-            print(json.dumps(result, indent=2, sort_keys=True))
+            write_json(result)
             return 2
 
         # Build success output
@@ -129,10 +145,13 @@ Prerequisites:
             "downloaded": sync_result["downloaded"],
             "skipped": sync_result["skipped"],
             "warnings": sync_result["warnings"],
-            "candidates": sync_result["candidates"],
         }
+        if args.jsonl:
+            result["candidates_jsonl"] = args.jsonl
+        else:
+            result["candidates"] = sync_result["candidates"]
 
-        print(json.dumps(result, indent=2, sort_keys=True))
+        write_json(result)
         return 0
 
     except Exception as e:
@@ -141,9 +160,37 @@ Prerequisites:
             "error": str(e),
             "error_type": type(e).__name__,
         }
-        print(json.dumps(result, indent=2, sort_keys=True))
+        write_json(result)
         return 1
 
 
+def _sync_to_jsonl(iter_candidates, drive_client, args) -> dict:
+    """
+    Sync candidates, writing each one to args.jsonl as soon as it is staged.
+
+    Only counters and warnings are kept in memory.
+
+    Returns:
+        Sync summary dict (same keys as sync_candidate_folders, minus candidates)
+    """
+    summary = {"processed": 0, "downloaded": 0, "skipped": 0, "warnings": []}
+
+    with open(args.jsonl, "wb") as f:
+        for candidate in iter_candidates(
+            drive_client,
+            args.root_folder_id,
+            args.staging,
+            dry_run=args.dry_run,
+            max_candidates=args.max_candidates,
+            warnings=summary["warnings"],
+        ):
+            f.write(dumps(candidate, indent=False, newline=True))
+            summary["processed"] += 1
+            summary["downloaded"] += candidate["files_downloaded"]
+            summary["skipped"] += candidate["files_skipped"]
+
+    return summary
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -7,14 +7,14 @@ and calling the execution engine.
 Usage:
     python -m jobflow.scripts.execute job_discovery --approval approval.json
     python -m jobflow.scripts.execute job_discovery --approval approval.json --payload data.json
+    python -m jobflow.scripts.execute job_discovery --approval approval.json --compact
 """
 
 import argparse
 import json
 import sys
-from pathlib import Path
 
-from jobflow.app.core.plan_executor import execute_from_directive, PlanRejectedError
+from jobflow.app.util.jsonio import read_json_file, write_json
 
 
 def main() -> int:
@@ -38,6 +38,9 @@ Examples:
   # Execute with approval and payload
   python -m jobflow.scripts.execute job_discovery --approval approval.json --payload data.json
 
+  # Single-line output for piping into other tools
+  python -m jobflow.scripts.execute job_discovery --approval approval.json --compact
+
 Note: This command requires a valid approval artifact.
 Use jobflow.scripts.approve to generate approval artifacts.
 """
@@ -61,26 +64,26 @@ Use jobflow.scripts.approve to generate approval artifacts.
         help="Path to payload JSON file (optional)"
     )
 
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        default=False,
+        help="Print the result as single-line JSON instead of indented"
+    )
+
     args = parser.parse_args()
 
-    try:
-        # Step 1: Load approval artifact from file
-        approval_path = Path(args.approval)
-        if not approval_path.exists():
-            raise FileNotFoundError(f"Approval file not found: {args.approval}")
+    # Import after argument parsing so --help and usage errors stay fast
+    from jobflow.app.core.plan_executor import execute_from_directive, PlanRejectedError
 
-        with open(approval_path, "r", encoding="utf-8") as f:
-            approval = json.load(f)
+    try:
+        # Step 1: Load approval artifact from file (raw bytes, single open)
+        approval = _read_json_arg(args.approval, "Approval")
 
         # Step 2: Load payload from file (if provided)
         payload = {}
         if args.payload:
-            payload_path = Path(args.payload)
-            if not payload_path.exists():
-                raise FileNotFoundError(f"Payload file not found: {args.payload}")
-
-            with open(payload_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = _read_json_arg(args.payload, "Payload")
 
         # Step 3: Execute with approval artifact
         result = execute_from_directive(
@@ -90,8 +93,7 @@ Use jobflow.scripts.approve to generate approval artifacts.
         )
 
         # Step 4: Print result as JSON
-        output_json = json.dumps(result, indent=2, sort_keys=True)
-        print(output_json)
+        write_json(result, indent=not args.compact)
 
         return 0  # Success
 
@@ -102,7 +104,7 @@ Use jobflow.scripts.approve to generate approval artifacts.
             "error_type": "PlanRejectedError",
             "message": str(e)
         }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error, sys.stderr)
         return 3  # Exit code 3 for rejection
 
     except FileNotFoundError as e:
@@ -112,7 +114,7 @@ Use jobflow.scripts.approve to generate approval artifacts.
             "error_type": "FileNotFoundError",
             "message": str(e)
         }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error, sys.stderr)
         return 1
 
     except json.JSONDecodeError as e:
@@ -122,7 +124,7 @@ Use jobflow.scripts.approve to generate approval artifacts.
             "error_type": "JSONDecodeError",
             "message": f"Invalid JSON: {str(e)}"
         }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error, sys.stderr)
         return 1
 
     except ValueError as e:
@@ -132,7 +134,7 @@ Use jobflow.scripts.approve to generate approval artifacts.
             "error_type": "ValueError",
             "message": str(e)
         }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error, sys.stderr)
         return 1
 
     except Exception as e:
@@ -142,9 +144,33 @@ Use jobflow.scripts.approve to generate approval artifacts.
             "error_type": type(e).__name__,
             "message": str(e)
         }
-        print(json.dumps(error, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error, sys.stderr)
         return 1
 
 
+def _read_json_arg(path: str, label: str):
+    """
+    Parse a JSON file named on the command line.
+
+    Opens the file once in binary mode (no separate existence check and no
+    text decoding) and hands the bytes to the JSON parser.
+
+    Args:
+        path: File path from the command line
+        label: Human-readable name used in the not-found message
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    try:
+        return read_json_file(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{label} file not found: {path}") from None
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -7,15 +7,15 @@ decisions without actually executing anything.
 Usage:
     python -m jobflow.scripts.review job_discovery
     python -m jobflow.scripts.review job_discovery --auto-approve
+    python -m jobflow.scripts.review job_discovery --compact
 
 CRITICAL: This script NEVER executes plans. It is review-only.
 """
 
 import argparse
-import json
 import sys
 
-from jobflow.app.core.plan_review_runner import review_directive
+from jobflow.app.util.jsonio import write_json
 
 
 def main():
@@ -40,6 +40,9 @@ Examples:
   # Review with policy-based approval
   python -m jobflow.scripts.review job_discovery --auto-approve
 
+  # Single-line output for piping into other tools
+  python -m jobflow.scripts.review job_discovery --compact
+
 Note: This command NEVER executes plans. Use it for:
   - Testing plan generation
   - Previewing approval decisions
@@ -60,15 +63,24 @@ Note: This command NEVER executes plans. Use it for:
         help="Use policy-based approval (default: False, will reject)"
     )
 
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        default=False,
+        help="Print the result as single-line JSON instead of indented"
+    )
+
     args = parser.parse_args()
 
+    # Import after argument parsing so --help and usage errors stay fast
+    from jobflow.app.core.plan_review_runner import review_directive
+
     try:
         # Call the review runner (dry-run mode, never executes)
         result = review_directive(args.directive_name, auto_approve=args.auto_approve)
 
-        # Print results as formatted JSON
-        output = json.dumps(result, indent=2, sort_keys=True)
-        print(output)
+        # Print results as JSON (indented unless --compact)
+        write_json(result, indent=not args.compact)
 
         # Always exit with 0 - rejection is not a failure, it's a valid result
         return 0
@@ -80,7 +92,7 @@ Note: This command NEVER executes plans. Use it for:
             "message": str(e),
             "directive_name": args.directive_name
         }
-        print(json.dumps(error_result, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error_result, sys.stderr)
         return 1
 
     except ValueError as e:
@@ -90,7 +102,7 @@ Note: This command NEVER executes plans. Use it for:
             "message": str(e),
             "directive_name": args.directive_name
         }
-        print(json.dumps(error_result, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error_result, sys.stderr)
         return 1
 
     except Exception as e:
@@ -100,7 +112,7 @@ Note: This command NEVER executes plans. Use it for:
             "message": str(e),
             "directive_name": args.directive_name
         }
-        print(json.dumps(error_result, indent=2, sort_keys=True), file=sys.stderr)
+        write_json(error_result, sys.stderr)
         return 1
 
 
@@ -3,11 +3,17 @@ Job Discovery Pipeline
 
 High-level workflow for discovering, parsing, and storing job postings.
 
-IMPORTANT: This is a DESCRIPTIVE definition only.
-No execution logic, imports, or side effects belong here.
-Actual work is done by execution scripts coordinated by workers.
+IMPORTANT: The commented workflow below is a DESCRIPTIVE definition only.
+Actual work is done by execution scripts coordinated by workers. The
+executable functions further down run discovery in-process; importing this
+module has no side effects.
 """
 
+from jobflow.app.core.candidate_profile import CandidateProfile
+from jobflow.app.core.candidate_query_builder import build_search_query
+from jobflow.app.core.job_aggregator import JobAggregator
+from jobflow.app.core.search_query import build_job_query
+
 # Pipeline: Job Discovery and Parsing
 # Purpose: Discover new job postings from various sources and parse them into structured data
 #
@@ -77,12 +83,17 @@ def get_pipeline_definition():
 # Executable Pipeline Functions
 # ==============================================================================
 
+# Dict shapes recognised by _build_query_from_input
+_SEARCH_QUERY_KEYS = frozenset({"titles", "keywords"})
+_PROFILE_KEYS = frozenset({"full_name", "email"})
+
 
 def run_job_discovery(
     candidate_or_query=None,
     sources: list = None,
     match_jobs: bool = False,
-    candidate_folder: str = None
+    candidate_folder: str = None,
+    raw_jobs: bool = False
 ) -> dict:
     """
     Execute job discovery pipeline for a candidate.
@@ -108,6 +119,9 @@ def run_job_discovery(
         match_jobs: If True, match and rank jobs by fit score (default False)
         candidate_folder: Path to folder containing application info and resume
                           (if provided, overrides candidate_or_query)
+        raw_jobs: If True, "jobs" holds the JobPosting instances rather than
+                  dicts; serialize with jsonio's to_dict_default hook. Saves
+                  building a dict per job when the result goes straight to JSON.
 
     Returns:
         Dict containing:
@@ -150,11 +164,73 @@ def run_job_discovery(
         >>> for match in result["matches"]:
         ...     print(f"{match['job_title']}: {match['overall_score']}")
     """
-    from jobflow.app.core.candidate_profile import CandidateProfile
-    from jobflow.app.core.candidate_query_builder import build_search_query
-    from jobflow.app.core.job_aggregator import JobAggregator
-    from jobflow.app.core.search_query import build_job_query
+    if match_jobs:
+        return run_job_discovery_with_matches(
+            candidate_or_query, sources, candidate_folder, raw_jobs
+        )
+    return run_job_discovery_search_only(
+        candidate_or_query, sources, candidate_folder, raw_jobs
+    )
+
+
+def run_job_discovery_search_only(
+    candidate_or_query=None,
+    sources: list = None,
+    candidate_folder: str = None,
+    raw_jobs: bool = False
+) -> dict:
+    """
+    Execute job discovery without matching.
+
+    Same as run_job_discovery(..., match_jobs=False). The job matcher is
+    never imported on this path.
+
+    Returns:
+        Result dict without "matches" (see run_job_discovery)
+    """
+    result, _, _ = _run_discovery(candidate_or_query, sources, candidate_folder, raw_jobs)
+    return result
+
+
+def run_job_discovery_with_matches(
+    candidate_or_query=None,
+    sources: list = None,
+    candidate_folder: str = None,
+    raw_jobs: bool = False
+) -> dict:
+    """
+    Execute job discovery and rank the aggregated jobs by fit.
+
+    Same as run_job_discovery(..., match_jobs=True).
+
+    Returns:
+        Result dict including "matches" (see run_job_discovery)
+    """
+    result, jobs, candidate_or_query = _run_discovery(
+        candidate_or_query, sources, candidate_folder, raw_jobs
+    )
+
+    # Convert candidate to profile dict for matching
+    candidate_for_matching = _normalize_candidate_for_matching(candidate_or_query)
+
+    # Match each job and collect results
+    matches = _match_and_rank_jobs(candidate_for_matching, jobs)
+
+    result["matches"] = matches
+    result["counts"]["matches"] = len(matches)
+
+    return result
+
+
+def _run_discovery(
+    candidate_or_query, sources: list, candidate_folder: str, raw_jobs: bool
+) -> tuple:
+    """
+    Run the steps shared by every discovery variant (load, query, aggregate).
 
+    Returns:
+        Tuple of (result dict, JobPosting list, resolved candidate input)
+    """
     # Step 0: Load candidate from folder if provided
     if candidate_folder is not None:
         from jobflow.app.core.candidate_folder_loader import load_candidate_profile
@@ -171,7 +247,11 @@ def run_job_discovery(
     jobs, errors = aggregator.aggregate_with_errors(query)
 
     # Step 3: Serialize jobs (convert JobPosting instances to dicts)
-    serialized_jobs = [job.to_dict() for job in jobs]
+    # Jobs are local to this call, so their lists can be shared without copying
+    if raw_jobs:
+        serialized_jobs = jobs
+    else:
+        serialized_jobs = [job.to_dict(copy=False) for job in jobs]
 
     # Step 4: Build result structure
     result = {
@@ -195,18 +275,7 @@ def run_job_discovery(
             "skills": candidate_profile.skills[:10],  # Top 10 skills
         }
 
-    # Step 5: (Optional) Match and rank jobs
-    if match_jobs:
-        # Convert candidate to profile dict for matching
-        candidate_for_matching = _normalize_candidate_for_matching(candidate_or_query)
-
-        # Match each job and collect results
-        matches = _match_and_rank_jobs(candidate_for_matching, jobs)
-
-        result["matches"] = matches
-        result["counts"]["matches"] = len(matches)
-
-    return result
+    return result, jobs, candidate_or_query
 
 
 def _build_query_from_input(candidate_or_query) -> dict:
@@ -225,23 +294,21 @@ def _build_query_from_input(candidate_or_query) -> dict:
     Returns:
         Search query dict
     """
-    from jobflow.app.core.candidate_profile import CandidateProfile
-    from jobflow.app.core.candidate_query_builder import build_search_query
-    from jobflow.app.core.search_query import build_job_query
-
     # Handle CandidateProfile instance
     if isinstance(candidate_or_query, CandidateProfile):
         return build_search_query(candidate_or_query)
 
     # Handle dict
     if isinstance(candidate_or_query, dict):
+        keys = candidate_or_query.keys()
+
         # Check if it's already a SearchQuery (has titles/keywords/remote_ok)
-        if "titles" in candidate_or_query and "keywords" in candidate_or_query:
+        if _SEARCH_QUERY_KEYS <= keys:
             # Already a search query, use as-is
             return candidate_or_query
 
         # Check if it's CandidateProfile-style (has full_name, email, etc.)
-        if "full_name" in candidate_or_query or "email" in candidate_or_query:
+        if not _PROFILE_KEYS.isdisjoint(keys):
             # Convert to CandidateProfile and build query
             profile = CandidateProfile.from_dict(candidate_or_query)
             return build_search_query(profile)
@@ -267,8 +334,6 @@ def _normalize_candidate_for_matching(candidate_or_query) -> dict:
     Returns:
         Dict with candidate profile fields
     """
-    from jobflow.app.core.candidate_profile import CandidateProfile
-
     # Handle CandidateProfile instance
     if isinstance(candidate_or_query, CandidateProfile):
         # Convert to dict using raw if available, otherwise build from fields
@@ -311,20 +376,36 @@ def _match_and_rank_jobs(candidate_profile: dict, jobs: list) -> list[dict]:
     Returns:
         List of match result dicts with job details, sorted by score
     """
-    from jobflow.app.core.job_matcher import match_job
+    from jobflow.app.core.job_matcher import match_jobs
+
+    # Keep scores in their own column so ranking touches only floats;
+    # match dicts are built afterwards, already in output order
+    kept_jobs = []
+    kept_results = []
+    scores = []
+
+    # Candidate keywords are derived once for the whole job list; rejects
+    # come back as None before their reasons and fingerprint are built
+    results = match_jobs(candidate_profile, jobs, reject_early=True)
+    for job, match_result in zip(jobs, results):
+        # Filter out rejects
+        if match_result is None:
+            continue
 
-    matches = []
+        kept_jobs.append(job)
+        kept_results.append(match_result)
+        scores.append(match_result.overall_score)
 
-    for job in jobs:
-        # Match candidate to job
-        match_result = match_job(candidate_profile, job)
+    # Sort by overall score descending (stable, so ties keep input order)
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
 
-        # Filter out rejects
-        if match_result.decision == "reject":
-            continue
+    matches = []
+    for i in order:
+        job = kept_jobs[i]
 
         # Serialize match result and include job details
-        match_dict = match_result.to_dict()
+        # (match_result is discarded after this, so skip defensive copies)
+        match_dict = kept_results[i].to_dict(copy=False)
 
         # Add job details for convenience
         match_dict["job_title"] = job.title
@@ -334,7 +415,4 @@ def _match_and_rank_jobs(candidate_profile: dict, jobs: list) -> list[dict]:
 
         matches.append(match_dict)
 
-    # Sort by overall score descending
-    matches.sort(key=lambda m: m["overall_score"], reverse=True)
-
     return matches
@@ -7,8 +7,16 @@ Creates a minimal valid XLSX file with key-value pairs using stdlib only.
 import zipfile
 from pathlib import Path
 
+# Escapes for XML text and attribute values, applied in a single pass
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
 
-def generate_application_xlsx(output_path: str, data: dict[str, str]):
+
+def generate_application_xlsx(
+    output_path: str,
+    data: dict[str, str],
+    compress: bool = False,
+    all_strings: bool = True,
+):
     """
     Generate minimal XLSX with key-value pairs.
 
@@ -17,57 +25,37 @@ def generate_application_xlsx(output_path: str, data: dict[str, str]):
     Args:
         output_path: Path where XLSX should be saved
         data: Dict of key-value pairs to write
+        compress: Deflate the archive members (default False stores them
+            uncompressed; fixtures are a few KB so deflate is pure CPU cost)
+        all_strings: Treat every value as a shared string without per-row
+            type checks (default True, per the annotation). Pass False to
+            write int/float values as inline numeric cells.
     """
     # Create output directory if needed
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Prepare shared strings and sheet data
-    shared_strings = []
-    string_map = {}  # value -> index
-    rows = []
-
-    row_num = 1
-    for key, value in data.items():
-        # Add key to shared strings
-        if key not in string_map:
-            string_map[key] = len(shared_strings)
-            shared_strings.append(key)
-
-        # Add value to shared strings (if string)
-        value_ref = ""
-        value_type = ""
-        if isinstance(value, (int, float)):
-            # Numeric value
-            value_ref = str(value)
-            value_type = ""
-        else:
-            # String value
-            if value not in string_map:
-                string_map[value] = len(shared_strings)
-                shared_strings.append(value)
-            value_ref = str(string_map[value])
-            value_type = ' t="s"'
-
-        rows.append((row_num, string_map[key], value_ref, value_type))
-        row_num += 1
-
-    # Generate XML content
-    content_types_xml = _generate_content_types()
-    rels_xml = _generate_rels()
-    workbook_xml = _generate_workbook()
-    workbook_rels_xml = _generate_workbook_rels()
-    shared_strings_xml = _generate_shared_strings(shared_strings)
-    sheet1_xml = _generate_sheet(rows)
-
-    # Create XLSX as ZIP
-    with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as xlsx:
-        xlsx.writestr("[Content_Types].xml", content_types_xml)
-        xlsx.writestr("_rels/.rels", rels_xml)
-        xlsx.writestr("xl/workbook.xml", workbook_xml)
-        xlsx.writestr("xl/_rels/workbook.xml.rels", workbook_rels_xml)
-        xlsx.writestr("xl/sharedStrings.xml", shared_strings_xml)
-        xlsx.writestr("xl/worksheets/sheet1.xml", sheet1_xml)
+    # Build shared strings and sheet data in one pass
+    shared_strings_xml, sheet1_xml = _generate_sheet_and_strings(data, all_strings)
+
+    # Generate XML content, encoded up front in archive order
+    members = (
+        ("[Content_Types].xml", _generate_content_types()),
+        ("_rels/.rels", _generate_rels()),
+        ("xl/workbook.xml", _generate_workbook()),
+        ("xl/_rels/workbook.xml.rels", _generate_workbook_rels()),
+        ("xl/sharedStrings.xml", shared_strings_xml),
+        ("xl/worksheets/sheet1.xml", sheet1_xml),
+    )
+    members = tuple((name, xml.encode("utf-8")) for name, xml in members)
+
+    # Create XLSX as ZIP. Explicit ZipInfo entries skip writestr's
+    # time.localtime() call and give every member a fixed 1980-01-01
+    # timestamp, so regenerated fixtures are byte-identical.
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(output_path, "w", compression, compresslevel=1) as xlsx:
+        for name, payload in members:
+            xlsx.writestr(zipfile.ZipInfo(name), payload, compression, 1)
 
 
 def _generate_content_types() -> str:
@@ -105,37 +93,57 @@ def _generate_workbook_rels() -> str:
 </Relationships>"""
 
 
-def _generate_shared_strings(strings: list[str]) -> str:
-    xml = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="{count}" uniqueCount="{count}">
-""".format(count=len(strings))
+def _generate_sheet_and_strings(data: dict, all_strings: bool = True) -> tuple[str, str]:
+    """Return (sharedStrings.xml, sheet1.xml), walking the data once."""
+    string_map = {}  # value -> index
+    sst_parts = []
+    sheet_parts = ["""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+  <sheetData>
+"""]
 
-    for s in strings:
-        # Escape XML special characters
-        escaped = s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-        xml += f"  <si><t>{escaped}</t></si>\n"
+    def intern(text: str) -> int:
+        index = string_map.get(text)
+        if index is None:
+            index = string_map[text] = len(sst_parts)
+            # Escape XML special characters
+            sst_parts.append(f"  <si><t>{text.translate(_XML_ESCAPE)}</t></si>\n")
+        return index
 
-    xml += "</sst>"
-    return xml
+    for row_num, (key, value) in enumerate(data.items(), start=1):
+        key_idx = intern(key)
 
+        if all_strings:
+            value_ref = intern(value)
+            value_type = ' t="s"'
+        elif isinstance(value, (int, float)):
+            # Numeric value
+            value_ref = value
+            value_type = ""
+        else:
+            # String value
+            value_ref = intern(value)
+            value_type = ' t="s"'
 
-def _generate_sheet(rows: list[tuple]) -> str:
-    xml = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
-<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
-  <sheetData>
-"""
+        sheet_parts.append(
+            f'    <row r="{row_num}">\n'
+            # Column A (key)
+            f'      <c r="A{row_num}" t="s"><v>{key_idx}</v></c>\n'
+            # Column B (value)
+            f'      <c r="B{row_num}"{value_type}><v>{value_ref}</v></c>\n'
+            "    </row>\n"
+        )
+
+    sheet_parts.append("""  </sheetData>
+</worksheet>""")
+
+    # The header carries the final count, so it is prepended once known
+    sst_parts.insert(0, """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="{count}" uniqueCount="{count}">
+""".format(count=len(sst_parts)))
+    sst_parts.append("</sst>")
 
-    for row_num, key_idx, value_ref, value_type in rows:
-        xml += f'    <row r="{row_num}">\n'
-        # Column A (key)
-        xml += f'      <c r="A{row_num}" t="s"><v>{key_idx}</v></c>\n'
-        # Column B (value)
-        xml += f'      <c r="B{row_num}"{value_type}><v>{value_ref}</v></c>\n'
-        xml += "    </row>\n"
-
-    xml += """  </sheetData>
-</worksheet>"""
-    return xml
+    return "".join(sst_parts), "".join(sheet_parts)
 
 
 if __name__ == "__main__":
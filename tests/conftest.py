@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from jobflow.app.core.application_queue import clear_dir_cache
+from jobflow.app.services.planner import clear_client_cache, clear_plan_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolate_plan_cache(monkeypatch):
+    """Ensure memoized plans and OpenAI clients never leak between tests."""
+    # The on-disk plan cache is opted into explicitly by the tests covering it
+    monkeypatch.setenv("JOBFLOW_PLANNER_NOCACHE", "1")
+    clear_plan_cache()
+    clear_client_cache()
+    yield
+    clear_plan_cache()
+    clear_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_queue_dir_cache():
+    """Ensure directories created by one test are not assumed by the next."""
+    clear_dir_cache()
+    yield
+    clear_dir_cache()
@@ -11,8 +11,10 @@ import pytest
 
 from jobflow.app.core.application_queue import (
     QUEUE_COLUMNS,
+    QueueRow,
     build_queue_rows,
     merge_queue,
+    merge_queue_files,
     read_queue_csv,
     write_queue_csv,
 )
@@ -46,6 +48,20 @@ def test_build_queue_rows_formats_keywords_with_semicolons():
     assert row["missing_keywords"] == "aws; k8s"
 
 
+def test_build_queue_rows_null_keywords_are_empty():
+    """Test that missing or null keyword lists become empty cells."""
+    apply_pack = {
+        "applications": [
+            {"rank": 1, "job_fingerprint": "abc123", "matched_keywords": None},
+        ]
+    }
+
+    row = build_queue_rows(apply_pack)[0]
+
+    assert row["matched_keywords"] == ""
+    assert row["missing_keywords"] == ""
+
+
 def test_build_queue_rows_sets_defaults():
     """Test that build_queue_rows sets default status and notes."""
     apply_pack = {
@@ -84,6 +100,23 @@ def test_build_queue_rows_stable_ordering():
     assert rows[2]["rank"] == 3
 
 
+def test_build_queue_rows_sorts_string_ranks_numerically():
+    """Test that string ranks (hand-edited packs) sort as integers."""
+    apply_pack = {
+        "applications": [
+            {"rank": "10", "job_fingerprint": "j"},
+            {"rank": 2, "job_fingerprint": "b"},
+            {"job_fingerprint": "unranked"},
+        ]
+    }
+
+    rows = build_queue_rows(apply_pack)
+
+    assert [row["job_fingerprint"] for row in rows] == ["unranked", "b", "j"]
+    # Stored ranks are left as given
+    assert [row["rank"] for row in rows] == ["", 2, "10"]
+
+
 def test_build_queue_rows_generates_fingerprint_if_missing():
     """Test that build_queue_rows generates fingerprint when not provided."""
     apply_pack = {
@@ -106,6 +139,34 @@ def test_build_queue_rows_generates_fingerprint_if_missing():
     assert len(row["job_fingerprint"]) == 16  # First 16 chars of SHA256
 
 
+def test_build_queue_rows_fingerprint_is_memoized():
+    """Test repeated postings reuse the cached fingerprint."""
+    from jobflow.app.core.application_queue import _generate_fingerprint
+
+    app = {
+        "rank": 1,
+        "apply_url": "https://example.com/job/memo",
+        "company": "TechCorp",
+        "job_title": "Engineer",
+    }
+    _generate_fingerprint.cache_clear()
+
+    rows = build_queue_rows({"applications": [app, {**app, "rank": 2}]})
+
+    assert rows[0]["job_fingerprint"] == rows[1]["job_fingerprint"]
+    info = _generate_fingerprint.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_queue_row_keys_match_queue_columns():
+    """Test that the QueueRow type and built rows follow QUEUE_COLUMNS order."""
+    assert list(QueueRow.__annotations__) == QUEUE_COLUMNS
+
+    rows = build_queue_rows({"applications": [{"rank": 1, "job_fingerprint": "abc"}]})
+    assert list(rows[0]) == QUEUE_COLUMNS
+
+
 def test_build_queue_rows_fingerprint_is_deterministic():
     """Test that generated fingerprint is stable across runs."""
     apply_pack1 = {
@@ -361,6 +422,94 @@ def test_merge_queue_deterministic_sort():
     assert merged[2]["job_fingerprint"] == "mmm"  # rank=2
 
 
+def test_merge_queue_keys_existing_rows_by_fingerprint():
+    """Test the fingerprint join: last duplicate wins, blank fingerprints drop."""
+    existing = [
+        {"job_fingerprint": "abc", "rank": "1", "status": "applied", "notes": "first"},
+        {"job_fingerprint": "abc", "rank": "1", "status": "interview", "notes": "second"},
+        {"job_fingerprint": "", "rank": "2", "status": "applied", "notes": "orphan"},
+    ]
+    new = [{"job_fingerprint": "abc", "rank": 1, "status": "queued", "notes": ""}]
+
+    merged = merge_queue(existing, new)
+
+    assert merged == [
+        {"job_fingerprint": "abc", "rank": 1, "status": "interview", "notes": "second"}
+    ]
+
+
+def test_merge_queue_sorts_csv_ranks_numerically():
+    """Test string ranks read from CSV sort numerically with new int ranks."""
+    existing = [
+        {"job_fingerprint": "old10", "rank": "10", "status": "applied", "notes": ""},
+        {"job_fingerprint": "old2", "rank": "2", "status": "applied", "notes": ""},
+        {"job_fingerprint": "blank", "rank": "", "status": "skipped", "notes": ""},
+    ]
+
+    new = [
+        {"job_fingerprint": "new1", "rank": 1, "status": "queued", "notes": ""},
+        {"job_fingerprint": "new3", "rank": 3, "status": "queued", "notes": ""},
+    ]
+
+    merged = merge_queue(existing, new)
+
+    assert [row["job_fingerprint"] for row in merged] == [
+        "new1", "old2", "new3", "old10", "blank"
+    ]
+
+
+def test_merge_queue_files_combines_queues(tmp_path):
+    """Test merging queue CSVs keeps human edits and the newest job data."""
+    old_path = tmp_path / "old.csv"
+    new_path = tmp_path / "new.csv"
+    out_path = tmp_path / "merged.csv"
+
+    write_queue_csv([
+        {"job_fingerprint": "abc", "rank": 2, "company": "OldCo",
+         "status": "applied", "notes": "Emailed recruiter"},
+        {"job_fingerprint": "gone", "rank": 5, "status": "skipped"},
+    ], str(old_path))
+    write_queue_csv([
+        {"job_fingerprint": "abc", "rank": 3, "company": "NewCo",
+         "status": "queued", "notes": ""},
+        {"job_fingerprint": "fresh", "rank": 1, "status": "queued"},
+        {"job_fingerprint": "", "rank": 4},
+    ], str(new_path))
+
+    merged = merge_queue_files(
+        [str(old_path), str(tmp_path / "missing.csv"), str(new_path)], str(out_path)
+    )
+
+    assert [row["job_fingerprint"] for row in merged] == ["fresh", "abc", "gone"]
+    abc = merged[1]
+    assert abc["company"] == "NewCo"
+    assert abc["rank"] == "3"
+    assert abc["status"] == "applied"
+    assert abc["notes"] == "Emailed recruiter"
+    assert merged[0]["status"] == "queued"
+    assert read_queue_csv(str(out_path)) == merged
+
+
+def test_merge_queue_files_newer_edits_win(tmp_path):
+    """Test that human edits in a newer queue override older edits."""
+    paths = [str(tmp_path / f"q{i}.csv") for i in range(3)]
+    write_queue_csv([
+        {"job_fingerprint": "abc", "rank": 1, "status": "applied", "notes": "sent CV"},
+    ], paths[0])
+    write_queue_csv([
+        {"job_fingerprint": "abc", "rank": 1, "status": "interviewing",
+         "notes": "onsite 10/20"},
+    ], paths[1])
+    write_queue_csv([
+        {"job_fingerprint": "abc", "rank": 1, "status": "queued", "notes": ""},
+    ], paths[2])
+
+    merged = merge_queue_files(paths, str(tmp_path / "merged.csv"))
+
+    assert merged[0]["status"] == "interviewing"
+    assert merged[0]["notes"] == "onsite 10/20"
+
+
 def test_write_queue_csv_creates_file(tmp_path):
     """Test that write_queue_csv creates file with correct structure."""
     queue_path = tmp_path / "queue.csv"
@@ -441,3 +590,112 @@ def test_write_queue_csv_column_order():
             assert list(reader.fieldnames) == QUEUE_COLUMNS
     finally:
         Path(temp_path).unlink()
+
+
+def test_write_queue_csv_matches_dictwriter(tmp_path):
+    """Test output is identical to csv.DictWriter for complete and partial rows."""
+    complete = {col: f"{col}-value" for col in QUEUE_COLUMNS}
+    complete["rank"] = 2
+    complete["notes"] = 'needs "quotes", commas\nand newlines'
+    partial = {"job_fingerprint": "def456", "rank": 1, "status": "applied"}
+    rows = [complete, partial]
+
+    queue_path = tmp_path / "queue.csv"
+    write_queue_csv(rows, str(queue_path))
+
+    expected_path = tmp_path / "expected.csv"
+    with open(expected_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=QUEUE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    assert queue_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_write_queue_csv_rejects_unknown_columns(tmp_path):
+    """Test that rows with columns outside QUEUE_COLUMNS raise ValueError."""
+    rows = [{"job_fingerprint": "abc123", "unexpected": "x"}]
+
+    with pytest.raises(ValueError, match="unexpected"):
+        write_queue_csv(rows, str(tmp_path / "queue.csv"))
+
+
+def test_write_queue_csv_invalid_row_keeps_existing_file(tmp_path):
+    """Test that a failed write does not truncate an existing queue."""
+    queue_path = tmp_path / "queue.csv"
+    write_queue_csv([{"job_fingerprint": "abc123", "status": "applied"}], str(queue_path))
+    before = queue_path.read_bytes()
+
+    rows = [{"job_fingerprint": "def456"}, {"unexpected": "x"}]
+    with pytest.raises(ValueError):
+        write_queue_csv(rows, str(queue_path))
+
+    assert queue_path.read_bytes() == before
+
+
+def test_write_queue_csv_creates_parent_once(tmp_path, monkeypatch):
+    """Test parent dirs are created once and recreated if removed."""
+    import shutil
+
+    queue_dir = tmp_path / "out" / "user"
+    mkdir_calls = []
+    real_mkdir = Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        mkdir_calls.append(self)
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+
+    write_queue_csv([], str(queue_dir / "a.csv"))
+    created = len(mkdir_calls)
+    write_queue_csv([], str(queue_dir / "b.csv"))
+    assert len(mkdir_calls) == created
+
+    shutil.rmtree(tmp_path / "out")
+    write_queue_csv([{"job_fingerprint": "abc123"}], str(queue_dir / "a.csv"))
+
+    assert len(mkdir_calls) > created
+    assert read_queue_csv(str(queue_dir / "a.csv"))[0]["job_fingerprint"] == "abc123"
+
+
+def test_write_queue_csv_skips_unchanged_file(tmp_path):
+    """Test that rewriting identical rows leaves the file untouched."""
+    import os
+
+    queue_path = tmp_path / "queue.csv"
+    rows = [{"job_fingerprint": "abc123", "rank": 1, "status": "applied"}]
+
+    assert write_queue_csv(rows, str(queue_path)) is True
+    os.utime(queue_path, ns=(0, 0))
+
+    assert write_queue_csv(rows, str(queue_path)) is False
+    assert queue_path.stat().st_mtime_ns == 0
+
+    rows[0]["status"] = "interview"
+    assert write_queue_csv(rows, str(queue_path)) is True
+    assert read_queue_csv(str(queue_path))[0]["status"] == "interview"
+
+
+def test_read_queue_csv_reordered_columns_and_short_rows(tmp_path):
+    """Test columns are matched by name and short rows read like DictReader."""
+    queue_path = tmp_path / "queue.csv"
+    queue_path.write_text(
+        "status,extra,job_fingerprint,rank\n"
+        "applied,x,abc123,1\n"
+        "\n"
+        "queued,y\n",
+        encoding="utf-8",
+    )
+
+    rows = read_queue_csv(str(queue_path))
+
+    assert len(rows) == 2
+    assert list(rows[0]) == QUEUE_COLUMNS
+    assert rows[0]["job_fingerprint"] == "abc123"
+    assert rows[0]["rank"] == "1"
+    assert rows[0]["status"] == "applied"
+    assert rows[0]["notes"] == ""
+    # Header columns missing from a short row read as None (DictReader restval)
+    assert rows[1]["status"] == "queued"
+    assert rows[1]["job_fingerprint"] is None
@@ -102,7 +102,7 @@ def test_build_apply_pack_respects_top_n():
             "missing_keywords": [],
             "job_fingerprint": f"job{i}",
         }
-        for i in range(50)  # 50 matches
+        for i in reversed(range(50))  # 50 matches, lowest score first
     ]
 
     discovery_result = {
@@ -118,9 +118,9 @@ def test_build_apply_pack_respects_top_n():
     assert pack["top_n"] == 10
     assert len(pack["applications"]) == 10
 
-    # Verify they're the top 10 by score
-    assert pack["applications"][0]["score"] == 100
-    assert pack["applications"][9]["score"] == 91
+    # Verify they're the top 10 by score, best first, despite input order
+    assert [app["score"] for app in pack["applications"]] == list(range(100, 90, -1))
+    assert [app["rank"] for app in pack["applications"]] == list(range(1, 11))
 
 
 def test_build_apply_pack_stable_ordering():
@@ -300,15 +300,15 @@ def test_build_apply_pack_checklist_all_strong_fit():
     assert pack["checklist"]["needs_manual_review"] is False
 
 
-def test_build_apply_pack_url_validation_known_ats():
-    """Test that URL validation works for known ATS domains."""
-    discovery_result = {
+def _single_match_result(job_url: str) -> dict:
+    """Build a discovery result with one strong_fit match at job_url."""
+    return {
         "candidate": {"name": "Test"},
         "matches": [
             {
                 "job_title": "Engineer",
-                "job_company": "TechCorp",
-                "job_url": "https://boards.greenhouse.io/techcorp/jobs/123",
+                "job_company": "TestCorp",
+                "job_url": job_url,
                 "overall_score": 90.0,
                 "decision": "strong_fit",
             },
@@ -316,112 +316,63 @@ def test_build_apply_pack_url_validation_known_ats():
         "counts": {"jobs": 1, "matches": 1, "errors": 0},
     }
 
-    pack = build_apply_pack(discovery_result, top_n=25)
-
-    app = pack["applications"][0]
-    assert app["url_valid"] is True
-    assert app["url_domain"] == "boards.greenhouse.io"
-    assert app["url_policy"] == "allowed"
-    assert app["url_reason"] == "known_ats"
-
-    # Verify url_review_summary
-    assert pack["url_review_summary"]["allowed"] == 1
-    assert pack["url_review_summary"]["manual_review"] == 0
-    assert pack["url_review_summary"]["blocked"] == 0
-
-
-def test_build_apply_pack_url_validation_unknown_domain():
-    """Test that unknown domains are flagged for manual review."""
-    discovery_result = {
-        "candidate": {"name": "Test"},
-        "matches": [
-            {
-                "job_title": "Engineer",
-                "job_company": "UnknownCorp",
-                "job_url": "https://unknown-company.com/careers",
-                "overall_score": 90.0,
-                "decision": "strong_fit",
-            },
-        ],
-        "counts": {"jobs": 1, "matches": 1, "errors": 0},
-    }
 
-    pack = build_apply_pack(discovery_result, top_n=25)
+@pytest.mark.parametrize(
+    "job_url,company_domains,url_valid,url_domain,url_policy,url_reason",
+    [
+        # Known ATS domain
+        (
+            "https://boards.greenhouse.io/techcorp/jobs/123",
+            None,
+            True,
+            "boards.greenhouse.io",
+            "allowed",
+            "known_ats",
+        ),
+        # Unknown domain is flagged for manual review
+        (
+            "https://unknown-company.com/careers",
+            None,
+            True,
+            "unknown-company.com",
+            "manual_review",
+            "unknown_domain",
+        ),
+        # Non-HTTPS URL is blocked
+        ("http://bad-company.com/job", None, False, "", "blocked", "non_https"),
+        # Company domains are allowed
+        (
+            "https://acme.com/careers/job/123",
+            {"acme.com", "techcorp.io"},
+            True,
+            "acme.com",
+            "allowed",
+            "company_domain",
+        ),
+    ],
+    ids=["known_ats", "unknown_domain", "blocked", "company_domain"],
+)
+def test_build_apply_pack_url_validation(
+    job_url, company_domains, url_valid, url_domain, url_policy, url_reason
+):
+    """Test URL policy fields and url_review_summary for a single match."""
+    pack = build_apply_pack(
+        _single_match_result(job_url), top_n=25, company_domains=company_domains
+    )
 
     app = pack["applications"][0]
-    assert app["url_valid"] is True
-    assert app["url_domain"] == "unknown-company.com"
-    assert app["url_policy"] == "manual_review"
-    assert app["url_reason"] == "unknown_domain"
+    assert app["url_valid"] is url_valid
+    assert app["url_domain"] == url_domain
+    assert app["url_policy"] == url_policy
+    assert app["url_reason"] == url_reason
 
     # Verify url_review_summary
-    assert pack["url_review_summary"]["allowed"] == 0
-    assert pack["url_review_summary"]["manual_review"] == 1
-    assert pack["url_review_summary"]["blocked"] == 0
-
-    # needs_manual_review should be True (unknown URL)
-    assert pack["checklist"]["needs_manual_review"] is True
+    expected_summary = {"allowed": 0, "manual_review": 0, "blocked": 0}
+    expected_summary[url_policy] = 1
+    assert pack["url_review_summary"] == expected_summary
 
-
-def test_build_apply_pack_url_validation_blocked():
-    """Test that invalid URLs are blocked."""
-    discovery_result = {
-        "candidate": {"name": "Test"},
-        "matches": [
-            {
-                "job_title": "Engineer",
-                "job_company": "BadCorp",
-                "job_url": "http://bad-company.com/job",  # Non-HTTPS
-                "overall_score": 90.0,
-                "decision": "strong_fit",
-            },
-        ],
-        "counts": {"jobs": 1, "matches": 1, "errors": 0},
-    }
-
-    pack = build_apply_pack(discovery_result, top_n=25)
-
-    app = pack["applications"][0]
-    assert app["url_valid"] is False
-    assert app["url_domain"] == ""
-    assert app["url_policy"] == "blocked"
-    assert app["url_reason"] == "non_https"
-
-    # Verify url_review_summary
-    assert pack["url_review_summary"]["allowed"] == 0
-    assert pack["url_review_summary"]["manual_review"] == 0
-    assert pack["url_review_summary"]["blocked"] == 1
-
-
-def test_build_apply_pack_url_validation_company_domains():
-    """Test that company domains are allowed."""
-    discovery_result = {
-        "candidate": {"name": "Test"},
-        "matches": [
-            {
-                "job_title": "Engineer",
-                "job_company": "AcmeCorp",
-                "job_url": "https://acme.com/careers/job/123",
-                "overall_score": 90.0,
-                "decision": "strong_fit",
-            },
-        ],
-        "counts": {"jobs": 1, "matches": 1, "errors": 0},
-    }
-
-    company_domains = {"acme.com", "techcorp.io"}
-    pack = build_apply_pack(discovery_result, top_n=25, company_domains=company_domains)
-
-    app = pack["applications"][0]
-    assert app["url_valid"] is True
-    assert app["url_domain"] == "acme.com"
-    assert app["url_policy"] == "allowed"
-    assert app["url_reason"] == "company_domain"
-
-    # Verify url_review_summary
-    assert pack["url_review_summary"]["allowed"] == 1
-    assert pack["url_review_summary"]["manual_review"] == 0
-    assert pack["url_review_summary"]["blocked"] == 0
+    # A strong_fit match only needs manual review for an unknown URL
+    assert pack["checklist"]["needs_manual_review"] is (url_policy == "manual_review")
 
 
 def test_build_apply_pack_url_validation_mixed():
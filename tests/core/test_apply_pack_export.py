@@ -65,6 +65,20 @@ def test_write_apply_pack_json_creates_directories(tmp_path):
     assert output_path.parent.exists()
 
 
+def test_write_apply_pack_json_compact(tmp_path):
+    """Test compact JSON export is single-line, key-sorted and newline-terminated."""
+    pack = {"top_n": 1, "applications": [{"rank": 1, "company": "TechCorp"}]}
+    output_path = tmp_path / "pack.json"
+
+    written = write_apply_pack_json(pack, str(output_path), indent=False)
+
+    data = output_path.read_bytes()
+    assert written == len(data)
+    assert data == (
+        json.dumps(pack, sort_keys=True, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
+
+
 def test_write_apply_pack_csv_creates_file(tmp_path):
     """Test that CSV export creates file with expected content."""
     pack = {
@@ -204,6 +218,55 @@ def test_write_apply_pack_csv_graceful_missing_fields(tmp_path):
     assert row["reasons"] == ""
 
 
+def test_write_apply_pack_csv_matches_dictwriter_output(tmp_path):
+    """Test CSV bytes match a DictWriter export, including quoting."""
+    app = {
+        "rank": 1,
+        "score": 88.5,
+        "decision": "possible_fit",
+        "company": 'Acme, "Inc"',
+        "job_title": "Engineer\nII",
+        "location": "Remote",
+        "apply_url": "https://acme.com/jobs/1",
+        "source": "jobs",
+        "url_policy": "manual_review",
+        "url_reason": "unknown_domain",
+        "reasons": ["Strong python", "Remote; flexible"],
+        "matched_keywords": ["python"],
+        "missing_keywords": [],
+    }
+    output_path = tmp_path / "pack.csv"
+    write_apply_pack_csv({"applications": [app, {"rank": 2}]}, str(output_path))
+
+    fieldnames = list(app)
+    expected_path = tmp_path / "expected.csv"
+    with open(expected_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in (app, {"rank": 2}):
+            writer.writerow({
+                key: "; ".join(row.get(key, []))
+                if key in ("reasons", "matched_keywords", "missing_keywords")
+                else row.get(key, "")
+                for key in fieldnames
+            })
+
+    assert output_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_write_apply_pack_csv_null_list_fields(tmp_path):
+    """Test that null list fields are written as empty cells."""
+    pack = {"applications": [{"rank": 1, "reasons": None, "matched_keywords": None}]}
+    output_path = tmp_path / "pack.csv"
+
+    write_apply_pack_csv(pack, str(output_path))
+
+    with open(output_path, "r", encoding="utf-8", newline="") as f:
+        row = next(csv.DictReader(f))
+    assert row["reasons"] == ""
+    assert row["matched_keywords"] == ""
+
+
 def test_write_apply_pack_csv_includes_url_policy_fields(tmp_path):
     """Test that CSV export includes url_policy and url_reason fields."""
     pack = {
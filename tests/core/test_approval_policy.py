@@ -10,6 +10,7 @@ from jobflow.app.core.approval_policy import (
     ALLOWED_PIPELINES,
     FORBIDDEN_KEYWORDS,
     evaluate_policy,
+    evaluate_policy_with_reason,
     get_policy_failure_reason,
 )
 
@@ -303,6 +304,33 @@ def test_get_policy_failure_reason_multiple_failures():
     assert "forbidden keywords" in reason
 
 
+def test_evaluate_policy_with_reason_safe_plan(safe_plan):
+    """Test single-pass evaluation approves a safe plan."""
+    assert evaluate_policy_with_reason(safe_plan) == (True, "Auto-approved by policy")
+
+
+def test_evaluate_policy_with_reason_matches_two_pass_result():
+    """Test single-pass evaluation agrees with evaluate_policy + failure reason."""
+    plan = {
+        "pipeline_name": "bad_pipeline",
+        "steps": ["Delete all", 42, "Send emails"],
+        "risks": ["High risk"],
+        "assumptions": []
+    }
+
+    approved, reason = evaluate_policy_with_reason(plan)
+
+    assert approved is evaluate_policy(plan) is False
+    assert reason == get_policy_failure_reason(plan)
+
+
+def test_evaluate_policy_with_reason_invalid_plan():
+    """Test single-pass evaluation rejects non-dict plans."""
+    assert evaluate_policy_with_reason("not a dict") == (
+        False, "Plan is not a valid dictionary"
+    )
+
+
 def test_allowed_pipelines_constant():
     """Test that ALLOWED_PIPELINES contains job_discovery."""
     assert "job_discovery" in ALLOWED_PIPELINES
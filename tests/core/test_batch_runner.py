@@ -24,6 +24,18 @@ def test_safe_slug_basic():
     assert safe_slug("Test User 123") == "test_user_123"
 
 
+def test_safe_slug_is_memoized():
+    """Test repeated names are served from the slug cache."""
+    safe_slug.cache_clear()
+
+    assert safe_slug("Repeat Name") == "repeat_name"
+    assert safe_slug("Repeat Name") == "repeat_name"
+
+    info = safe_slug.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
 def test_safe_slug_special_chars():
     """Test slug with special characters."""
     assert safe_slug("user@domain.com") == "userdomaincom"
@@ -105,6 +117,27 @@ def test_discover_candidate_folders_filters_non_candidates(tmp_path):
     assert "valid" in folders[0]
 
 
+def test_discover_candidate_folders_returns_absolute_sorted_dirs(tmp_path, monkeypatch):
+    """Test relative input yields sorted absolute paths and ignores plain files."""
+    candidates_dir = tmp_path / "candidates"
+    candidates_dir.mkdir()
+    for name in ["zed", "amy", "mia"]:
+        (candidates_dir / name).mkdir()
+    (candidates_dir / "zed" / "application.xlsx").write_bytes(b"")
+    (candidates_dir / "amy" / "resume.docx").write_bytes(b"")
+    (candidates_dir / "mia" / "notes.md").write_text("Notes")
+    (candidates_dir / "stray.txt").write_text("Not a folder")
+
+    monkeypatch.chdir(tmp_path)
+    folders = discover_candidate_folders("candidates")
+
+    assert folders == [
+        str(candidates_dir / "amy"),
+        str(candidates_dir / "mia"),
+        str(candidates_dir / "zed"),
+    ]
+
+
 def test_run_batch_single_candidate(tmp_path):
     """Test batch run with single candidate (Anusha)."""
     from jobflow.app.core.file_job_source import FileJobSource
@@ -166,6 +199,34 @@ def test_run_batch_single_candidate(tmp_path):
     assert candidate_result["candidate"]["name"] == "Anusha Kayam"
 
 
+def test_run_batch_gzip_output(tmp_path):
+    """Test gzip_output writes compressed per-candidate JSON that round-trips."""
+    import gzip
+
+    from jobflow.app.core.file_job_source import FileJobSource
+
+    candidates_dir = Path(__file__).parent.parent / "fixtures" / "candidates"
+    jobs_file = Path(__file__).parent.parent / "fixtures" / "jobs_sample.json"
+    source = FileJobSource("jobs", str(jobs_file))
+
+    plain = run_batch(str(candidates_dir), [source], str(tmp_path / "plain"))
+    packed = run_batch(str(candidates_dir), [source], str(tmp_path / "packed"), gzip_output=True)
+
+    plain_files = sorted(Path(plain["results_dir"]).glob("*/results.json"))
+    packed_files = sorted(Path(packed["results_dir"]).glob("*/results.json.gz"))
+    assert len(packed_files) == len(plain_files) >= 1
+    assert not list(Path(packed["results_dir"]).glob("*/results.json"))
+    assert list(Path(packed["apply_packs_dir"]).glob("*/applications_ready.json.gz"))
+
+    with gzip.open(packed_files[0], "rb") as f:
+        packed_result = json.load(f)
+    with open(plain_files[0], "r", encoding="utf-8") as f:
+        plain_result = json.load(f)
+    assert packed_result.keys() == plain_result.keys()
+
+    assert 0 < packed["json_bytes_written"] < plain["json_bytes_written"]
+
+
 def test_run_batch_no_matching(tmp_path):
     """Test batch run without matching."""
     from jobflow.app.core.file_job_source import FileJobSource
@@ -323,6 +384,50 @@ def test_run_batch_handles_errors(tmp_path):
     assert "failed" in statuses
 
 
+def test_run_batch_escapes_non_ascii_in_results_and_errors(tmp_path):
+    """Test results.json and errors.json keep ASCII escaping for non-ASCII text."""
+    from jobflow.app.core.file_job_source import FileJobSource
+    from scripts.generate_xlsx_fixture import generate_application_xlsx
+
+    candidates_dir = tmp_path / "candidates"
+    candidates_dir.mkdir()
+
+    valid = candidates_dir / "josé"
+    valid.mkdir()
+    generate_application_xlsx(
+        str(valid / "application.xlsx"),
+        {"Name": "José Müller", "Email": "jose@example.com", "Phone": "555-0000", "Location": "Zürich"}
+    )
+    (valid / "resume.txt").write_text("Resume with Python and SQL", encoding="utf-8")
+
+    # Failing candidate whose folder name ends up in errors.json
+    invalid = candidates_dir / "zoë"
+    invalid.mkdir()
+    generate_application_xlsx(str(invalid / "application.xlsx"), {})
+
+    jobs_file = Path(__file__).parent.parent / "fixtures" / "jobs_sample.json"
+    result = run_batch(
+        candidates_dir=str(candidates_dir),
+        job_sources=[FileJobSource("jobs", str(jobs_file))],
+        out_dir=str(tmp_path / "output"),
+        match_jobs=True,
+    )
+
+    assert result["failed"] == 1
+    (results_file,) = Path(result["results_dir"]).glob("*/results.json")
+    results_bytes = results_file.read_bytes()
+    errors_bytes = Path(result["errors_path"]).read_bytes()
+
+    assert results_bytes.isascii()
+    assert errors_bytes.isascii()
+    assert b"Jos\\u00e9 M\\u00fcller" in results_bytes
+    assert json.loads(results_bytes)["candidate"]["name"] == "José Müller"
+    assert "zoë" in json.loads(errors_bytes)[0]["folder"]
+    assert results_bytes == (
+        json.dumps(json.loads(results_bytes), indent=2, sort_keys=True) + "\n"
+    ).encode("ascii")
+
+
 def test_run_batch_deterministic(tmp_path):
     """Test that batch run is deterministic."""
     from jobflow.app.core.file_job_source import FileJobSource
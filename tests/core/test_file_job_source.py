@@ -310,3 +310,35 @@ def test_file_job_source_utf8_encoding(tmp_path):
     assert len(jobs) == 1
     assert jobs[0]["title"] == "Ingénieur Logiciel"
     assert jobs[0]["company"] == "Société Française"
+
+
+def test_file_job_source_reuses_parsed_file(tmp_path):
+    """Test repeated fetches parse the file once until it changes."""
+    import os
+    from unittest.mock import patch
+
+    from jobflow.app.core import file_job_source
+
+    json_file = tmp_path / "jobs.json"
+    json_file.write_text(json.dumps([{"title": "A"}]), encoding="utf-8")
+    source = FileJobSource("local", str(json_file))
+
+    with patch.object(
+        file_job_source, "read_json_file", wraps=file_job_source.read_json_file
+    ) as mock_read:
+        first = source.fetch_raw_jobs()
+        first.append({"title": "caller-added"})
+        second = source.fetch_raw_jobs()
+
+        assert mock_read.call_count == 1
+        assert second == [{"title": "A"}]
+
+        # Rewrite with a different size and a later mtime
+        json_file.write_text(json.dumps([{"title": "B"}, {"title": "C"}]), encoding="utf-8")
+        stat = json_file.stat()
+        os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        third = source.fetch_raw_jobs()
+
+        assert mock_read.call_count == 2
+        assert [job["title"] for job in third] == ["B", "C"]
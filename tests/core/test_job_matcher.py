@@ -6,7 +6,7 @@ Tests deterministic candidate-to-job matching with dimension scoring.
 
 import pytest
 
-from jobflow.app.core.job_matcher import match_job
+from jobflow.app.core.job_matcher import match_job, match_jobs
 from jobflow.app.core.job_model import JobPosting
 
 
@@ -831,3 +831,86 @@ def test_match_job_deterministic():
     assert result1.matched_keywords == result2.matched_keywords
     assert result1.missing_keywords == result2.missing_keywords
     assert result1.reasons == result2.reasons
+
+
+def test_match_jobs_matches_per_job_results():
+    """Test that batch matching returns the same results as match_job, in order."""
+    candidate = {
+        "email": "test@example.com",
+        "skills": ["Python", "AWS"],
+        "desired_titles": ["Backend Engineer"],
+        "preferred_locations": ["SF"],
+        "years_experience": 3,
+    }
+
+    jobs = [
+        JobPosting(
+            title=title,
+            company="Corp",
+            location=location,
+            description="Build systems with Docker",
+            requirements=requirements,
+            salary_min=None,
+            salary_max=None,
+            currency="USD",
+            employment_type="full-time",
+            remote=False,
+            source="test",
+            url=f"https://example.com/batch{i}",
+            posted_date="2024-01-01",
+            tags=[],
+            raw={},
+        )
+        for i, (title, location, requirements) in enumerate([
+            ("Backend Engineer", "SF", ["Python", "AWS"]),
+            ("Senior Data Scientist", "NYC", ["R", "Statistics"]),
+            ("Junior Developer", "SF", ["Java"]),
+        ])
+    ]
+
+    results = match_jobs(candidate, jobs)
+
+    assert [r.to_dict() for r in results] == [
+        match_job(candidate, job).to_dict() for job in jobs
+    ]
+
+
+def test_match_job_reject_early_returns_none_for_rejects():
+    """Test reject_early skips rejects but leaves other results unchanged."""
+    candidate = {
+        "email": "test@example.com",
+        "skills": ["Python"],
+        "desired_titles": ["Backend Engineer"],
+        "preferred_locations": ["SF"],
+        "years_experience": 1,
+    }
+
+    def make_job(title, location, requirements):
+        return JobPosting(
+            title=title,
+            company="Corp",
+            location=location,
+            description="Role description",
+            requirements=requirements,
+            salary_min=None,
+            salary_max=None,
+            currency="USD",
+            employment_type="full-time",
+            remote=False,
+            source="test",
+            url="https://example.com/early",
+            posted_date="2024-01-01",
+            tags=[],
+            raw={},
+        )
+
+    fit = make_job("Backend Engineer", "SF", ["Python"])
+    reject = make_job("Principal Accountant", "NYC", ["CPA", "GAAP", "Audit"])
+
+    assert match_job(candidate, reject).decision == "reject"
+    assert match_job(candidate, reject, reject_early=True) is None
+    assert (
+        match_job(candidate, fit, reject_early=True).to_dict()
+        == match_job(candidate, fit).to_dict()
+    )
+    assert match_jobs(candidate, [fit, reject], reject_early=True)[1] is None
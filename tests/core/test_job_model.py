@@ -6,7 +6,7 @@ Tests the canonical Job domain model with normalization and fingerprinting.
 
 import pytest
 
-from jobflow.app.core.job_model import JobPosting
+from jobflow.app.core.job_model import JobPosting, _normalize_requirements
 
 
 def test_job_posting_creation_basic():
@@ -131,6 +131,18 @@ def test_from_raw_requirements_missing():
     assert job.requirements == []
 
 
+def test_normalize_requirements_dedup_preserves_first_occurrence():
+    """Test optional dedup drops repeats while keeping first-seen order."""
+    items = ["Python", " AWS ", "Python", "", "Docker", "AWS"]
+
+    assert _normalize_requirements(items) == [
+        "Python", "AWS", "Python", "Docker", "AWS"
+    ]
+    assert _normalize_requirements(items, dedup=True) == [
+        "Python", "AWS", "Docker"
+    ]
+
+
 def test_from_raw_salary_from_integers():
     """Test salary parsing from integer values."""
     raw = {
@@ -672,3 +684,21 @@ def test_from_raw_comprehensive():
     assert job.remote is True
     assert job.tags == ["python", "backend", "remote"]
     assert job.raw == raw
+
+
+def test_to_dict_copy_false_shares_lists():
+    """Test that to_dict(copy=False) skips defensive copies."""
+    job = JobPosting(
+        title="Engineer",
+        company="Corp",
+        location="NYC",
+        description="Work",
+        requirements=["Python", "AWS"],
+        tags=["backend"],
+    )
+
+    result = job.to_dict(copy=False)
+
+    assert result == job.to_dict()
+    assert result["requirements"] is job.requirements
+    assert result["tags"] is job.tags
@@ -0,0 +1,93 @@
+"""
+Unit tests for match_result.py
+
+Tests MatchResult validation of scores and decision thresholds.
+"""
+
+import re
+
+import pytest
+
+from jobflow.app.core.match_result import MatchResult
+
+
+def _make(overall_score, decision, dimension_scores=None):
+    return MatchResult(
+        candidate_id="c1",
+        job_fingerprint="fp",
+        overall_score=overall_score,
+        decision=decision,
+        dimension_scores=dimension_scores or {"skills_overlap": 50.0},
+        reasons=[],
+        matched_keywords=[],
+        missing_keywords=[],
+    )
+
+
+@pytest.mark.parametrize(
+    "score,decision",
+    [
+        (100, "strong_fit"),
+        (80, "strong_fit"),
+        (79.99, "possible_fit"),
+        (65, "possible_fit"),
+        (64.5, "weak_fit"),
+        (45, "weak_fit"),
+        (44.99, "reject"),
+        (0, "reject"),
+    ],
+)
+def test_decision_thresholds_accept_boundary_scores(score, decision):
+    """Test each decision accepts scores inside its range."""
+    result = _make(score, decision)
+
+    assert result.decision == decision
+
+
+@pytest.mark.parametrize(
+    "score,decision,requirement",
+    [
+        (79.99, "strong_fit", ">= 80"),
+        (80, "possible_fit", "65-79"),
+        (64.99, "possible_fit", "65-79"),
+        (65, "weak_fit", "45-64"),
+        (44, "weak_fit", "45-64"),
+        (45, "reject", "< 45"),
+    ],
+)
+def test_decision_thresholds_reject_mismatched_scores(score, decision, requirement):
+    """Test decisions outside their score range raise ValueError."""
+    expected = f"decision '{decision}' requires score {requirement}, got {score}"
+    with pytest.raises(ValueError, match=re.escape(expected)):
+        _make(score, decision)
+
+
+def test_unknown_decision_raises():
+    """Test unknown decision strings are rejected."""
+    with pytest.raises(ValueError, match="decision must be one of"):
+        _make(90, "great_fit")
+
+
+def test_overall_score_out_of_range_raises():
+    """Test overall_score must be within 0-100."""
+    with pytest.raises(ValueError, match="overall_score must be 0-100"):
+        _make(101, "strong_fit")
+
+
+def test_dimension_score_out_of_range_names_dimension():
+    """Test invalid dimension score error names the offending dimension."""
+    with pytest.raises(ValueError, match="dimension score 'title_alignment'"):
+        _make(90, "strong_fit", {"skills_overlap": 90.0, "title_alignment": 120.0})
+
+
+def test_to_dict_defensive_copy_by_default():
+    """Test to_dict copies container fields unless copy=False."""
+    result = _make(90, "strong_fit")
+
+    copied = result.to_dict()
+    shared = result.to_dict(copy=False)
+
+    assert copied == shared
+    assert copied["dimension_scores"] is not result.dimension_scores
+    assert shared["dimension_scores"] is result.dimension_scores
+    assert shared["reasons"] is result.reasons
@@ -407,3 +407,38 @@ def test_execute_from_directive_approval_metadata_structure(
                 assert approval_meta["approved_by"] == "user@example.com"
                 assert approval_meta["scope"] == "session"
                 assert isinstance(approval_meta["approved_at"], str)
+
+
+def test_execute_from_directive_reuses_plan_for_unchanged_directive(
+    tmp_path,
+    monkeypatch,
+    mock_openai_response,
+    mock_orchestrator_result,
+    mock_plan
+):
+    """Test repeated executions only call the LLM once per directive content."""
+    directives_dir = tmp_path / "directives"
+    directives_dir.mkdir()
+    directive_file = directives_dir / "job_discovery.md"
+    directive_file.write_text("# Job discovery", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    approval = create_approval(mock_plan, "policy")
+
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("jobflow.app.core.plan_executor.run_pipeline") as mock_run_pipeline:
+            mock_run_pipeline.side_effect = lambda *_: dict(mock_orchestrator_result)
+
+            with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+                execute_from_directive("job_discovery", approval=approval)
+                execute_from_directive("job_discovery", approval=approval)
+                assert mock_client.chat.completions.create.call_count == 1
+
+                # Editing the directive invalidates the cached plan
+                directive_file.write_text("# Job discovery v2", encoding="utf-8")
+                execute_from_directive("job_discovery", approval=approval)
+                assert mock_client.chat.completions.create.call_count == 2
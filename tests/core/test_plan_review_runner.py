@@ -310,3 +310,37 @@ def test_review_directive_result_structure():
             assert isinstance(result["approved"], bool)
             assert isinstance(result["reason"], str)
             assert isinstance(result["plan"], dict)
+
+
+def test_review_directive_reuses_plan_for_unchanged_directive(
+    tmp_path, monkeypatch, mock_openai_response
+):
+    """Test re-reviewing identical directive content skips the LLM call."""
+    directives_dir = tmp_path / "directives"
+    directives_dir.mkdir()
+    directive_file = directives_dir / "job_discovery.md"
+    directive_file.write_text("# Job discovery", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = Mock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            first = review_directive("job_discovery")
+            first["plan"]["steps"].append("mutated")
+            second = review_directive("job_discovery", auto_approve=True)
+
+            assert mock_client.chat.completions.create.call_count == 1
+            assert "mutated" not in second["plan"]["steps"]
+            assert second["approved"] is True
+
+            # Same content under a new mtime is still a cache hit
+            directive_file.write_text("# Job discovery", encoding="utf-8")
+            review_directive("job_discovery")
+            assert mock_client.chat.completions.create.call_count == 1
+
+            directive_file.write_text("# Job discovery v2", encoding="utf-8")
+            review_directive("job_discovery")
+            assert mock_client.chat.completions.create.call_count == 2
@@ -9,7 +9,9 @@ from pathlib import Path
 
 import pytest
 
+from jobflow.app.core import resume_parser
 from jobflow.app.core.resume_parser import (
+    extract_skills_batch,
     extract_skills_from_text,
     extract_text_from_resume,
 )
@@ -43,6 +45,52 @@ def test_extract_text_from_doc_raises_error(tmp_path):
         extract_text_from_resume(str(doc_file))
 
 
+def test_extract_text_from_docx_skips_empty_and_keeps_order(tmp_path):
+    """Test paragraph order is preserved and empty paragraphs are dropped."""
+    docx_path = tmp_path / "ordered.docx"
+    document_xml = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p><w:r><w:t>First</w:t></w:r></w:p>
+    <w:p></w:p>
+    <w:p><w:r><w:t>Sec</w:t></w:r><w:r><w:t>ond</w:t></w:r></w:p>
+    <w:p><w:r><w:t>Third</w:t></w:r></w:p>
+  </w:body>
+</w:document>"""
+    with zipfile.ZipFile(docx_path, "w") as docx:
+        docx.writestr("word/document.xml", document_xml)
+
+    assert extract_text_from_resume(str(docx_path)) == "First\nSecond\nThird"
+
+
+def test_extract_text_from_docx_nested_paragraphs(tmp_path):
+    """Test text-box paragraphs follow their outer paragraph, entities decode."""
+    docx_path = tmp_path / "nested.docx"
+    document_xml = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p><w:r><w:t>Outer</w:t></w:r><w:r><w:txbxContent>
+      <w:p><w:r><w:t>Inner</w:t></w:r></w:p>
+    </w:txbxContent></w:r><w:r><w:t>Tail</w:t></w:r></w:p>
+    <w:p><w:r><w:t>R&amp;D</w:t></w:r></w:p>
+  </w:body>
+</w:document>"""
+    with zipfile.ZipFile(docx_path, "w") as docx:
+        docx.writestr("word/document.xml", document_xml)
+
+    assert extract_text_from_resume(str(docx_path)) == "OuterInnerTail\nInner\nR&D"
+
+
+def test_extract_text_from_docx_malformed_xml(tmp_path):
+    """Test that malformed document XML raises ValueError."""
+    docx_path = tmp_path / "broken.docx"
+    with zipfile.ZipFile(docx_path, "w") as docx:
+        docx.writestr("word/document.xml", "<w:document><w:p>")
+
+    with pytest.raises(ValueError, match="Cannot parse .docx XML"):
+        extract_text_from_resume(str(docx_path))
+
+
 def test_extract_text_from_unsupported_format(tmp_path):
     """Test that unsupported format raises ValueError."""
     pdf_file = tmp_path / "resume.pdf"
@@ -208,3 +256,107 @@ def test_extract_skills_handles_special_chars():
 
     # Should extract something related to these
     assert len(skills) > 0
+
+
+def test_extract_skills_reports_overlapping_keywords():
+    """Test keywords nested inside multi-word skills are still reported."""
+    skills = extract_skills_from_text("built dashboards in power bi and a rest api")
+
+    assert "power bi" in skills
+    assert "bi" in skills
+    assert "rest api" in skills
+    assert "api" in skills
+
+
+def test_extract_skills_keywords_ordered_by_first_occurrence():
+    """Test keyword matches come out in text order, deterministically."""
+    skills = extract_skills_from_text("terraform then python then docker then python")
+
+    assert skills[:3] == ["terraform", "python", "docker"]
+
+
+def test_extract_skills_respects_word_boundaries():
+    """Test single-word keywords do not match inside longer words."""
+    skills = extract_skills_from_text("mysql github")
+
+    assert "mysql" in skills
+    assert "github" in skills
+    assert "sql" not in skills
+    assert "git" not in skills
+
+
+def _write_docx(path, paragraph):
+    document_xml = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body><w:p><w:r><w:t>{paragraph}</w:t></w:r></w:p></w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr("word/document.xml", document_xml)
+
+
+def test_extract_text_from_docx_cached_per_file_version(tmp_path, monkeypatch):
+    """Test unchanged .docx files are parsed once; edits invalidate the cache."""
+    monkeypatch.delenv(resume_parser.RESUME_CACHE_DIR_ENV, raising=False)
+    resume_parser.clear_resume_text_cache()
+    docx_path = tmp_path / "cached.docx"
+    _write_docx(docx_path, "Version one")
+
+    calls = []
+    original = resume_parser._extract_text_from_docx
+    monkeypatch.setattr(
+        resume_parser,
+        "_extract_text_from_docx",
+        lambda path: calls.append(path) or original(path),
+    )
+
+    assert extract_text_from_resume(str(docx_path)) == "Version one"
+    assert extract_text_from_resume(str(docx_path)) == "Version one"
+    assert len(calls) == 1
+
+    _write_docx(docx_path, "Version two, longer")
+    assert extract_text_from_resume(str(docx_path)) == "Version two, longer"
+    assert len(calls) == 2
+
+
+def test_extract_text_from_docx_persistent_content_cache(tmp_path, monkeypatch):
+    """Test identical resume content is served from the on-disk cache."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv(resume_parser.RESUME_CACHE_DIR_ENV, str(cache_dir))
+    resume_parser.clear_resume_text_cache()
+
+    first = tmp_path / "a.docx"
+    _write_docx(first, "Shared resume")
+    assert extract_text_from_resume(str(first)) == "Shared resume"
+    assert len(list(cache_dir.glob("*.txt"))) == 1
+
+    # Same bytes under another name: no parsing needed
+    second = tmp_path / "b.docx"
+    second.write_bytes(first.read_bytes())
+    monkeypatch.setattr(
+        resume_parser,
+        "_extract_text_from_docx",
+        lambda path: pytest.fail("expected persistent cache hit"),
+    )
+    assert extract_text_from_resume(str(second)) == "Shared resume"
+
+
+def test_extract_skills_acronyms_before_capitalized_terms():
+    """Test acronyms are listed before other capitalized terms."""
+    skills = extract_skills_from_text("Built JS.net tools with PowerBI on AWS")
+
+    assert skills == ["powerbi", "aws", "js", "built", "js.net"]
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_extract_skills_batch_matches_single(workers):
+    """Test batch extraction equals per-text extraction, in order."""
+    texts = [
+        "Python and AWS on Kubernetes",
+        "",
+        "Machine learning with TensorFlow",
+        "Built JS.net tools with PowerBI",
+    ]
+
+    results = extract_skills_batch(texts, workers=workers)
+
+    assert results == [extract_skills_from_text(text) for text in texts]
@@ -6,7 +6,7 @@ Tests job search query building from candidate profiles.
 
 import pytest
 
-from jobflow.app.core.search_query import build_job_query
+from jobflow.app.core.search_query import CandidateView, build_job_query
 
 
 def test_build_query_basic_candidate():
@@ -457,3 +457,35 @@ def test_build_query_empty_strings_filtered():
     assert "Python" in query["keywords"]
     assert "AWS" in query["keywords"]
     assert "" not in query["keywords"]
+
+
+def test_candidate_view_reuse():
+    """Test a CandidateView builds equal, independent queries."""
+    candidate = {
+        "desired_title": "Software Engineer",
+        "alternate_titles": "Backend Engineer, software engineer",
+        "location": "Austin, Remote",
+        "remote_preference": "yes",
+        "skills_years": {"Python": 5, "python ": 2, "SQL": 3},
+    }
+
+    view = CandidateView.from_dict(candidate)
+    first = view.as_query()
+    second = view.as_query()
+
+    assert first == second == build_job_query(candidate)
+    assert first["titles"] == ["Software Engineer", "Backend Engineer"]
+    assert first["keywords"] == ["Python", "SQL"]
+    assert first["remote_ok"] is True
+
+    first["titles"].append("Mutated")
+    assert view.as_query()["titles"] == ["Software Engineer", "Backend Engineer"]
+
+
+def test_candidate_view_is_immutable():
+    """Test CandidateView is frozen and slotted."""
+    view = CandidateView.from_dict({"desired_title": "Engineer"})
+
+    with pytest.raises(AttributeError):
+        view.remote_ok = True
+    assert not hasattr(view, "__dict__")
@@ -9,6 +9,9 @@ import pytest
 from jobflow.app.core.url_policy import (
     KNOWN_ATS_DOMAINS,
     evaluate_apply_url,
+    evaluate_apply_urls,
+    is_known_ats_domain,
+    normalize_company_domains,
     normalize_domain,
 )
 
@@ -221,3 +224,157 @@ def test_known_ats_domains_coverage():
 
     for platform in expected_platforms:
         assert platform in KNOWN_ATS_DOMAINS, f"{platform} should be in KNOWN_ATS_DOMAINS"
+
+
+
+def test_known_ats_domains_are_normalized():
+    """Test that KNOWN_ATS_DOMAINS is immutable and stored pre-normalized."""
+    assert isinstance(KNOWN_ATS_DOMAINS, frozenset)
+    assert all(normalize_domain(d) == d for d in KNOWN_ATS_DOMAINS)
+
+
+def test_normalize_company_domains():
+    """Test company domains are normalized into a frozenset."""
+    assert normalize_company_domains({"WWW.Acme.com ", "techcorp.io"}) == frozenset(
+        {"acme.com", "techcorp.io"}
+    )
+    assert normalize_company_domains(None) == frozenset()
+
+
+def test_evaluate_apply_url_prenormalized_company_domains():
+    """Test pre-normalized company domains give the same result."""
+    raw = {"WWW.ACME.COM"}
+    url = "https://acme.com/job"
+
+    result = evaluate_apply_url(url, normalize_company_domains(raw), normalized=True)
+
+    assert result == evaluate_apply_url(url, raw)
+    assert result["url_reason"] == "company_domain"
+
+
+def test_evaluate_apply_urls_batch():
+    """Test batch evaluation matches per-URL evaluation in order."""
+    urls = [
+        "https://greenhouse.io/job",
+        "https://www.acme.com/job",
+        "http://acme.com/job",
+        "https://unknown.com/job",
+        "",
+    ]
+    company_domains = {"Acme.com"}
+
+    results = evaluate_apply_urls(urls, company_domains)
+
+    assert results == [evaluate_apply_url(url, company_domains) for url in urls]
+    assert [r["url_reason"] for r in results] == [
+        "known_ats",
+        "company_domain",
+        "non_https",
+        "unknown_domain",
+        "missing_url",
+    ]
+
+
+def test_evaluate_apply_url_blocked_results_are_independent():
+    """Test blocked results are fresh dicts, safe to mutate."""
+    first = evaluate_apply_url("")
+    first["url_reason"] = "edited"
+
+    assert evaluate_apply_url("")["url_reason"] == "missing_url"
+
+
+@pytest.mark.parametrize(
+    "domain, expected",
+    [
+        ("greenhouse.io", True),
+        ("boards.greenhouse.io", True),
+        ("acme.myworkdayjobs.com", True),
+        ("jobs.acme.workday.com", True),
+        ("evilgreenhouse.io", False),
+        ("greenhouse.io.evil.com", False),
+        ("io", False),
+        ("", False),
+    ],
+)
+def test_is_known_ats_domain(domain, expected):
+    """Test ATS matching covers subdomains but not look-alike domains."""
+    assert is_known_ats_domain(domain) is expected
+
+
+def test_evaluate_apply_url_known_ats_subdomain():
+    """Test that subdomains of known ATS platforms are allowed."""
+    result = evaluate_apply_url("https://acme.wd5.myworkdayjobs.com/careers/job/1")
+
+    assert result["url_policy"] == "allowed"
+    assert result["url_reason"] == "known_ats"
+    assert result["url_domain"] == "acme.wd5.myworkdayjobs.com"
+
+
+@pytest.mark.parametrize("url", [
+    "https://boards.greenhouse.io/acme/jobs/1",
+    "HTTPS://Jobs.Lever.co/acme",
+    "https://sks.example.com/",
+    "https://acme.com:443/apply",
+    "https://user:pw@acme.com/apply",
+    "https://acme.com?ref=1",
+    "https://acme.com#apply",
+    "https://acme.com\t.evil.com/",
+    "https://acme.com\n",
+    "  https://acme.com  ",
+    "https:acme.com",
+    "https:///path",
+    "https://[::1]/",
+    "https://[broken/",
+    "https://Ünicode.com/",
+    "http://acme.com",
+    "javascript:alert(1)",
+])
+def test_evaluate_apply_url_matches_urlparse(url):
+    """Test the https fast path extracts the same domain urlparse would."""
+    from urllib.parse import urlparse
+
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        expected_policy = "blocked"
+        expected_domain = ""
+    else:
+        valid = parsed.scheme == "https" and bool(parsed.netloc)
+        expected_policy = None if valid else "blocked"
+        expected_domain = normalize_domain(parsed.netloc) if valid else ""
+
+    result = evaluate_apply_url(url, {"acme.com"})
+
+    assert result["url_domain"] == expected_domain
+    if expected_policy is not None:
+        assert result["url_policy"] == expected_policy
+
+
+def test_https_fast_path_handles_plain_urls():
+    """Test ordinary https URLs are served by the regex, not urlparse."""
+    from jobflow.app.core.url_policy import _HTTPS_NETLOC_RE
+
+    match = _HTTPS_NETLOC_RE.match("HTTPS://Jobs.SKS-Works.io/apply?id=1")
+
+    assert match is not None
+    assert match.group(1) == "Jobs.SKS-Works.io"
+
+
+def test_evaluate_apply_urls_large_company_domain_set():
+    """Test company domains match exactly, without subdomains, at any set size."""
+    company_domains = {f"Company{i}.com" for i in range(5000)}
+    urls = [
+        "https://company4999.com/job",
+        "https://www.COMPANY0.com/job",
+        "https://jobs.company42.com/job",
+        "https://notcompany42.com/job",
+    ]
+
+    results = evaluate_apply_urls(urls, company_domains)
+
+    assert [r["url_reason"] for r in results] == [
+        "company_domain",
+        "company_domain",
+        "unknown_domain",
+        "unknown_domain",
+    ]
@@ -4,10 +4,12 @@ Unit tests for xlsx_kv_reader.py
 Tests XLSX key-value pair reading with stdlib only.
 """
 
+import zipfile
 from pathlib import Path
 
 import pytest
 
+from jobflow.app.core import xlsx_kv_reader
 from jobflow.app.core.xlsx_kv_reader import read_xlsx_key_value_pairs
 
 
@@ -100,3 +102,155 @@ def test_read_xlsx_preserves_order():
 
     # Email should be second
     assert keys[1] == "Email"
+
+
+_SHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+
+def _write_xlsx(path, rows_xml, shared_strings=None, dimension=None):
+    """Write a minimal XLSX with the given <sheetData> rows and string pool."""
+    dimension_xml = f'<dimension ref="{dimension}"/>' if dimension else ""
+    with zipfile.ZipFile(path, "w") as xlsx:
+        if shared_strings is not None:
+            items = "".join(f"<si>{s}</si>" for s in shared_strings)
+            xlsx.writestr(
+                "xl/sharedStrings.xml",
+                f'<sst xmlns="{_SHEET_NS}">{items}</sst>',
+            )
+        xlsx.writestr(
+            "xl/worksheets/sheet1.xml",
+            f'<worksheet xmlns="{_SHEET_NS}">{dimension_xml}'
+            f"<sheetData>{rows_xml}</sheetData></worksheet>",
+        )
+    return str(path)
+
+
+def test_read_xlsx_cell_types(tmp_path):
+    """Test shared, rich-text, inline, boolean and numeric cells."""
+    path = _write_xlsx(
+        tmp_path / "types.xlsx",
+        '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+        '<row r="2"><c r="A2" t="inlineStr"><is><t>Inline</t></is></c>'
+        '<c r="B2" t="inlineStr"><is><t>Value</t></is></c></row>'
+        '<row r="3"><c r="A3" t="s"><v>2</v></c><c r="B3" t="b"><v>1</v></c></row>'
+        '<row r="4"><c r="A4" t="s"><v>3</v></c><c r="B4"><v>42</v></c></row>'
+        '<row r="5"><c r="A5" t="s"><v>0</v></c></row>',
+        shared_strings=[
+            "<t>Name</t>",
+            "<r><t>Jane </t></r><r><t>Doe</t></r>",
+            "<t>Remote</t>",
+            "<t>Years</t>",
+        ],
+    )
+
+    result = read_xlsx_key_value_pairs(path)
+
+    assert result == {
+        "Name": "Jane Doe",
+        "Inline": "Value",
+        "Remote": "True",
+        "Years": "42",
+    }
+
+
+def test_read_xlsx_malformed_sheet_returns_empty(tmp_path):
+    """Test that unparseable sheet XML yields an empty dict."""
+    path = tmp_path / "broken.xlsx"
+    with zipfile.ZipFile(path, "w") as xlsx:
+        xlsx.writestr("xl/worksheets/sheet1.xml", "<worksheet><row>")
+
+    assert read_xlsx_key_value_pairs(str(path)) == {}
+
+
+def test_read_xlsx_stdlib_backend_matches_default(monkeypatch):
+    """Test the stdlib fallback parser gives the same result as the default."""
+    fixture_path = Path(__file__).parent.parent / "fixtures" / "candidates" / "anusha" / "application_info.xlsx"
+
+    expected = read_xlsx_key_value_pairs(str(fixture_path))
+    monkeypatch.setattr(xlsx_kv_reader, "_lxml_etree", None)
+
+    assert read_xlsx_key_value_pairs(str(fixture_path)) == expected
+
+
+def test_read_xlsx_skips_shared_strings_without_references(tmp_path):
+    """Test the string pool is not parsed when the sheet never references it."""
+    path = _write_xlsx(
+        tmp_path / "inline.xlsx",
+        '<row r="1"><c r="A1" t="inlineStr"><is><t>Age</t></is></c>'
+        '<c r="B1"><v>30</v></c></row>',
+        # Malformed pool: parsing it would discard every string
+        shared_strings=["<t>unused"],
+    )
+
+    assert read_xlsx_key_value_pairs(path) == {"Age": "30"}
+
+
+def test_read_xlsx_reads_only_referenced_shared_strings(tmp_path):
+    """Test unreferenced and out-of-range shared string indices."""
+    path = _write_xlsx(
+        tmp_path / "sparse.xlsx",
+        '<row r="1"><c r="A1" t="s"><v>2</v></c><c r="B1" t="s"><v>0</v></c></row>'
+        '<row r="2"><c r="A2" t="inlineStr"><is><t>Missing</t></is></c>'
+        '<c r="B2" t="s"><v>9</v></c></row>',
+        shared_strings=["<t>Value</t>", "<t>Unused</t>", "<t>Key</t>"],
+    )
+
+    assert read_xlsx_key_value_pairs(path) == {"Key": "Value", "Missing": ""}
+
+
+def _inline_row(number, key, value):
+    return (
+        f'<row r="{number}"><c r="A{number}" t="inlineStr"><is><t>{key}</t></is></c>'
+        f'<c r="B{number}" t="inlineStr"><is><t>{value}</t></is></c></row>'
+    )
+
+
+def test_read_xlsx_stops_after_dimension_range(tmp_path):
+    """Test rows past the <dimension> range are not read."""
+    rows = "".join(
+        _inline_row(n, key, value)
+        for n, (key, value) in enumerate([("Name", "Jane"), ("City", "Austin"), ("Stale", "x")], 1)
+    )
+    path = _write_xlsx(tmp_path / "dim.xlsx", rows, dimension="A1:B2")
+
+    assert read_xlsx_key_value_pairs(path) == {"Name": "Jane", "City": "Austin"}
+
+
+def test_read_xlsx_ignores_single_cell_dimension(tmp_path):
+    """Test a placeholder "A1" dimension does not truncate the sheet."""
+    rows = _inline_row(1, "Name", "Jane") + _inline_row(2, "City", "Austin")
+    path = _write_xlsx(tmp_path / "a1.xlsx", rows, dimension="A1")
+
+    assert read_xlsx_key_value_pairs(path) == {"Name": "Jane", "City": "Austin"}
+
+
+def test_read_xlsx_max_rows(tmp_path):
+    """Test max_rows limits the rows read."""
+    rows = "".join(_inline_row(n, f"Key{n}", f"Value{n}") for n in range(1, 6))
+    path = _write_xlsx(tmp_path / "limit.xlsx", rows, dimension="A1:B5")
+
+    assert read_xlsx_key_value_pairs(path, max_rows=2) == {
+        "Key1": "Value1",
+        "Key2": "Value2",
+    }
+
+
+@pytest.mark.parametrize(
+    "cell_ref, expected",
+    [("A1", "A"), ("B10", "B"), ("AA5", "AA"), ("XFD1048576", "XFD"), ("", ""), ("1", ""), ("a1", "")],
+)
+def test_get_column_from_ref(cell_ref, expected):
+    """Test column letters are taken from the start of a cell reference."""
+    assert xlsx_kv_reader._get_column_from_ref(cell_ref) == expected
+
+
+def test_read_xlsx_ignores_other_columns(tmp_path):
+    """Test only columns A and B are used, even with wide or sparse rows."""
+    path = _write_xlsx(
+        tmp_path / "wide.xlsx",
+        '<row r="1"><c r="B1"><v>1</v></c><c r="AA1"><v>2</v></c>'
+        '<c r="A1" t="inlineStr"><is><t>Key</t></is></c><c r="C1"><v>3</v></c></row>'
+        '<row r="2"><c r="AA2" t="inlineStr"><is><t>Other</t></is></c><c r="B2"><v>4</v></c></row>',
+    )
+
+    assert read_xlsx_key_value_pairs(path) == {"Key": "1"}
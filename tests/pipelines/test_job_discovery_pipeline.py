@@ -705,3 +705,113 @@ def test_run_job_discovery_with_matching_all_rejects(tmp_path):
     # All jobs should be filtered out as rejects
     assert result["matches"] == []
     assert result["counts"]["matches"] == 0
+
+
+def test_run_job_discovery_variants_match_facade(tmp_path):
+    """Test that the specialized entry points return the same as the facade."""
+    from jobflow.app.core.file_job_source import FileJobSource
+    from pipelines.job_discovery import (
+        run_job_discovery_search_only,
+        run_job_discovery_with_matches,
+    )
+
+    candidate = {
+        "email": "jane@example.com",
+        "skills": ["Python", "AWS"],
+        "desired_titles": ["Software Engineer"],
+    }
+
+    jobs_file = tmp_path / "jobs.json"
+    jobs_file.write_text(json.dumps([
+        {
+            "title": "Software Engineer",
+            "company": "Tech Corp",
+            "location": "SF",
+            "description": "Python development",
+            "requirements": ["Python", "AWS"],
+        },
+    ]))
+    source = FileJobSource("test", str(jobs_file))
+
+    assert run_job_discovery_search_only(candidate, [source]) == run_job_discovery(
+        candidate, [source]
+    )
+    assert run_job_discovery_with_matches(candidate, [source]) == run_job_discovery(
+        candidate, [source], match_jobs=True
+    )
+
+
+def test_run_job_discovery_search_only_skips_matcher_import():
+    """Test that the search-only path never imports the job matcher."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; "
+        "from pipelines.job_discovery import run_job_discovery; "
+        "run_job_discovery({'titles': ['Engineer'], 'keywords': []}, []); "
+        "sys.exit('jobflow.app.core.job_matcher' in sys.modules)"
+    )
+    completed = subprocess.run([sys.executable, "-c", code])
+
+    assert completed.returncode == 0
+
+
+def test_run_job_discovery_raw_jobs_serializes_identically(tmp_path):
+    """Test raw_jobs returns JobPostings that serialize like the dict form."""
+    from jobflow.app.core.file_job_source import FileJobSource
+    from jobflow.app.core.job_model import JobPosting
+    from jobflow.app.util.jsonio import dumps, to_dict_default
+
+    jobs_file = tmp_path / "jobs.json"
+    jobs_file.write_text(json.dumps([
+        {
+            "title": "Data Engineer",
+            "company": "Corp",
+            "location": "NYC",
+            "description": "Spark pipelines",
+            "requirements": ["Spark"],
+        },
+    ]))
+    source = FileJobSource("test", str(jobs_file))
+    query = {"titles": ["Data Engineer"], "keywords": ["Spark"]}
+
+    raw = run_job_discovery(query, [source], raw_jobs=True)
+    plain = run_job_discovery(query, [source])
+
+    assert all(isinstance(job, JobPosting) for job in raw["jobs"])
+    assert dumps(raw, default=to_dict_default) == dumps(plain)
+
+
+def test_run_job_discovery_matching_keeps_tie_order(tmp_path):
+    """Test that jobs with equal scores keep their aggregation order."""
+    from jobflow.app.core.file_job_source import FileJobSource
+
+    candidate = {
+        "email": "jane@example.com",
+        "skills": ["Python"],
+        "desired_titles": ["Software Engineer"],
+    }
+
+    jobs_data = [
+        {
+            "title": "Software Engineer",
+            "company": company,
+            "location": "SF",
+            "description": "Python development",
+            "requirements": ["Python"],
+            "url": f"https://example.com/{company}",
+        }
+        for company in ["Alpha", "Beta", "Gamma"]
+    ]
+
+    jobs_file = tmp_path / "jobs.json"
+    jobs_file.write_text(json.dumps(jobs_data))
+
+    source = FileJobSource("test", str(jobs_file))
+    result = run_job_discovery(candidate, [source], match_jobs=True)
+
+    assert len({m["overall_score"] for m in result["matches"]}) == 1
+    assert [m["job_company"] for m in result["matches"]] == [
+        job["company"] for job in result["jobs"]
+    ]
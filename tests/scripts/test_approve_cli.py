@@ -28,7 +28,7 @@ def test_approve_cli_approved_path():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["approve.py", "job_discovery", "--approved-by", "policy", "--auto-approve"]):
@@ -84,7 +84,7 @@ def test_approve_cli_rejected_path():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["approve.py", "job_discovery", "--approved-by", "policy", "--auto-approve"]):
@@ -121,7 +121,7 @@ def test_approve_cli_with_session_scope():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", [
@@ -158,7 +158,7 @@ def test_approve_cli_writes_to_file(tmp_path):
 
     output_file = tmp_path / "approval.json"
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", [
@@ -203,7 +203,7 @@ def test_approve_cli_default_scope():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["approve.py", "job_discovery", "--approved-by", "policy", "--auto-approve"]):
@@ -228,7 +228,7 @@ def test_approve_cli_without_auto_approve():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["approve.py", "job_discovery", "--approved-by", "policy"]):
@@ -247,7 +247,7 @@ def test_approve_cli_without_auto_approve():
 
 def test_approve_cli_missing_directive():
     """Test CLI with non-existent directive."""
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.side_effect = FileNotFoundError("Directive not found: directives/nonexistent.md")
 
         with patch("sys.argv", ["approve.py", "nonexistent", "--approved-by", "policy"]):
@@ -267,7 +267,7 @@ def test_approve_cli_missing_directive():
 
 def test_approve_cli_missing_api_key():
     """Test CLI with missing OPENAI_API_KEY."""
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.side_effect = ValueError("OPENAI_API_KEY environment variable is not set")
 
         with patch("sys.argv", ["approve.py", "job_discovery", "--approved-by", "policy"]):
@@ -312,7 +312,7 @@ def test_approve_cli_never_calls_orchestrator():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         # Try to import and mock orchestrator
@@ -383,7 +383,7 @@ def test_approve_cli_output_format():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["approve.py", "job_discovery", "--approved-by", "policy", "--auto-approve"]):
@@ -414,7 +414,7 @@ def test_approve_cli_complete_approval_output():
         }
     }
 
-    with patch("jobflow.scripts.approve.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", [
@@ -440,3 +440,70 @@ def test_approve_cli_complete_approval_output():
                 assert isinstance(approval["approved_at"], str)
                 assert isinstance(approval["plan_hash"], str)
                 assert len(approval["plan_hash"]) == 64  # SHA-256 hex
+
+
+def _fake_review(directive_name, auto_approve=False):
+    """Approve 'good_*' directives, reject 'bad_*', fail on anything else."""
+    if directive_name.startswith("good"):
+        return {
+            "directive_name": directive_name,
+            "approved": True,
+            "reason": "Auto-approved by policy",
+            "plan": {"pipeline_name": directive_name, "steps": ["step1"], "risks": [], "assumptions": []}
+        }
+    if directive_name.startswith("bad"):
+        return {"directive_name": directive_name, "approved": False, "reason": "Rejected by policy"}
+    raise FileNotFoundError(f"Directive not found: {directive_name}")
+
+
+@pytest.mark.parametrize("parallel", ["1", "3"])
+def test_approve_cli_multiple_directives(parallel):
+    """Test several directives are reviewed in one call, in argument order."""
+    with patch("jobflow.app.core.plan_review_runner.review_directive", side_effect=_fake_review):
+        with patch("sys.argv", [
+            "approve.py", "good_a", "bad_b", "good_c",
+            "--approved-by", "policy", "--auto-approve", "--parallel", parallel
+        ]):
+            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                exit_code = main()
+
+    output = json.loads(mock_stdout.getvalue())
+    assert exit_code == 2
+    assert [r["directive_name"] for r in output["results"]] == ["good_a", "bad_b", "good_c"]
+    assert [r["approved"] for r in output["results"]] == [True, False, True]
+    assert "approval" in output["results"][0]
+
+
+def test_approve_cli_multiple_directives_error_and_ndjson(tmp_path):
+    """Test errors win the exit code and --out writes one line per directive."""
+    output_file = tmp_path / "approvals.ndjson"
+
+    with patch("jobflow.app.core.plan_review_runner.review_directive", side_effect=_fake_review):
+        with patch("sys.argv", [
+            "approve.py", "good_a", "missing", "bad_c",
+            "--approved-by", "policy", "--out", str(output_file)
+        ]):
+            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                exit_code = main()
+
+    assert exit_code == 1
+    assert str(output_file) in mock_stdout.getvalue()
+
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    results = [json.loads(line) for line in lines]
+    assert [r["directive_name"] for r in results] == ["good_a", "missing", "bad_c"]
+    assert results[1]["error"] == "FileNotFoundError"
+
+
+@pytest.mark.parametrize("module", ["approve", "execute", "review", "batch_run", "drive_sync"])
+def test_cli_modules_import_without_openai(module):
+    """Test importing a CLI module does not pull in the OpenAI client."""
+    import subprocess
+
+    code = (
+        f"import sys, jobflow.scripts.{module}; "
+        "sys.exit('openai' in sys.modules)"
+    )
+    completed = subprocess.run([sys.executable, "-c", code])
+
+    assert completed.returncode == 0
@@ -44,7 +44,7 @@ def test_execute_cli_success(tmp_path, monkeypatch, capsys):
         }
     }
 
-    with patch("jobflow.scripts.execute.execute_from_directive") as mock_execute:
+    with patch("jobflow.app.core.plan_executor.execute_from_directive") as mock_execute:
         mock_execute.return_value = mock_result
 
         # Set command-line arguments
@@ -99,7 +99,7 @@ def test_execute_cli_with_payload(tmp_path, monkeypatch, capsys):
 
     mock_result = {"status": "success"}
 
-    with patch("jobflow.scripts.execute.execute_from_directive") as mock_execute:
+    with patch("jobflow.app.core.plan_executor.execute_from_directive") as mock_execute:
         mock_execute.return_value = mock_result
 
         monkeypatch.setattr("sys.argv", [
@@ -130,7 +130,7 @@ def test_execute_cli_plan_rejected(tmp_path, monkeypatch, capsys):
     approval_file = tmp_path / "approval.json"
     approval_file.write_text(json.dumps(approval))
 
-    with patch("jobflow.scripts.execute.execute_from_directive") as mock_execute:
+    with patch("jobflow.app.core.plan_executor.execute_from_directive") as mock_execute:
         # Mock rejection
         mock_execute.side_effect = PlanRejectedError(
             "Plan execution rejected for directive 'job_discovery'. "
@@ -294,7 +294,7 @@ def test_execute_cli_output_format(tmp_path, monkeypatch, capsys):
 
     mock_result = {"status": "success", "data": {"key": "value"}}
 
-    with patch("jobflow.scripts.execute.execute_from_directive") as mock_execute:
+    with patch("jobflow.app.core.plan_executor.execute_from_directive") as mock_execute:
         mock_execute.return_value = mock_result
 
         monkeypatch.setattr("sys.argv", [
@@ -374,7 +374,7 @@ def test_execute_cli_includes_metadata(tmp_path, monkeypatch, capsys):
         }
     }
 
-    with patch("jobflow.scripts.execute.execute_from_directive") as mock_execute:
+    with patch("jobflow.app.core.plan_executor.execute_from_directive") as mock_execute:
         mock_execute.return_value = mock_result
 
         monkeypatch.setattr("sys.argv", [
@@ -394,3 +394,29 @@ def test_execute_cli_includes_metadata(tmp_path, monkeypatch, capsys):
 
         assert output["_approval_metadata"]["approved_by"] == "user@example.com"
         assert output["_approval_metadata"]["scope"] == "session"
+
+
+def test_execute_cli_compact_output(tmp_path, monkeypatch, capsys):
+    """Test that --compact prints the result as single-line JSON."""
+    approval_file = tmp_path / "approval.json"
+    approval_file.write_text(json.dumps({"plan_hash": "abc123"}))
+
+    mock_result = {"status": "success", "pipeline": "job_discovery", "data": {"a": 1}}
+
+    with patch("jobflow.app.core.plan_executor.execute_from_directive") as mock_execute:
+        mock_execute.return_value = mock_result
+
+        monkeypatch.setattr("sys.argv", [
+            "execute.py",
+            "job_discovery",
+            "--approval", str(approval_file),
+            "--compact"
+        ])
+
+        exit_code = main()
+
+    assert exit_code == 0
+
+    captured = capsys.readouterr()
+    assert captured.out.count("\n") == 1
+    assert json.loads(captured.out) == mock_result
@@ -28,7 +28,7 @@ def test_review_cli_default_rejection():
         }
     }
 
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["review.py", "job_discovery"]):
@@ -70,7 +70,7 @@ def test_review_cli_with_auto_approve():
         }
     }
 
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["review.py", "job_discovery", "--auto-approve"]):
@@ -105,7 +105,7 @@ def test_review_cli_policy_failure():
         }
     }
 
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["review.py", "job_discovery", "--auto-approve"]):
@@ -133,7 +133,7 @@ def test_review_cli_output_format():
         "plan": {"pipeline_name": "test", "steps": [], "risks": [], "assumptions": []}
     }
 
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["review.py", "job_discovery"]):
@@ -160,7 +160,7 @@ def test_review_cli_never_calls_orchestrator():
         "plan": {"pipeline_name": "job_discovery", "steps": [], "risks": [], "assumptions": []}
     }
 
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         # Try to import and mock orchestrator
@@ -190,7 +190,7 @@ def test_review_cli_never_calls_orchestrator():
 
 def test_review_cli_missing_directive_file():
     """Test CLI with non-existent directive."""
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.side_effect = FileNotFoundError("Directive not found: directives/nonexistent.md")
 
         with patch("sys.argv", ["review.py", "nonexistent"]):
@@ -210,7 +210,7 @@ def test_review_cli_missing_directive_file():
 
 def test_review_cli_missing_api_key():
     """Test CLI with missing OPENAI_API_KEY."""
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.side_effect = ValueError("OPENAI_API_KEY environment variable is not set")
 
         with patch("sys.argv", ["review.py", "job_discovery"]):
@@ -260,7 +260,7 @@ def test_review_cli_complete_plan_output():
         }
     }
 
-    with patch("jobflow.scripts.review.review_directive") as mock_review:
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
         mock_review.return_value = mock_result
 
         with patch("sys.argv", ["review.py", "job_discovery", "--auto-approve"]):
@@ -280,3 +280,27 @@ def test_review_cli_complete_plan_output():
 
                 assert len(plan["steps"]) == 3
                 assert len(plan["assumptions"]) == 2
+
+
+def test_review_cli_compact_output():
+    """Test that --compact prints single-line JSON."""
+    mock_result = {
+        "directive_name": "job_discovery",
+        "approved": False,
+        "reason": "Test reason",
+        "plan": {"pipeline_name": "test", "steps": [], "risks": [], "assumptions": []}
+    }
+
+    with patch("jobflow.app.core.plan_review_runner.review_directive") as mock_review:
+        mock_review.return_value = mock_result
+
+        with patch("sys.argv", ["review.py", "job_discovery", "--compact"]):
+            with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+                exit_code = main()
+
+                stdout_value = mock_stdout.getvalue()
+
+    assert exit_code == 0
+    assert stdout_value.count("\n") == 1
+    assert stdout_value.endswith("\n")
+    assert json.loads(stdout_value) == mock_result
@@ -12,12 +12,23 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 
+class FakeHttpError(Exception):
+    """Stand-in for googleapiclient.errors.HttpError."""
+
+    def __init__(self, status, content=b""):
+        super().__init__(f"HTTP {status}")
+        self.resp = Mock(status=status)
+        self.content = content
+
+
 # Mock google modules before any imports
 def mock_google_modules():
     """Mock google-api-python-client modules."""
     mock_service_account = MagicMock()
     mock_discovery = MagicMock()
     mock_http = MagicMock()
+    mock_errors = MagicMock()
+    mock_errors.HttpError = FakeHttpError
 
     sys.modules["google"] = MagicMock()
     sys.modules["google.oauth2"] = MagicMock()
@@ -25,6 +36,7 @@ def mock_google_modules():
     sys.modules["googleapiclient"] = MagicMock()
     sys.modules["googleapiclient.discovery"] = mock_discovery
     sys.modules["googleapiclient.http"] = mock_http
+    sys.modules["googleapiclient.errors"] = mock_errors
 
     return mock_service_account, mock_discovery, mock_http
 
@@ -151,3 +163,217 @@ def test_drive_client_download_file(monkeypatch, tmp_path):
     # Verify file was created (parent dir)
     assert dest_path.parent.exists()
     assert dest_path.exists()
+
+
+def test_drive_client_download_file_chunk_size(monkeypatch, tmp_path):
+    """Test download_file requests large chunks from MediaIoBaseDownload."""
+    creds_file = tmp_path / "creds.json"
+    creds_file.write_text('{"type": "service_account"}')
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", str(creds_file))
+
+    _mock_disco.build.return_value = Mock()
+    _mock_http.MediaIoBaseDownload.reset_mock()
+    _mock_http.MediaIoBaseDownload.return_value.next_chunk.side_effect = [(None, True)]
+
+    from jobflow.app.services.drive_client import DriveClient
+
+    client = DriveClient()
+    client.download_file("file_id_123", str(tmp_path / "file.txt"))
+
+    _, kwargs = _mock_http.MediaIoBaseDownload.call_args
+    assert kwargs["chunksize"] == DriveClient.DOWNLOAD_CHUNK_SIZE == 8 * 1024 * 1024
+
+
+def test_drive_client_download_files(monkeypatch, tmp_path):
+    """Test download_files downloads every (file_id, dest) pair."""
+    creds_file = tmp_path / "creds.json"
+    creds_file.write_text('{"type": "service_account"}')
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", str(creds_file))
+
+    mock_service = Mock()
+    _mock_disco.build.return_value = mock_service
+    _mock_http.MediaIoBaseDownload.return_value.next_chunk.side_effect = None
+    _mock_http.MediaIoBaseDownload.return_value.next_chunk.return_value = (None, True)
+
+    from jobflow.app.services.drive_client import DriveClient
+
+    client = DriveClient()
+    pairs = [(f"id_{i}", str(tmp_path / "out" / f"file_{i}.txt")) for i in range(5)]
+    client.download_files(pairs, workers=3)
+
+    for _, dest in pairs:
+        assert Path(dest).exists()
+    requested = {
+        call.kwargs["fileId"] for call in mock_service.files.return_value.get_media.call_args_list
+    }
+    assert requested == {f"id_{i}" for i in range(5)}
+
+
+def test_drive_client_download_files_raises_first_error(monkeypatch, tmp_path):
+    """Test download_files re-raises a failed download."""
+    creds_file = tmp_path / "creds.json"
+    creds_file.write_text('{"type": "service_account"}')
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", str(creds_file))
+
+    _mock_disco.build.return_value = Mock()
+
+    from jobflow.app.services.drive_client import DriveClient
+
+    client = DriveClient()
+
+    def fake_download(file_id, dest_path):
+        if file_id == "bad":
+            raise RuntimeError("download failed")
+
+    monkeypatch.setattr(client, "download_file", fake_download)
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        client.download_files([("ok", "a"), ("bad", "b"), ("ok2", "c")])
+
+
+def test_drive_client_list_children_batch(monkeypatch, tmp_path):
+    """Test list_children_batch combines parents per query and groups results."""
+    creds_file = tmp_path / "creds.json"
+    creds_file.write_text('{"type": "service_account"}')
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", str(creds_file))
+
+    mock_service = Mock()
+    _mock_disco.build.return_value = mock_service
+    mock_files = mock_service.files.return_value
+    mock_files.list.return_value.execute.side_effect = [
+        {
+            "files": [
+                {"id": "b", "name": "resume.docx", "mimeType": "x", "parents": ["f1"]},
+                {"id": "a", "name": "app.xlsx", "mimeType": "x", "parents": ["f1"]},
+            ],
+            "nextPageToken": "page2",
+        },
+        {"files": [{"id": "c", "name": "cv.txt", "mimeType": "x", "parents": ["f2"]}]},
+        {"files": [{"id": "d", "name": "last.md", "mimeType": "x", "parents": ["f60"]}]},
+    ]
+
+    from jobflow.app.services.drive_client import DriveClient
+
+    client = DriveClient()
+    folder_ids = [f"f{i}" for i in range(1, 61)]
+    result = client.list_children_batch(folder_ids, workers=1)
+
+    # 60 folders -> two batches of 50 and 10; the first batch has two pages
+    queries = [call.kwargs["q"] for call in mock_files.list.call_args_list]
+    assert len(queries) == 3
+    assert queries[0] == queries[1]
+    assert queries[0].count(" in parents") == 50
+    assert queries[2].count(" in parents") == 10
+    assert mock_files.list.call_args_list[1].kwargs["pageToken"] == "page2"
+
+    assert list(result) == folder_ids
+    assert [f["name"] for f in result["f1"]] == ["app.xlsx", "resume.docx"]
+    assert result["f2"] == [{"id": "c", "name": "cv.txt", "mimeType": "x"}]
+    assert result["f60"][0]["id"] == "d"
+    assert result["f3"] == []
+
+
+def test_drive_client_list_children_batch_concurrent(monkeypatch, tmp_path):
+    """Test batches listed on worker threads are merged back by parent."""
+    creds_file = tmp_path / "creds.json"
+    creds_file.write_text('{"type": "service_account"}')
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", str(creds_file))
+
+    def fake_list(q, **kwargs):
+        # Return one child for the first folder named in each batch query
+        first_parent = q.split("'")[1]
+        request = Mock()
+        request.execute.return_value = {
+            "files": [{"id": f"child_{first_parent}", "name": "resume.txt",
+                       "mimeType": "x", "parents": [first_parent]}]
+        }
+        return request
+
+    mock_service = Mock()
+    mock_service.files.return_value.list.side_effect = fake_list
+    _mock_disco.build.return_value = mock_service
+
+    from jobflow.app.services.drive_client import DriveClient
+
+    client = DriveClient()
+    folder_ids = [f"f{i}" for i in range(120)]
+    result = client.list_children_batch(folder_ids, workers=3)
+
+    # 120 folders -> three batches starting at f0, f50, f100
+    assert mock_service.files.return_value.list.call_count == 3
+    assert list(result) == folder_ids
+    for folder_id in ("f0", "f50", "f100"):
+        assert result[folder_id] == [
+            {"id": f"child_{folder_id}", "name": "resume.txt", "mimeType": "x"}
+        ]
+    assert result["f1"] == []
+
+
+def _client_with_failing_download(monkeypatch, tmp_path, errors):
+    """Build a DriveClient whose _download_once raises errors in order."""
+    creds_file = tmp_path / "creds.json"
+    creds_file.write_text('{"type": "service_account"}')
+    monkeypatch.setenv("GOOGLE_APPLICATION_CREDENTIALS", str(creds_file))
+    _mock_disco.build.return_value = Mock()
+
+    from jobflow.app.services import drive_client as drive_client_module
+    from jobflow.app.services.drive_client import DriveClient
+
+    sleeps = []
+    monkeypatch.setattr(drive_client_module.time, "sleep", sleeps.append)
+
+    client = DriveClient()
+    attempts = []
+
+    def fake_download_once(file_id, dest_path):
+        attempts.append(file_id)
+        if errors:
+            raise errors.pop(0)
+
+    monkeypatch.setattr(client, "_download_once", fake_download_once)
+    return client, attempts, sleeps
+
+
+def test_drive_client_download_file_retries_transient_errors(monkeypatch, tmp_path):
+    """Test 429/5xx and rate-limit 403 errors are retried with backoff."""
+    client, attempts, sleeps = _client_with_failing_download(monkeypatch, tmp_path, [
+        FakeHttpError(429),
+        FakeHttpError(403, b'{"reason": "userRateLimitExceeded"}'),
+        FakeHttpError(503),
+    ])
+
+    client.download_file("id_1", str(tmp_path / "out.txt"))
+
+    assert attempts == ["id_1"] * 4
+    assert len(sleeps) == 3
+    assert all(0 <= delay <= client.RETRY_MAX_DELAY for delay in sleeps)
+    assert len(client.retry_warnings) == 3
+    assert "HTTP 429" in client.retry_warnings[0]
+
+
+def test_drive_client_download_file_does_not_retry_permanent_errors(monkeypatch, tmp_path):
+    """Test a plain 403/404 fails immediately."""
+    client, attempts, sleeps = _client_with_failing_download(monkeypatch, tmp_path, [
+        FakeHttpError(403, b'{"reason": "forbidden"}'),
+    ])
+
+    with pytest.raises(FakeHttpError):
+        client.download_file("id_1", str(tmp_path / "out.txt"))
+
+    assert attempts == ["id_1"]
+    assert sleeps == []
+
+
+def test_drive_client_download_file_gives_up_after_max_attempts(monkeypatch, tmp_path):
+    """Test retries stop after RETRY_ATTEMPTS tries."""
+    from jobflow.app.services.drive_client import DriveClient
+
+    client, attempts, sleeps = _client_with_failing_download(
+        monkeypatch, tmp_path, [FakeHttpError(500) for _ in range(DriveClient.RETRY_ATTEMPTS)]
+    )
+
+    with pytest.raises(FakeHttpError):
+        client.download_file("id_1", str(tmp_path / "out.txt"))
+
+    assert len(attempts) == DriveClient.RETRY_ATTEMPTS
+    assert len(sleeps) == DriveClient.RETRY_ATTEMPTS - 1
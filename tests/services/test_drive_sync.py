@@ -4,6 +4,8 @@ Unit tests for drive_sync.py
 Tests candidate folder synchronization with FakeDriveClient stub.
 """
 
+import hashlib
+import os
 from pathlib import Path
 
 import pytest
@@ -31,7 +33,11 @@ class FakeDriveClient:
         children = self.folder_structure.get(folder_id, [])
         # Return copy without content field
         result = [
-            {"id": child["id"], "name": child["name"], "mimeType": child["mimeType"]}
+            {
+                key: child[key]
+                for key in ("id", "name", "mimeType", "size", "md5Checksum")
+                if key in child
+            }
             for child in children
         ]
         result.sort(key=lambda x: x["name"])
@@ -363,3 +369,326 @@ def test_sync_candidate_folders_details_structure(tmp_path):
     assert file_detail["name"] == "resume.txt"
     assert "path" in file_detail
     assert file_detail["type"] == "resume"
+
+
+class FakeBatchDriveClient(FakeDriveClient):
+    """Fake Drive client that also supports batched folder listing."""
+
+    def __init__(self, folder_structure: dict):
+        super().__init__(folder_structure)
+        self.list_calls = []
+        self.batch_calls = []
+
+    def list_children(self, folder_id: str) -> list[dict]:
+        self.list_calls.append(folder_id)
+        return super().list_children(folder_id)
+
+    def list_children_batch(self, folder_ids: list[str]) -> dict[str, list[dict]]:
+        self.batch_calls.append(list(folder_ids))
+        return {
+            folder_id: FakeDriveClient.list_children(self, folder_id)
+            for folder_id in folder_ids
+        }
+
+
+def test_sync_candidate_folders_uses_batch_listing(tmp_path):
+    """Test candidate folders are listed with one batched call when supported."""
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    folder_structure = {
+        "root": [
+            {"id": "folder1", "name": "Candidate A", "mimeType": "application/vnd.google-apps.folder"},
+            {"id": "folder2", "name": "Candidate B", "mimeType": "application/vnd.google-apps.folder"},
+        ],
+        "folder1": [{"id": "file1", "name": "resume.txt", "mimeType": "text/plain"}],
+        "folder2": [{"id": "file2", "name": "resume.md", "mimeType": "text/markdown"}],
+    }
+
+    fake_client = FakeBatchDriveClient(folder_structure)
+
+    result = sync_candidate_folders(
+        drive_client=fake_client,
+        root_folder_id="root",
+        staging_dir=str(tmp_path / "staging"),
+        dry_run=False,
+    )
+
+    assert fake_client.list_calls == ["root"]
+    assert fake_client.batch_calls == [["folder1", "folder2"]]
+    assert result["downloaded"] == 2
+    assert (tmp_path / "staging" / "candidate_b" / "resume.md").exists()
+
+
+def test_sync_candidate_folders_downloads_concurrently(tmp_path, monkeypatch):
+    """Test downloads overlap across candidates."""
+    import threading
+
+    from jobflow.app.services.drive_sync import DRIVE_WORKERS_ENV, sync_candidate_folders
+
+    monkeypatch.setenv(DRIVE_WORKERS_ENV, "4")
+    folder_structure = {
+        "root": [
+            {"id": "folder1", "name": "Candidate A", "mimeType": "application/vnd.google-apps.folder"},
+            {"id": "folder2", "name": "Candidate B", "mimeType": "application/vnd.google-apps.folder"},
+        ],
+        "folder1": [{"id": "file1", "name": "resume.txt", "mimeType": "text/plain"}],
+        "folder2": [{"id": "file2", "name": "resume.txt", "mimeType": "text/plain"}],
+    }
+    fake_client = FakeDriveClient(folder_structure)
+
+    # Each download waits for the other one: only passes if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+    original_download = fake_client.download_file
+
+    def download_file(file_id, dest_path):
+        barrier.wait()
+        original_download(file_id, dest_path)
+
+    fake_client.download_file = download_file
+
+    result = sync_candidate_folders(
+        drive_client=fake_client,
+        root_folder_id="root",
+        staging_dir=str(tmp_path / "staging"),
+    )
+
+    assert result["downloaded"] == 2
+    assert (tmp_path / "staging" / "candidate_a" / "resume.txt").exists()
+    assert (tmp_path / "staging" / "candidate_b" / "resume.txt").exists()
+
+
+def test_sync_candidate_folders_download_error_propagates(tmp_path):
+    """Test a failed download is re-raised."""
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    folder_structure = {
+        "root": [
+            {"id": "folder1", "name": "Candidate A", "mimeType": "application/vnd.google-apps.folder"},
+        ],
+        "folder1": [
+            {"id": "file1", "name": "resume.txt", "mimeType": "text/plain"},
+            {"id": "file2", "name": "app.xlsx", "mimeType": "application/octet-stream"},
+        ],
+    }
+    fake_client = FakeDriveClient(folder_structure)
+    original_download = fake_client.download_file
+
+    def download_file(file_id, dest_path):
+        if file_id == "file2":
+            raise ValueError(f"File not found: {file_id}")
+        original_download(file_id, dest_path)
+
+    fake_client.download_file = download_file
+
+    with pytest.raises(ValueError, match="File not found: file2"):
+        sync_candidate_folders(
+            drive_client=fake_client,
+            root_folder_id="root",
+            staging_dir=str(tmp_path / "staging"),
+        )
+
+
+def test_iter_candidates_yields_in_folder_order(tmp_path):
+    """Test iter_candidates yields the same details as sync_candidate_folders."""
+    from jobflow.app.services.drive_sync import iter_candidates, sync_candidate_folders
+
+    folder_structure = {
+        "root": [
+            {"id": "folder2", "name": "Candidate B", "mimeType": "application/vnd.google-apps.folder"},
+            {"id": "folder1", "name": "Candidate A", "mimeType": "application/vnd.google-apps.folder"},
+        ],
+        "folder1": [
+            {"id": "file1", "name": "resume.txt", "mimeType": "text/plain"},
+            {"id": "file3", "name": "old.doc", "mimeType": "application/msword"},
+        ],
+        "folder2": [{"id": "file2", "name": "application.xlsx", "mimeType": "application/octet-stream"}],
+    }
+
+    warnings = []
+    streamed = list(iter_candidates(
+        FakeDriveClient(folder_structure), "root", str(tmp_path / "a"), warnings=warnings
+    ))
+    result = sync_candidate_folders(FakeDriveClient(folder_structure), "root", str(tmp_path / "a"))
+
+    assert [c["name"] for c in streamed] == ["Candidate A", "Candidate B"]
+    assert [c["files_downloaded"] for c in streamed] == [1, 1]
+    assert (tmp_path / "a" / "candidate_b" / "application.xlsx").exists()
+    assert len(warnings) == 1 and "old.doc" in warnings[0]
+    assert result["candidates"] == streamed
+    assert result["warnings"] == warnings
+
+
+def test_sync_skips_already_staged_files(tmp_path):
+    """Test files whose size and MD5 match the staged copy are not re-downloaded."""
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    resume = b"resume content"
+    app = b"application content"
+    folder_structure = {
+        "root": [{"id": "folder1", "name": "Alice", "mimeType": "application/vnd.google-apps.folder"}],
+        "folder1": [
+            {"id": "file1", "name": "application.xlsx", "mimeType": "application/octet-stream",
+             "content": app, "size": str(len(app)), "md5Checksum": hashlib.md5(app).hexdigest()},
+            {"id": "file2", "name": "resume.txt", "mimeType": "text/plain",
+             "content": resume, "size": str(len(resume))},
+        ],
+    }
+    client = FakeDriveClient(folder_structure)
+    staging = tmp_path / "staging"
+
+    first = sync_candidate_folders(client, "root", str(staging))
+    assert first["downloaded"] == 2
+    assert first["skipped"] == 0
+
+    calls = []
+    original_download = client.download_file
+    client.download_file = lambda file_id, dest: (calls.append(file_id), original_download(file_id, dest))
+
+    second = sync_candidate_folders(client, "root", str(staging))
+
+    assert calls == []
+    assert second["downloaded"] == 0
+    assert second["skipped"] == 2
+    files = second["candidates"][0]["files"]
+    assert [f["name"] for f in files] == ["application.xlsx", "resume.txt"]
+    assert all(f["cached"] for f in files)
+
+
+def test_sync_redownloads_changed_files(tmp_path):
+    """Test a staged file with matching size but different MD5 is downloaded again."""
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    content = b"new resume"
+    folder_structure = {
+        "root": [{"id": "folder1", "name": "Alice", "mimeType": "application/vnd.google-apps.folder"}],
+        "folder1": [
+            {"id": "file1", "name": "resume.docx", "mimeType": "application/octet-stream",
+             "content": content, "size": str(len(content)), "md5Checksum": hashlib.md5(content).hexdigest()},
+        ],
+    }
+    staged = tmp_path / "staging" / "alice" / "resume.docx"
+    staged.parent.mkdir(parents=True)
+    staged.write_bytes(b"old resume")  # Same length, different bytes
+
+    result = sync_candidate_folders(FakeDriveClient(folder_structure), "root", str(tmp_path / "staging"))
+
+    assert result["downloaded"] == 1
+    assert result["skipped"] == 0
+    assert "cached" not in result["candidates"][0]["files"][0]
+    assert staged.read_bytes() == content
+
+
+def test_sync_downloads_shared_content_once(tmp_path):
+    """Test files with the same md5Checksum are downloaded once and linked."""
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    packet = b"company reference packet"
+    packet_md5 = hashlib.md5(packet).hexdigest()
+    shared = {"mimeType": "text/plain", "content": packet,
+              "size": str(len(packet)), "md5Checksum": packet_md5}
+    folder_structure = {
+        "root": [
+            {"id": "folder1", "name": "Alice", "mimeType": "application/vnd.google-apps.folder"},
+            {"id": "folder2", "name": "Bob", "mimeType": "application/vnd.google-apps.folder"},
+        ],
+        "folder1": [{"id": "file1", "name": "packet.txt", **shared}],
+        "folder2": [
+            {"id": "file2", "name": "packet.txt", **shared},
+            {"id": "file3", "name": "resume.md", "mimeType": "text/plain", "content": b"Bob"},
+        ],
+    }
+    client = FakeDriveClient(folder_structure)
+    calls = []
+    original_download = client.download_file
+    client.download_file = lambda file_id, dest: (calls.append(file_id), original_download(file_id, dest))
+
+    staging = tmp_path / "staging"
+    result = sync_candidate_folders(client, "root", str(staging))
+
+    assert sorted(calls) == ["file1", "file3"]
+    assert result["downloaded"] == 3
+    alice_copy = staging / "alice" / "packet.txt"
+    bob_copy = staging / "bob" / "packet.txt"
+    assert alice_copy.read_bytes() == bob_copy.read_bytes() == packet
+    assert (staging / ".cas" / packet_md5).exists()
+    assert not list(staging.rglob("*.tmp"))
+
+
+def _stale_linked_blob(tmp_path, content):
+    """Stage a corrupt .cas blob hard-linked into an earlier candidate folder."""
+    staging = tmp_path / "staging"
+    blob = staging / ".cas" / hashlib.md5(content).hexdigest()
+    blob.parent.mkdir(parents=True)
+    blob.write_bytes(b"stale bytes")
+    earlier_copy = staging / "carol" / "packet.txt"
+    earlier_copy.parent.mkdir()
+    os.link(blob, earlier_copy)
+    folder_structure = {
+        "root": [{"id": "folder1", "name": "Alice", "mimeType": "application/vnd.google-apps.folder"}],
+        "folder1": [
+            {"id": "file1", "name": "packet.txt", "mimeType": "text/plain", "content": content,
+             "size": str(len(content)), "md5Checksum": hashlib.md5(content).hexdigest()},
+        ],
+    }
+    return staging, blob, earlier_copy, FakeDriveClient(folder_structure)
+
+
+def test_sync_refreshes_stale_blob_without_touching_links(tmp_path):
+    """Test a stale .cas blob is replaced, not rewritten through its links."""
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    content = b"refreshed packet"
+    staging, blob, earlier_copy, client = _stale_linked_blob(tmp_path, content)
+
+    sync_candidate_folders(client, "root", str(staging))
+
+    assert blob.read_bytes() == content
+    assert (staging / "alice" / "packet.txt").read_bytes() == content
+    assert earlier_copy.read_bytes() == b"stale bytes"
+    assert not list(staging.rglob("*.tmp"))
+
+
+def test_sync_failed_blob_refresh_keeps_links_intact(tmp_path):
+    """Test a failed .cas refresh leaves linked files and the old blob alone."""
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    staging, blob, earlier_copy, client = _stale_linked_blob(tmp_path, b"refreshed packet")
+
+    def failing_download(file_id, dest_path):
+        Path(dest_path).write_bytes(b"partial")
+        raise RuntimeError("download failed")
+
+    client.download_file = failing_download
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        sync_candidate_folders(client, "root", str(staging))
+
+    assert earlier_copy.read_bytes() == b"stale bytes"
+    assert blob.read_bytes() == b"stale bytes"
+    assert not list(staging.rglob("*.tmp"))
+
+
+def test_sync_collects_client_retry_warnings(tmp_path):
+    """Test retry messages recorded by the client end up in warnings."""
+    from collections import deque
+
+    from jobflow.app.services.drive_sync import sync_candidate_folders
+
+    folder_structure = {
+        "root": [{"id": "folder1", "name": "Alice", "mimeType": "application/vnd.google-apps.folder"}],
+        "folder1": [{"id": "file1", "name": "resume.txt", "mimeType": "text/plain"}],
+    }
+    client = FakeDriveClient(folder_structure)
+    client.retry_warnings = deque()
+    original_download = client.download_file
+
+    def flaky_download(file_id, dest_path):
+        client.retry_warnings.append(f"Retrying download of {file_id} after HTTP 429 (attempt 1/5)")
+        original_download(file_id, dest_path)
+
+    client.download_file = flaky_download
+
+    result = sync_candidate_folders(client, "root", str(tmp_path / "staging"))
+
+    assert result["warnings"] == ["Retrying download of file1 after HTTP 429 (attempt 1/5)"]
+    assert not client.retry_warnings
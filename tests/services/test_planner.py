@@ -9,6 +9,7 @@ import os
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pytest
 
 from jobflow.app.services.planner import build_plan
@@ -62,11 +63,14 @@ def test_build_plan_success(mock_env_with_api_key, mock_openai_response):
         assert mock_client.chat.completions.create.called
 
         # Verify API key was used
-        mock_openai_class.assert_called_once_with(api_key="test-api-key-12345")
+        mock_openai_class.assert_called_once()
+        assert mock_openai_class.call_args.kwargs["api_key"] == "test-api-key-12345"
+        assert isinstance(mock_openai_class.call_args.kwargs["http_client"], httpx.Client)
 
-        # Verify model parameter
+        # Verify model parameter and JSON mode
         call_args = mock_client.chat.completions.create.call_args
         assert call_args.kwargs["model"] == "gpt-4o"
+        assert call_args.kwargs["response_format"] == {"type": "json_object"}
 
         # Verify result structure
         assert isinstance(result, dict)
@@ -145,6 +149,21 @@ def test_build_plan_invalid_json_response(mock_env_with_api_key):
         assert "Failed to parse LLM response as JSON" in error_message
 
 
+def test_build_plan_non_object_response(mock_env_with_api_key):
+    """Test that a JSON array response raises RuntimeError."""
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message = Mock()
+        mock_response.choices[0].message.content = '["pipeline_name"]'
+        mock_client.chat.completions.create.return_value = mock_response
+
+        with pytest.raises(RuntimeError, match="not a JSON object"):
+            build_plan("job_discovery")
+
+
 def test_build_plan_missing_required_keys(mock_env_with_api_key):
     """Test that response missing required keys raises RuntimeError."""
     with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
@@ -182,3 +201,148 @@ def test_build_plan_api_error(mock_env_with_api_key):
 
         error_message = str(exc_info.value)
         assert "LLM request failed" in error_message
+
+
+def test_build_plan_reuses_client(mock_env_with_api_key, mock_openai_response):
+    """Test that repeated plans share one OpenAI client per API key."""
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        build_plan("job_discovery")
+        build_plan("job_discovery")
+
+        assert mock_openai_class.call_count == 1
+        assert mock_client.chat.completions.create.call_count == 2
+
+
+def test_get_client_concurrent_first_calls_build_one_client():
+    """Test that threads racing on a cold cache share one httpx/OpenAI client."""
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from jobflow.app.services import planner
+
+    barrier = threading.Barrier(8)
+
+    def slow_http_client(**kwargs):
+        time.sleep(0.01)  # Widen the race window
+        return MagicMock()
+
+    def get_client(_):
+        barrier.wait()
+        return planner._get_client("key-race")
+
+    with patch("jobflow.app.services.planner.httpx.Client", side_effect=slow_http_client) as http_cls, \
+            patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_openai_class.side_effect = lambda **kwargs: MagicMock()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(get_client, range(8)))
+
+    assert http_cls.call_count == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_build_plan_cached_concurrent_inserts_respect_size(monkeypatch, mock_env_with_api_key):
+    """Test concurrent cache misses never grow the plan cache past its limit."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from jobflow.app.services import planner
+
+    monkeypatch.setattr(planner, "PLAN_CACHE_SIZE", 4)
+    contents = {f"d{i}": f"directive {i}" for i in range(32)}
+    monkeypatch.setattr(planner, "_load_directive", contents.__getitem__)
+    monkeypatch.setattr(
+        planner,
+        "_plan_from_directive_disk_cached",
+        lambda content, api_key: {"pipeline_name": content, "steps": [], "risks": [], "assumptions": []},
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        plans = list(executor.map(planner.build_plan_cached, contents))
+
+    assert [plan["pipeline_name"] for plan in plans] == list(contents.values())
+    assert len(planner._plan_cache) == 4
+
+
+def test_build_plan_new_client_for_new_key(monkeypatch, mock_openai_response):
+    """Test that rotating OPENAI_API_KEY builds a fresh client."""
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        monkeypatch.setenv("OPENAI_API_KEY", "key-one")
+        build_plan("job_discovery")
+        monkeypatch.setenv("OPENAI_API_KEY", "key-two")
+        build_plan("job_discovery")
+
+        keys = [call.kwargs["api_key"] for call in mock_openai_class.call_args_list]
+        assert keys == ["key-one", "key-two"]
+
+
+def test_build_plan_disk_cache_hit(monkeypatch, tmp_path, mock_env_with_api_key, mock_openai_response):
+    """Test that an unchanged directive is served from the on-disk cache."""
+    monkeypatch.delenv("JOBFLOW_PLANNER_NOCACHE", raising=False)
+    monkeypatch.setenv("JOBFLOW_PLANNER_CACHE_DIR", str(tmp_path))
+
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        first = build_plan("job_discovery")
+        second = build_plan("job_discovery")
+
+        assert first == second
+        assert mock_client.chat.completions.create.call_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_default_disk_cache_dir_is_under_project_root():
+    """Test the default plan cache does not depend on the current directory."""
+    from jobflow.app.services.planner import DEFAULT_PLANNER_CACHE_DIR
+
+    project_root = Path(__file__).resolve().parents[2]
+    assert DEFAULT_PLANNER_CACHE_DIR == project_root / ".cache" / "planner"
+
+
+def test_build_plan_disk_cache_ignores_corrupt_entry(monkeypatch, tmp_path, mock_env_with_api_key, mock_openai_response):
+    """Test that an unreadable cache entry falls back to the LLM and is rewritten."""
+    monkeypatch.delenv("JOBFLOW_PLANNER_NOCACHE", raising=False)
+    monkeypatch.setenv("JOBFLOW_PLANNER_CACHE_DIR", str(tmp_path))
+
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        build_plan("job_discovery")
+        (cache_file,) = tmp_path.glob("*.json")
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        result = build_plan("job_discovery")
+
+        assert result["pipeline_name"] == "job_discovery"
+        assert mock_client.chat.completions.create.call_count == 2
+        assert json.loads(cache_file.read_text(encoding="utf-8")) == result
+
+
+def test_build_plan_nocache_opt_out(monkeypatch, tmp_path, mock_env_with_api_key, mock_openai_response):
+    """Test that JOBFLOW_PLANNER_NOCACHE=1 bypasses the on-disk cache."""
+    monkeypatch.setenv("JOBFLOW_PLANNER_NOCACHE", "1")
+    monkeypatch.setenv("JOBFLOW_PLANNER_CACHE_DIR", str(tmp_path))
+
+    with patch("jobflow.app.services.planner.OpenAI") as mock_openai_class:
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        build_plan("job_discovery")
+        build_plan("job_discovery")
+
+        assert mock_client.chat.completions.create.call_count == 2
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,79 @@
+"""
+Unit tests for redis_client.py
+
+Tests RedisClient connection handling with a stubbed redis module.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from jobflow.app.tasks import redis_client
+from jobflow.app.tasks.redis_client import RedisClient, get_redis_client
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Install a stub redis module and reset the global client."""
+    module = MagicMock()
+    monkeypatch.setitem(sys.modules, "redis", module)
+    monkeypatch.setattr(redis_client, "_redis_client", None)
+    return module
+
+
+def test_connect_builds_pooled_client(fake_redis):
+    """Test connect() creates one client and keeps its pool."""
+    client = RedisClient()
+
+    client.connect("redis://localhost:6379/0")
+
+    fake_redis.Redis.from_url.assert_called_once()
+    args, kwargs = fake_redis.Redis.from_url.call_args
+    assert args == ("redis://localhost:6379/0",)
+    assert kwargs["socket_keepalive"] is True
+    assert kwargs["retry_on_timeout"] is True
+    assert client.is_connected
+    assert client.client is fake_redis.Redis.from_url.return_value
+
+
+def test_disconnect_releases_pool(fake_redis):
+    """Test disconnect() closes pooled connections."""
+    client = RedisClient()
+    client.connect("redis://localhost:6379/0")
+    pool = fake_redis.Redis.from_url.return_value.connection_pool
+
+    client.disconnect()
+
+    pool.disconnect.assert_called_once()
+    assert not client.is_connected
+    with pytest.raises(RuntimeError, match="not connected"):
+        client.client
+
+
+def test_connect_missing_redis(monkeypatch):
+    """Test connect() raises ImportError with an install hint."""
+    monkeypatch.setitem(sys.modules, "redis", None)
+
+    with pytest.raises(ImportError, match="redis\\[hiredis\\]"):
+        RedisClient().connect("redis://localhost:6379/0")
+
+
+def test_get_redis_client_auto_connects(fake_redis, monkeypatch):
+    """Test the singleton connects from REDIS_URL on first access."""
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/1")
+
+    first = get_redis_client()
+    second = get_redis_client()
+
+    assert first is second
+    assert first.is_connected
+    fake_redis.Redis.from_url.assert_called_once()
+
+
+def test_get_redis_client_without_url(fake_redis, monkeypatch):
+    """Test the singleton stays unconnected when REDIS_URL is unset."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    assert not get_redis_client().is_connected
+    fake_redis.Redis.from_url.assert_not_called()
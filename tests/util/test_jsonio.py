@@ -0,0 +1,231 @@
+"""
+Unit tests for jsonio.py
+
+Tests JSON serialization helpers against the stdlib json module.
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from jobflow.app.util import jsonio
+from jobflow.app.util.jsonio import dumps, loads, read_json_file, write_json, write_json_file
+
+
+SAMPLE = {"b": [1, 2.5, None, True], "a": {"z": "café", "y": {}}, "c": []}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_stdlib_layout(use_orjson):
+    """Test dumps output matches json.dumps(indent=2, sort_keys=True)."""
+    expected = json.dumps(SAMPLE, indent=2, sort_keys=True, ensure_ascii=False)
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+        result = dumps(SAMPLE)
+    else:
+        with patch.object(jsonio, "orjson", None):
+            result = dumps(SAMPLE)
+
+    assert isinstance(result, bytes)
+    assert result.decode("utf-8") == expected
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_compact_unsorted(use_orjson):
+    """Test dumps without indent or sorting round-trips."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+        result = dumps(SAMPLE, sort=False, indent=False)
+    else:
+        with patch.object(jsonio, "orjson", None):
+            result = dumps(SAMPLE, sort=False, indent=False)
+
+    assert b"\n" not in result
+    assert json.loads(result) == SAMPLE
+    assert result.decode("utf-8") == json.dumps(
+        SAMPLE, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_appends_newline(use_orjson):
+    """Test newline=True adds exactly one trailing newline."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+        result = dumps(SAMPLE, newline=True)
+    else:
+        with patch.object(jsonio, "orjson", None):
+            result = dumps(SAMPLE, newline=True)
+
+    assert result == dumps(SAMPLE) + b"\n"
+
+
+def test_dumps_falls_back_for_big_integers():
+    """Test values orjson rejects are still serialized."""
+    assert json.loads(dumps({"n": 2**70})) == {"n": 2**70}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_accepts_bytes_and_str(use_orjson):
+    """Test loads parses both input types and raises JSONDecodeError."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+        assert loads(dumps(SAMPLE)) == SAMPLE
+        assert loads('{"a": 1}') == {"a": 1}
+        with pytest.raises(json.JSONDecodeError):
+            loads("not json")
+    else:
+        with patch.object(jsonio, "orjson", None):
+            assert loads(dumps(SAMPLE)) == SAMPLE
+            assert loads('{"a": 1}') == {"a": 1}
+            with pytest.raises(json.JSONDecodeError):
+                loads("not json")
+
+
+def test_write_json_text_stream():
+    """Test write_json works on streams without a byte buffer."""
+    stream = io.StringIO()
+
+    write_json({"ok": True}, stream)
+
+    assert stream.getvalue() == '{\n  "ok": true\n}\n'
+
+
+def test_write_json_preserves_order_with_buffer():
+    """Test pending text is flushed before bytes are written."""
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+
+    stream.write("before\n")
+    write_json({"ok": True}, stream)
+
+    assert raw.getvalue() == b'before\n{\n  "ok": true\n}\n'
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_escapes_non_ascii_like_json_dumps(use_orjson):
+    """Test CLI output stays ASCII-escaped whatever the stream encoding."""
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="latin-1")
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+        write_json(SAMPLE, stream)
+    else:
+        with patch.object(jsonio, "orjson", None):
+            write_json(SAMPLE, stream)
+
+    expected = json.dumps(SAMPLE, indent=2, sort_keys=True) + "\n"
+    assert raw.getvalue() == expected.encode("ascii")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_writes_non_finite_floats_as_null(use_orjson):
+    """Test both backends write NaN and Infinity as null."""
+    obj = {"nan": float("nan"), "inf": [float("inf"), (-float("inf"), 1.5)]}
+    expected = b'{"inf":[null,[null,1.5]],"nan":null}'
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+        assert dumps(obj, indent=False) == expected
+    else:
+        with patch.object(jsonio, "orjson", None):
+            assert dumps(obj, indent=False) == expected
+            # Values produced by a default hook are cleaned up too
+            default = lambda o: {"score": float("nan")}
+            assert dumps(object(), indent=False, default=default) == b'{"score":null}'
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_write_json_file_reports_bytes(tmp_path, compress):
+    """Test write_json_file round-trips and returns the on-disk size."""
+    import gzip
+
+    path = tmp_path / ("out.json.gz" if compress else "out.json")
+
+    written = write_json_file(SAMPLE, path, compress=compress)
+
+    assert written == path.stat().st_size
+    raw = gzip.decompress(path.read_bytes()) if compress else path.read_bytes()
+    assert raw == dumps(SAMPLE) + b"\n"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_file_ensure_ascii(tmp_path, use_orjson):
+    """Test ensure_ascii matches json.dump(indent=2, sort_keys=True) bytes."""
+    path = tmp_path / "out.json"
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+        write_json_file(SAMPLE, path, ensure_ascii=True)
+    else:
+        with patch.object(jsonio, "orjson", None):
+            write_json_file(SAMPLE, path, ensure_ascii=True)
+
+    expected = json.dumps(SAMPLE, indent=2, sort_keys=True) + "\n"
+    assert path.read_bytes() == expected.encode("ascii")
+
+
+def test_read_json_file_round_trip(tmp_path):
+    """Test read_json_file parses what write_json_file wrote."""
+    path = tmp_path / "data.json"
+    write_json_file(SAMPLE, path)
+
+    assert read_json_file(path) == SAMPLE
+
+    path.write_bytes(b"{ invalid json }")
+    with pytest.raises(json.JSONDecodeError):
+        read_json_file(path)
+
+
+def test_read_json_file_mmap_path(tmp_path, monkeypatch):
+    """Test files above the mmap threshold parse the same, errors included."""
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(jsonio, "MMAP_MIN_BYTES", 0)
+
+    path = tmp_path / "data.json"
+    write_json_file(SAMPLE, path)
+    assert read_json_file(path) == SAMPLE
+
+    path.write_bytes(b"{ invalid json }")
+    with pytest.raises(json.JSONDecodeError):
+        read_json_file(path)
+
+    # Empty files cannot be mapped and fall back to a plain read
+    path.write_bytes(b"")
+    with pytest.raises(json.JSONDecodeError):
+        read_json_file(path)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_to_dict_default_serializes_models(use_orjson):
+    """Test to_dict_default renders models exactly like their to_dict()."""
+    from jobflow.app.core.job_model import JobPosting
+
+    job = JobPosting(
+        title="Engineer",
+        company="Acme",
+        location="Remote",
+        description="Build things",
+        requirements=["Python"],
+    )
+    expected = dumps({"jobs": [job.to_dict()]})
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+        result = dumps({"jobs": [job]}, default=jsonio.to_dict_default)
+    else:
+        with patch.object(jsonio, "orjson", None):
+            result = dumps({"jobs": [job]}, default=jsonio.to_dict_default)
+
+    assert result == expected
+    assert b'"raw"' not in result
+
+
+def test_to_dict_default_rejects_unknown_objects():
+    """Test to_dict_default raises TypeError for objects without to_dict."""
+    with pytest.raises(TypeError):
+        dumps({"x": object()}, default=jsonio.to_dict_default)